@@ -27,8 +27,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import hashlib
+import os
 import re
+import string
+from bisect import bisect_right
+from collections.abc import Collection
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import accumulate
+from operator import attrgetter
 from typing import Any
 
 from .models import NormalizedComment, NormalizedIssue
@@ -42,6 +51,14 @@ SPAM_PATTERNS = [
     r"^hey\s*$",
 ]
 
+# Single alternation over SPAM_PATTERNS so titles are matched in one regex call
+SPAM_TITLE_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in SPAM_PATTERNS))
+
+# Substrings identifying bot accounts (matched against the lowercased author login)
+BOT_AUTHOR_PATTERNS = ("[bot]", "-bot", "bot-", "dependabot", "renovate")
+# Literal-only alternation so the author login is scanned once instead of per pattern
+BOT_AUTHOR_PATTERN = re.compile("|".join(re.escape(pattern) for pattern in BOT_AUTHOR_PATTERNS))
+
 # Support ticket / question patterns (pre-compiled for performance)
 # Map compiled patterns to user-friendly descriptions
 SUPPORT_KEYWORD_PATTERNS = {
@@ -62,6 +79,10 @@ SUPPORT_KEYWORD_PATTERNS = {
     re.compile(r"\bcan\s+someone\s+(?:help|explain|show)\b", re.IGNORECASE): "help request",
     re.compile(r"\bneed\s+help\b", re.IGNORECASE): "help request keyword",
 }
+# Alternation over SUPPORT_KEYWORD_PATTERNS: one scan rules out the common non-support issue
+SUPPORT_KEYWORD_PATTERN = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in SUPPORT_KEYWORD_PATTERNS), re.IGNORECASE
+)
 
 # Labels that typically indicate support/questions/low-signal issues
 # NOTE: "help wanted" is included here as it often indicates requests for assistance
@@ -89,11 +110,69 @@ NON_ACTIONABLE_LABELS = {
     "stale",
 }
 
+# Below this many issues, process start-up and pickling cost more than parallel
+# normalization saves (serial normalization takes roughly 0.3 ms per issue)
+PARALLEL_NORMALIZE_MIN_ISSUES = 2000
+
+# Reaction types reported by the GitHub API (zero counts are dropped during normalization)
+REACTION_KEYS = ("+1", "-1", "laugh", "hooray", "confused", "heart", "rocket", "eyes")
+
+# Threads up to this many comments are deduplicated on bodies instead of digests
+DEDUP_FINGERPRINT_MIN_COMMENTS = 4
+
+# Appended to any issue body or comment cut by truncate_text
+TRUNCATION_MARKER = "... [truncated]"
+# Smallest max_length that leaves room for two markers plus some content
+MIN_TRUNCATION_LENGTH = len(TRUNCATION_MARKER) * 2 + 10
+
+# Shared read-only fallback for payloads without a reactions object
+_EMPTY_DICT: dict[str, Any] = {}
+
+# Markdown cleaning patterns (pre-compiled for performance)
+_RE_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
+_RE_FENCE_LANG = re.compile(r"```[a-zA-Z]*\n")
+_RE_FENCE = re.compile(r"```")
+_RE_INLINE_CODE = re.compile(r"`([^`]+)`")
+_RE_IMAGE = re.compile(r"!\[([^\]]*)\]\([^\)]+\)")
+_RE_LINK = re.compile(r"\[([^\]]+)\]\([^\)]+\)")
+_RE_HEADER = re.compile(r"^#{1,6}\s+", re.MULTILINE)
+_RE_BOLD_STAR = re.compile(r"\*\*([^\*]+)\*\*")
+_RE_ITALIC_STAR = re.compile(r"\*([^\*]+)\*")
+_RE_BOLD_UNDERSCORE = re.compile(r"__([^_]+)__")
+_RE_ITALIC_UNDERSCORE = re.compile(r"_([^_]+)_")
+_RE_HORIZONTAL_RULE = re.compile(r"^[-*_]{3,}\s*$", re.MULTILINE)
+_RE_BULLET_LIST = re.compile(r"^\s*[-*+]\s+", re.MULTILINE)
+_RE_NUMBERED_LIST = re.compile(r"^\s*\d+\.\s+", re.MULTILINE)
+_RE_BLOCKQUOTE = re.compile(r"^\s*>\s+", re.MULTILINE)
+
+# Prefilters: single-character `in` checks run at memchr speed, far cheaper than
+# a regex search. Every horizontal-rule, bullet or blockquote match contains one
+# of _LINE_MARKER_CHARS; _MARKDOWN_TRIGGER_CHARS adds the literals required by
+# the remaining passes (numbered lists are detected separately).
+_LINE_MARKER_CHARS = "-*_+>"
+_MARKDOWN_TRIGGER_CHARS = "\r<`]#" + _LINE_MARKER_CHARS
+_RE_NUMBERED_HINT = re.compile(r"^\s*\d+\.", re.MULTILINE)
+
+
+def _may_have_numbered_list(text: str) -> bool:
+    """Check for a numbered-list marker, skipping the regex when text has no digits."""
+    return (
+        any(digit in text for digit in string.digits) and _RE_NUMBERED_HINT.search(text) is not None
+    )
+
+
+# Bounded so templated/cross-posted comments are cleaned once without unbounded growth
+CLEAN_MARKDOWN_CACHE_SIZE = 1024
+
 
+@lru_cache(maxsize=CLEAN_MARKDOWN_CACHE_SIZE)
 def clean_markdown(text: str) -> str:
     """
     Clean markdown formatting from text while preserving readability.
 
+    Results are memoized per input string, so repeated bodies (bot messages,
+    templated replies, "bump" comments) skip the regex pipeline.
+
     Args:
         text: Raw markdown text
 
@@ -103,46 +182,71 @@ def clean_markdown(text: str) -> str:
     if not text:
         return ""
 
+    # Plain prose has nothing for any pass to remove
+    if not (
+        any(char in text for char in _MARKDOWN_TRIGGER_CHARS)
+        or "\n\n\n" in text
+        or _may_have_numbered_list(text)
+    ):
+        return text.strip()
+
+    # Each pass below only removes characters, so a pass whose required literal is
+    # absent cannot match; the cheap substring checks skip those regex scans entirely
+
     # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     # Remove HTML comments
-    text = re.sub(r"<!--.*?-->", "", text, flags=re.DOTALL)
+    if "<!--" in text:
+        text = _RE_HTML_COMMENT.sub("", text)
 
-    # Remove code blocks (keep content but remove markers)
-    text = re.sub(r"```[a-zA-Z]*\n", "", text)
-    text = re.sub(r"```", "", text)
+    if "`" in text:
+        # Remove code blocks (keep content but remove markers)
+        text = _RE_FENCE_LANG.sub("", text)
+        text = _RE_FENCE.sub("", text)
 
-    # Remove inline code markers (keep content)
-    text = re.sub(r"`([^`]+)`", r"\1", text)
+        # Remove inline code markers (keep content)
+        text = _RE_INLINE_CODE.sub(r"\1", text)
 
-    # Remove image markdown
-    text = re.sub(r"!\[([^\]]*)\]\([^\)]+\)", r"\1", text)
+    if "](" in text:
+        # Remove image markdown
+        text = _RE_IMAGE.sub(r"\1", text)
 
-    # Convert links to text (keep link text, discard URL)
-    text = re.sub(r"\[([^\]]+)\]\([^\)]+\)", r"\1", text)
+        # Convert links to text (keep link text, discard URL)
+        text = _RE_LINK.sub(r"\1", text)
 
     # Remove markdown headers (keep text)
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
-
-    # Remove bold/italic markers
-    text = re.sub(r"\*\*([^\*]+)\*\*", r"\1", text)
-    text = re.sub(r"\*([^\*]+)\*", r"\1", text)
-    text = re.sub(r"__([^_]+)__", r"\1", text)
-    text = re.sub(r"_([^_]+)_", r"\1", text)
+    if "#" in text:
+        text = _RE_HEADER.sub("", text)
+
+    # Remove bold/italic markers; italic guards are re-checked after bold removal
+    if "**" in text:
+        text = _RE_BOLD_STAR.sub(r"\1", text)
+    if "*" in text:
+        text = _RE_ITALIC_STAR.sub(r"\1", text)
+    if "__" in text:
+        text = _RE_BOLD_UNDERSCORE.sub(r"\1", text)
+    if "_" in text:
+        text = _RE_ITALIC_UNDERSCORE.sub(r"\1", text)
 
     # Remove horizontal rules
-    text = re.sub(r"^[-*_]{3,}\s*$", "", text, flags=re.MULTILINE)
+    if "-" in text or "*" in text or "_" in text:
+        text = _RE_HORIZONTAL_RULE.sub("", text)
 
     # Remove list markers (keep content)
-    text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
-    text = re.sub(r"^\s*\d+\.\s+", "", text, flags=re.MULTILINE)
+    if "-" in text or "*" in text or "+" in text:
+        text = _RE_BULLET_LIST.sub("", text)
+    if _may_have_numbered_list(text):
+        text = _RE_NUMBERED_LIST.sub("", text)
 
     # Remove blockquote markers (keep content)
-    text = re.sub(r"^\s*>\s+", "", text, flags=re.MULTILINE)
+    if ">" in text:
+        text = _RE_BLOCKQUOTE.sub("", text)
 
-    # Collapse multiple blank lines
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    # Collapse multiple blank lines; each replace shortens every run, so this terminates
+    while "\n\n\n" in text:
+        text = text.replace("\n\n\n", "\n\n")
 
     # Trim whitespace
     text = text.strip()
@@ -163,15 +267,28 @@ def deduplicate_comments(comments: list[NormalizedComment]) -> list[NormalizedCo
     if not comments:
         return []
 
-    seen_bodies: set[str] = set()
+    # A single comment has nothing to duplicate; only empty bodies are dropped
+    if len(comments) == 1:
+        return list(comments) if comments[0].body.strip() else []
+
+    # Track 64-bit fingerprints rather than full normalized bodies so memory stays
+    # constant per comment (collision probability ~2^-64 per pair is acceptable here).
+    # Short threads keep the bodies themselves, which skips encoding and digesting.
+    use_fingerprints = len(comments) > DEDUP_FINGERPRINT_MIN_COMMENTS
+    seen_fingerprints: set[str | bytes] = set()
     unique_comments: list[NormalizedComment] = []
 
     for comment in comments:
         # Normalize body for comparison
         normalized_body = comment.body.lower().strip()
-
-        if normalized_body and normalized_body not in seen_bodies:
-            seen_bodies.add(normalized_body)
+        if not normalized_body:
+            continue
+
+        fingerprint: str | bytes = normalized_body
+        if use_fingerprints:
+            fingerprint = hashlib.blake2b(normalized_body.encode("utf-8"), digest_size=8).digest()
+        if fingerprint not in seen_fingerprints:
+            seen_fingerprints.add(fingerprint)
             unique_comments.append(comment)
 
     return unique_comments
@@ -195,57 +312,48 @@ def truncate_text(
         Tuple of (truncated_issue_body, truncated_comments, original_length)
     """
     # Validate minimum max_length
-    truncation_marker = "... [truncated]"
-    min_required_length = len(truncation_marker) * 2 + 10  # Marker + some content
-    if max_length < min_required_length:
+    if max_length < MIN_TRUNCATION_LENGTH:
         raise ValueError(
-            f"max_length ({max_length}) must be at least {min_required_length} "
+            f"max_length ({max_length}) must be at least {MIN_TRUNCATION_LENGTH} "
             f"to accommodate truncation markers and minimal content"
         )
 
     # Calculate original length
     original_length = len(issue_body) + sum(len(c.body) for c in comments)
 
-    # If already under limit, return as-is
+    # If already under limit, return the original objects without copying
     if original_length <= max_length:
         return issue_body, comments, original_length
 
+    cumulative_lengths = list(accumulate(len(c.body) for c in comments))
+
     # Reserve space for issue body (at least 50% or the full body if it's smaller)
     issue_body_target = min(len(issue_body), max_length // 2)
-    comments_space = max_length - issue_body_target
 
     # Truncate issue body if needed
-    truncation_marker = "... [truncated]"
     if len(issue_body) > issue_body_target:
         # Ensure we don't create a negative slice
-        truncate_at = max(0, issue_body_target - len(truncation_marker))
-        truncated_issue = issue_body[:truncate_at] + truncation_marker
+        truncate_at = max(0, issue_body_target - len(TRUNCATION_MARKER))
+        truncated_issue = issue_body[:truncate_at] + TRUNCATION_MARKER
     else:
         truncated_issue = issue_body
 
-    # Adjust comments space to account for actual issue body length
+    # Remaining space for comments after the (possibly truncated) issue body
     comments_space = max_length - len(truncated_issue)
 
-    # Truncate comments to fit remaining space
-    truncated_comments: list[NormalizedComment] = []
-    current_length = 0
+    # Keep every comment whose cumulative length still fits the remaining space
+    cut = bisect_right(cumulative_lengths, comments_space)
+    truncated_comments = comments[:cut]
 
-    for comment in comments:
-        comment_length = len(comment.body)
-
-        if current_length + comment_length <= comments_space:
-            truncated_comments.append(comment)
-            current_length += comment_length
-        else:
-            # Try to fit a truncated version of this comment
-            remaining_space = comments_space - current_length
-            if remaining_space > 100:  # Only truncate if there's meaningful space
-                # Ensure we don't create a negative slice
-                truncate_at = max(0, remaining_space - len(truncation_marker))
-                truncated_body = comment.body[:truncate_at] + truncation_marker
-                truncated_comment = comment.model_copy(update={"body": truncated_body})
-                truncated_comments.append(truncated_comment)
-            break
+    if cut < len(comments):
+        # Try to fit a truncated version of the first comment that didn't fit
+        remaining_space = comments_space - (cumulative_lengths[cut - 1] if cut else 0)
+        if remaining_space > 100:  # Only truncate if there's meaningful space
+            # Ensure we don't create a negative slice
+            truncate_at = max(0, remaining_space - len(TRUNCATION_MARKER))
+            comment = comments[cut]
+            truncated_body = comment.body[:truncate_at] + TRUNCATION_MARKER
+            truncated_comments.append(comment.model_copy(update={"body": truncated_body}))
 
     return truncated_issue, truncated_comments, original_length
 
@@ -274,15 +382,13 @@ def is_noise_issue(
         Tuple of (is_noise, reason)
     """
     # Check for non-actionable labels
-    if any(label.lower() in NON_ACTIONABLE_LABELS for label in labels):
-        matched_labels = [label for label in labels if label.lower() in NON_ACTIONABLE_LABELS]
+    matched_labels = [label for label in labels if label.lower() in NON_ACTIONABLE_LABELS]
+    if matched_labels:
         return True, f"Non-actionable label detected: {matched_labels}"
 
     # Check for bot authors (common bot patterns)
-    if author:
-        bot_patterns = ["[bot]", "-bot", "bot-", "dependabot", "renovate"]
-        if any(pattern in author.lower() for pattern in bot_patterns):
-            return True, f"Bot author: {author}"
+    if author and BOT_AUTHOR_PATTERN.search(author.lower()):
+        return True, f"Bot author: {author}"
 
     # Check for very short title (single word)
     if len(title.split()) <= 1:
@@ -293,9 +399,8 @@ def is_noise_issue(
         return True, "Empty or very short body"
 
     # Check for common spam patterns in title
-    for pattern in SPAM_PATTERNS:
-        if re.match(pattern, title.lower().strip()):
-            return True, f"Spam pattern in title: {title}"
+    if SPAM_TITLE_PATTERN.match(title.lower().strip()):
+        return True, f"Spam pattern in title: {title}"
 
     return False, None
 
@@ -320,13 +425,16 @@ def is_support_ticket(
         Tuple of (is_support, reason)
     """
     # Check for support/question labels
-    if any(label.lower() in LOW_SIGNAL_LABELS for label in labels):
-        matched_labels = [label for label in labels if label.lower() in LOW_SIGNAL_LABELS]
+    matched_labels = [label for label in labels if label.lower() in LOW_SIGNAL_LABELS]
+    if matched_labels:
         return True, f"Support/question label detected: {matched_labels}"
 
     # Combine title and body for keyword search
     combined_text = f"{title} {body}".lower()
 
+    if not SUPPORT_KEYWORD_PATTERN.search(combined_text):
+        return False, None
+
     # Check for support keywords in title and body using pre-compiled patterns
     for pattern, description in SUPPORT_KEYWORD_PATTERNS.items():
         if pattern.search(combined_text):
@@ -401,26 +509,20 @@ def normalize_github_issue(
     raw_body = issue_data.get("body") or ""
     state = issue_data["state"]
     url = issue_data["html_url"]
-    created_at = datetime.fromisoformat(issue_data["created_at"].replace("Z", "+00:00"))
-    updated_at = datetime.fromisoformat(issue_data["updated_at"].replace("Z", "+00:00"))
+    # GitHub timestamps end in "Z", which fromisoformat parses natively on Python 3.11+
+    created_at = datetime.fromisoformat(issue_data["created_at"])
+    updated_at = datetime.fromisoformat(issue_data["updated_at"])
 
     # Extract labels
     labels = [label["name"] for label in issue_data.get("labels", [])]
 
-    # Extract reactions
-    reactions_data = issue_data.get("reactions", {})
-    reactions = {
-        "+1": reactions_data.get("+1", 0),
-        "-1": reactions_data.get("-1", 0),
-        "laugh": reactions_data.get("laugh", 0),
-        "hooray": reactions_data.get("hooray", 0),
-        "confused": reactions_data.get("confused", 0),
-        "heart": reactions_data.get("heart", 0),
-        "rocket": reactions_data.get("rocket", 0),
-        "eyes": reactions_data.get("eyes", 0),
-    }
-    # Remove zero reactions
-    reactions = {k: v for k, v in reactions.items() if v > 0}
+    # Extract issue author
+    issue_author_data = issue_data.get("user")
+    issue_author = issue_author_data["login"] if issue_author_data else None
+
+    # Extract reactions (non-zero counts only)
+    reactions_data = issue_data.get("reactions") or _EMPTY_DICT
+    reactions = {k: v for k in REACTION_KEYS if (v := reactions_data.get(k, 0)) > 0}
 
     # Clean body text
     cleaned_body = clean_markdown(raw_body)
@@ -433,22 +535,12 @@ def normalize_github_issue(
         author = author_data["login"] if author_data else None
         raw_comment_body = comment_data.get("body") or ""
         cleaned_comment_body = clean_markdown(raw_comment_body)
-        comment_created_at = datetime.fromisoformat(
-            comment_data["created_at"].replace("Z", "+00:00")
-        )
+        comment_created_at = datetime.fromisoformat(comment_data["created_at"])
 
-        comment_reactions_data = comment_data.get("reactions", {})
+        comment_reactions_data = comment_data.get("reactions") or _EMPTY_DICT
         comment_reactions = {
-            "+1": comment_reactions_data.get("+1", 0),
-            "-1": comment_reactions_data.get("-1", 0),
-            "laugh": comment_reactions_data.get("laugh", 0),
-            "hooray": comment_reactions_data.get("hooray", 0),
-            "confused": comment_reactions_data.get("confused", 0),
-            "heart": comment_reactions_data.get("heart", 0),
-            "rocket": comment_reactions_data.get("rocket", 0),
-            "eyes": comment_reactions_data.get("eyes", 0),
+            k: v for k in REACTION_KEYS if (v := comment_reactions_data.get(k, 0)) > 0
         }
-        comment_reactions = {k: v for k, v in comment_reactions.items() if v > 0}
 
         normalized_comments.append(
             NormalizedComment(
@@ -464,24 +556,29 @@ def normalize_github_issue(
     normalized_comments = deduplicate_comments(normalized_comments)
 
     # Sort comments by creation time (deterministic ordering)
-    normalized_comments.sort(key=lambda c: c.created_at)
+    normalized_comments.sort(key=attrgetter("created_at"))
 
     # Truncate text if needed
     truncated_body, truncated_comments, original_length = truncate_text(
         cleaned_body, normalized_comments, max_text_length
     )
 
-    # Check if truncation occurred
-    was_truncated = original_length > max_text_length
+    # truncate_text hands back the original objects when nothing was cut
+    was_truncated = (
+        truncated_body is not cleaned_body or truncated_comments is not normalized_comments
+    )
 
     # Apply noise filter
     is_noise = False
     noise_reason = None
     if noise_filter_enabled:
-        author_data = issue_data.get("user")
-        author = author_data["login"] if author_data else None
         is_noise, noise_reason = is_low_signal_issue(
-            title, cleaned_body, labels, author, len(normalized_comments), support_filter_enabled
+            title,
+            cleaned_body,
+            labels,
+            issue_author,
+            len(normalized_comments),
+            support_filter_enabled,
         )
 
     return NormalizedIssue(
@@ -501,3 +598,74 @@ def normalize_github_issue(
         truncated=was_truncated,
         original_length=original_length,
     )
+
+
+def normalize_github_issues_batch(
+    issues: list[tuple[dict[str, Any], list[dict[str, Any]]]],
+    max_text_length: int,
+    noise_filter_enabled: bool = True,
+    support_filter_enabled: bool = True,
+    max_workers: int | None = None,
+) -> list[NormalizedIssue]:
+    """
+    Normalize many GitHub issues, fanning the work out across processes.
+
+    Markdown cleaning is CPU-bound and holds the GIL, so batches of thousands of
+    issues are spread over a process pool with at most one worker per CPU. Smaller
+    batches, single-CPU machines and max_workers=1 normalize serially in the
+    calling process.
+
+    Args:
+        issues: Pairs of (raw issue data, raw comments data)
+        max_text_length: Maximum combined text length
+        noise_filter_enabled: Whether to apply noise filtering
+        support_filter_enabled: Whether to filter support tickets/questions
+        max_workers: Maximum worker processes, capped at the CPU count (None for one
+            per CPU)
+
+    Returns:
+        Normalized issues in the same order as the input
+    """
+    normalize = partial(
+        normalize_github_issue,
+        max_text_length=max_text_length,
+        noise_filter_enabled=noise_filter_enabled,
+        support_filter_enabled=support_filter_enabled,
+    )
+
+    cpus = os.cpu_count() or 1
+    workers = min(max_workers or cpus, cpus)
+    if workers <= 1 or len(issues) < PARALLEL_NORMALIZE_MIN_ISSUES:
+        return [normalize(issue_data, comments_data) for issue_data, comments_data in issues]
+
+    issues_data = [issue_data for issue_data, _ in issues]
+    comments_data = [comments for _, comments in issues]
+
+    chunksize = max(1, len(issues) // (8 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(normalize, issues_data, comments_data, chunksize=chunksize))
+
+
+def merge_issue_updates(
+    existing: list[NormalizedIssue],
+    updates: list[NormalizedIssue],
+    removed_numbers: Collection[int] = (),
+    limit: int | None = None,
+) -> list[NormalizedIssue]:
+    """
+    Upsert incrementally ingested issues into the issues of a previous ingest.
+
+    Args:
+        existing: Normalized issues from the previous ingest
+        updates: Newly normalized issues; these replace existing issues with the same number
+        removed_numbers: Issue numbers to drop (e.g., issues closed since the previous ingest)
+        limit: Keep only this many most recently updated issues (None for no limit)
+
+    Returns:
+        Merged issues sorted by updated_at descending, then issue number descending
+    """
+    merged = {issue.number: issue for issue in existing if issue.number not in removed_numbers}
+    merged.update((issue.number, issue) for issue in updates)
+
+    issues = sorted(merged.values(), key=attrgetter("updated_at", "number"), reverse=True)
+    return issues[:limit] if limit else issues
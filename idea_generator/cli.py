@@ -28,21 +28,31 @@ limitations under the License.
 """
 
 import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
+from enum import Enum
+from functools import lru_cache, partial
+from itertools import chain
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 import typer
 
-from .cleaning import normalize_github_issue
-from .config import load_config
-from .github_client import GitHubAPIError, GitHubClient
-from .models import NormalizedIssue
-from .setup import SetupError, run_setup
+# Package modules (pydantic models, httpx client, setup helpers) are imported inside
+# the commands that use them, so `--help` only pays for Typer itself.
+if TYPE_CHECKING:
+    from .config import Config
 
 app = typer.Typer(
     name="idea-generator",
     help="Generate ideas from GitHub repositories using Ollama LLM personas",
     add_completion=False,
+    # All output is plain typer.echo text: render help and errors with Click and skip
+    # Rich's help/traceback formatting (and the markdown/table modules behind it)
+    rich_markup_mode=None,
+    pretty_exceptions_enable=False,
 )
 
 
@@ -114,6 +124,166 @@ IssueLimitOption = Annotated[
 ]
 
 
+class GitHubApi(str, Enum):
+    """GitHub API used by ingest to fetch issues and comments."""
+
+    REST = "rest"
+    GRAPHQL = "graphql"
+
+
+ApiOption = Annotated[
+    GitHubApi,
+    typer.Option(
+        "--api",
+        help="GitHub API to use; graphql fetches issues and comments together (requires a token)",
+        case_sensitive=False,
+    ),
+]
+ThrottleRateOption = Annotated[
+    float | None,
+    typer.Option(
+        "--throttle-rate",
+        help="Maximum GitHub API requests per second (default: no cap)",
+        min=0.01,
+    ),
+]
+SinceOption = Annotated[
+    str | None,
+    typer.Option(
+        "--since",
+        help="Only fetch issues updated since this ISO 8601 timestamp "
+        "(default: start of the previous ingest)",
+    ),
+]
+FullOption = Annotated[
+    bool,
+    typer.Option("--full", help="Re-ingest all open issues, ignoring the previous ingest"),
+]
+ResumeOption = Annotated[
+    bool,
+    typer.Option("--resume", help="Reuse comment threads already fetched by an interrupted ingest"),
+]
+ThrottleBufferOption = Annotated[
+    int | None,
+    typer.Option(
+        "--throttle-buffer",
+        help="Remaining GitHub API quota at which requests wait for the rate-limit reset",
+        min=0,
+    ),
+]
+
+
+# Opt-in: reuse one loaded Config per distinct set of CLI overrides in this process
+CONFIG_CACHE_ENV_VAR = "IDEA_GEN_CACHE_CONFIG"
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(frozen_overrides: tuple[tuple[str, Any], ...]) -> "Config":
+    """Load configuration once per distinct set of overrides."""
+    from .config import load_config
+
+    return load_config(**dict(frozen_overrides))
+
+
+def _load_cli_config(**overrides: Any) -> "Config":
+    """
+    Load configuration for a CLI command.
+
+    When IDEA_GEN_CACHE_CONFIG is enabled, the parsed configuration is cached per
+    set of overrides and a copy is returned so commands can adjust fields freely.
+    Caching is off by default because it ignores environment changes made after
+    the first load.
+    """
+    from .config import load_config
+
+    if os.environ.get(CONFIG_CACHE_ENV_VAR, "").lower() not in ("1", "true", "yes"):
+        return load_config(**overrides)
+    return _load_config_cached(tuple(sorted(overrides.items()))).model_copy()
+
+
+def _require_owner_repo(config: "Config") -> tuple[str, str]:
+    """
+    Return the configured repository as (owner, repo), exiting with an error if unusable.
+
+    Raises:
+        typer.Exit: If no repository is configured or it is not in 'owner/repo' format
+    """
+    if not config.github_repo:
+        typer.echo(
+            "Error: GitHub repository not configured.\n"
+            "Provide via --github-repo or set IDEA_GEN_GITHUB_REPO in .env",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    try:
+        owner, repo = config.github_repo.split("/")
+    except ValueError:
+        typer.echo(
+            f"Error: Invalid repository format '{config.github_repo}'. "
+            "Expected format: 'owner/repo'",
+            err=True,
+        )
+        raise typer.Exit(code=1) from None
+    return owner, repo
+
+
+# Per-repository start time of the last successful ingest (the default for --since)
+INGEST_STATE_FILENAME = ".ingest_state.json"
+
+
+def _load_ingest_state(state_file: Path) -> dict[str, str]:
+    """Load last-ingest timestamps by repository, ignoring a missing or unreadable file."""
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+# Write-ahead log of fetched comment threads, one JSON line per issue; removed once
+# ingest saves its output, so a leftover file means the last run was interrupted
+COMMENTS_WAL_SUFFIX = "_comments.jsonl"
+
+
+def _load_comments_wal(wal_file: Path) -> dict[int, tuple[str | None, list[dict[str, Any]]]]:
+    """
+    Load comment threads logged by an interrupted ingest, keyed by issue number.
+
+    Each entry keeps the issue's updated_at so a thread is only reused for an
+    unchanged issue. Later lines win, and a partial last line (from a crash
+    mid-write) is ignored.
+    """
+    threads: dict[int, tuple[str | None, list[dict[str, Any]]]] = {}
+    try:
+        with open(wal_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    threads[entry["number"]] = (entry["updated_at"], entry["comments"])
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except OSError:
+        return {}
+    return threads
+
+
+def _normalize_since(value: str) -> str:
+    """
+    Convert an ISO 8601 timestamp to the UTC form used by the GitHub API.
+
+    Timestamps without a UTC offset are taken as UTC.
+
+    Raises:
+        ValueError: If the value is not an ISO 8601 timestamp
+    """
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    return timestamp.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 @app.command()
 def setup(
     github_repo: GithubRepoOption = None,
@@ -145,8 +315,10 @@ def setup(
     - Creates necessary directories
     - Saves persona metadata and system prompts
     """
+    from .setup import SetupError, run_setup
+
     try:
-        config = load_config(
+        config = _load_cli_config(
             github_repo=github_repo,
             github_token=github_token,
             ollama_host=ollama_host,
@@ -172,6 +344,12 @@ def ingest(
     github_token: GithubTokenOption = None,
     data_dir: DataDirOption = None,
     issue_limit: IssueLimitOption = None,
+    throttle_rate: ThrottleRateOption = None,
+    throttle_buffer: ThrottleBufferOption = None,
+    api: ApiOption = GitHubApi.REST,
+    since: SinceOption = None,
+    full: FullOption = False,
+    resume: ResumeOption = False,
 ) -> None:
     """
     Ingest open issues from a GitHub repository.
@@ -183,44 +361,88 @@ def ingest(
     - Applies noise filtering
     - Saves normalized JSON to the data directory
     - Optionally limits the number of issues ingested (--issue-limit)
+    - Optionally batches issues and comments into one GraphQL query per page (--api graphql),
+      falling back to the REST API if the GraphQL query fails
+    - Paces requests from the GitHub rate-limit headers (--throttle-rate, --throttle-buffer)
+    - After a first run, only fetches issues updated since the previous ingest and merges
+      them into its output (--since to choose the cut-off, --full to re-ingest everything)
+    - Logs each fetched comment thread so an interrupted ingest can pick up where it
+      stopped (--resume)
     """
+    from .cleaning import merge_issue_updates, normalize_github_issues_batch
+    from .github_client import GitHubAPIError, GitHubClient
+    from .models import NormalizedIssue
+    from .output import read_json_array, write_json_array
+
     try:
-        config = load_config(
+        config = _load_cli_config(
             github_repo=github_repo,
             github_token=github_token,
             data_dir=data_dir,
             github_issue_limit=issue_limit,
+            github_rate_limit_buffer=throttle_buffer,
+            github_max_requests_per_second=throttle_rate,
         )
 
-        # Validate required configuration
-        if not config.github_repo:
+        owner, repo = _require_owner_repo(config)
+
+        if api is GitHubApi.GRAPHQL and not config.github_token:
             typer.echo(
-                "Error: GitHub repository not configured.\n"
-                "Provide via --github-repo or set IDEA_GEN_GITHUB_REPO in .env",
+                "Error: The GraphQL API requires authentication.\n"
+                "Provide via --github-token or set IDEA_GEN_GITHUB_TOKEN in .env",
                 err=True,
             )
             raise typer.Exit(code=1)
 
-        # Parse owner/repo
-        try:
-            owner, repo = config.github_repo.split("/")
-        except ValueError:
+        if resume and api is GitHubApi.GRAPHQL:
             typer.echo(
-                f"Error: Invalid repository format '{config.github_repo}'. "
-                "Expected format: 'owner/repo'",
+                "⚠ Warning: --resume only reuses comment threads fetched via the REST API; "
+                "it has no effect unless the GraphQL fetch falls back to REST",
                 err=True,
             )
-            raise typer.Exit(code=1) from None
+
+        if since is not None:
+            try:
+                since = _normalize_since(since)
+            except ValueError:
+                typer.echo(
+                    f"Error: Invalid --since timestamp '{since}'. "
+                    "Expected ISO 8601, e.g. 2025-01-31T12:00:00Z",
+                    err=True,
+                )
+                raise typer.Exit(code=1) from None
 
         typer.echo(f"Ingesting issues from {config.github_repo}...")
         typer.echo(f"Data directory: {config.data_dir}\n")
 
-        # Ensure data directory exists
-        config.ensure_directories()
-
-        # Setup cache directory for raw responses
+        # Ensure data directory and the raw response cache directory exist
         cache_dir = config.data_dir / "cache"
-        cache_dir.mkdir(exist_ok=True)
+        config.ensure_directories(cache_dir)
+
+        # Once an earlier ingest exists, only issues updated since it started are
+        # fetched (including closed ones, so they can be dropped from its output)
+        output_file = config.data_dir / f"{owner}_{repo}_issues.json"
+        wal_file = config.data_dir / f"{owner}_{repo}{COMMENTS_WAL_SUFFIX}"
+        state_file = config.data_dir / INGEST_STATE_FILENAME
+        ingest_state = _load_ingest_state(state_file)
+        if full:
+            since = None
+        elif since is None and output_file.exists():
+            since = ingest_state.get(config.github_repo)
+        issue_state = "all" if since else "open"
+        # Closed issues would use up an incremental fetch's limit; the merge applies it
+        fetch_limit = None if since else config.github_issue_limit
+        found_label = "updated" if since else "open"
+        run_started = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        if since:
+            typer.echo(f"Incremental ingest: issues updated since {since}\n")
+        if not resume and api is GitHubApi.REST and wal_file.exists():
+            # The log is only appended to, so its threads stay available to --resume
+            typer.echo(
+                f"⚠ Found comment threads logged by an interrupted ingest in {wal_file}.\n"
+                "  They are kept, but this run fetches every thread again; "
+                "rerun with --resume to reuse them\n"
+            )
 
         # Initialize GitHub client
         with GitHubClient(
@@ -228,94 +450,250 @@ def ingest(
             per_page=config.github_per_page,
             max_retries=config.github_max_retries,
             cache_dir=cache_dir,
+            max_connections=config.max_workers,
+            rate_limit_buffer=config.github_rate_limit_buffer,
+            max_requests_per_second=config.github_max_requests_per_second,
         ) as client:
             # Check repository access
             typer.echo("Checking repository access...")
-            try:
-                if not client.check_repository_access(owner, repo):
-                    typer.echo(
-                        f"Error: Repository '{config.github_repo}' not found or not accessible.\n"
-                        "For private repositories, ensure IDEA_GEN_GITHUB_TOKEN is set with "
-                        "'repo' scope.",
-                        err=True,
+            fetch_rest_issues = partial(
+                client.fetch_issues,
+                owner,
+                repo,
+                state=issue_state,
+                limit=fetch_limit,
+                since=since,
+            )
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                # Start fetching issues while access is checked; the check only decides
+                # how an inaccessible repository is reported, so it need not go first
+                issues_future: Future[Any]
+                if api is GitHubApi.GRAPHQL:
+                    # One query per page returns issues with their comment threads
+                    issues_future = prefetcher.submit(
+                        client.fetch_issues_with_comments,
+                        owner,
+                        repo,
+                        limit=fetch_limit,
+                        state=issue_state,
+                        since=since,
                     )
-                    raise typer.Exit(code=1)
-                typer.echo("✓ Repository accessible\n")
-            except GitHubAPIError as e:
-                typer.echo(f"Error checking repository access: {e}", err=True)
-                raise typer.Exit(code=1) from e
+                else:
+                    issues_future = prefetcher.submit(fetch_rest_issues)
+                try:
+                    if not client.check_repository_access(owner, repo):
+                        typer.echo(
+                            f"Error: Repository '{config.github_repo}' not found or not "
+                            "accessible.\nFor private repositories, ensure "
+                            "IDEA_GEN_GITHUB_TOKEN is set with 'repo' scope.",
+                            err=True,
+                        )
+                        raise typer.Exit(code=1)
+                    typer.echo("✓ Repository accessible\n")
+                except GitHubAPIError as e:
+                    typer.echo(f"Error checking repository access: {e}", err=True)
+                    raise typer.Exit(code=1) from e
 
             # Fetch issues
-            limit_msg = (
-                f" (limit: {config.github_issue_limit})" if config.github_issue_limit else ""
-            )
-            typer.echo(f"Fetching open issues{limit_msg}...")
-            try:
-                issues = client.fetch_issues(
-                    owner, repo, state="open", limit=config.github_issue_limit
-                )
-                typer.echo(f"✓ Found {len(issues)} open issues\n")
-            except GitHubAPIError as e:
-                typer.echo(f"Error fetching issues: {e}", err=True)
-                raise typer.Exit(code=1) from e
-
-            if not issues:
-                typer.echo("No open issues found. Nothing to ingest.")
-                return
-
-            # Process each issue
-            typer.echo("Processing issues and comments...")
-            normalized_issues: list[NormalizedIssue] = []
-            noise_count = 0
-            truncated_count = 0
-
-            for i, issue_data in enumerate(issues, 1):
-                issue_number = issue_data["number"]
-                typer.echo(f"  [{i}/{len(issues)}] Issue #{issue_number}...", nl=False)
-
-                # Fetch comments
+            limit_msg = f" (limit: {fetch_limit})" if fetch_limit else ""
+            issues_with_comments: list[tuple[dict[str, Any], list[dict[str, Any]]]]
+            closed_numbers: set[int] = set()
+            failed_numbers: set[int] = set()
+            next_since = run_started
+            rest_prefetched = api is GitHubApi.REST
+            if api is GitHubApi.GRAPHQL:
+                typer.echo(f"Fetching {found_label} issues and comments via GraphQL{limit_msg}...")
                 try:
-                    comments = client.fetch_issue_comments(owner, repo, issue_number)
+                    issues_with_comments = issues_future.result()
+                    typer.echo(
+                        f"✓ Found {len(issues_with_comments)} {found_label} issues "
+                        f"(GraphQL cost: {client.graphql_cost})\n"
+                    )
                 except GitHubAPIError as e:
-                    typer.echo(f"\n  ⚠ Warning: Failed to fetch comments: {e}")
-                    comments = []
-                    typer.echo(f"  [{i}/{len(issues)}] Issue #{issue_number}...", nl=False)
-
-                # Normalize issue
-                normalized = normalize_github_issue(
-                    issue_data,
-                    comments,
-                    max_text_length=config.max_text_length,
-                    noise_filter_enabled=config.noise_filter_enabled,
-                    support_filter_enabled=config.support_filter_enabled,
-                )
-                normalized_issues.append(normalized)
-
-                # Track metrics
-                if normalized.is_noise:
-                    noise_count += 1
-                if normalized.truncated:
-                    truncated_count += 1
+                    # The repository is accessible (checked above), so this is GraphQL
+                    # specific, e.g. a fine-grained token without GraphQL access
+                    typer.echo(f"⚠ GraphQL fetch failed: {e}\n  Falling back to the REST API\n")
+                    api = GitHubApi.REST
+
+            if api is GitHubApi.GRAPHQL:
+                if since:
+                    closed_numbers = {
+                        issue["number"]
+                        for issue, _ in issues_with_comments
+                        if issue.get("state") != "open"
+                    }
+                    issues_with_comments = [
+                        pair
+                        for pair in issues_with_comments
+                        if pair[0]["number"] not in closed_numbers
+                    ]
+                elif not issues_with_comments:
+                    typer.echo("No open issues found. Nothing to ingest.")
+                    return
+            else:
+                typer.echo(f"Fetching {found_label} issues{limit_msg}...")
+                try:
+                    issues = issues_future.result() if rest_prefetched else fetch_rest_issues()
+                    typer.echo(f"✓ Found {len(issues)} {found_label} issues\n")
+                except GitHubAPIError as e:
+                    typer.echo(f"Error fetching issues: {e}", err=True)
+                    raise typer.Exit(code=1) from e
+
+                if since:
+                    # Closed issues need no comments; they are only removed from the output
+                    closed_numbers = {
+                        issue["number"] for issue in issues if issue.get("state") != "open"
+                    }
+                    issues = [issue for issue in issues if issue["number"] not in closed_numbers]
+                elif not issues:
+                    typer.echo("No open issues found. Nothing to ingest.")
+                    return
+
+                # Reuse threads an interrupted run already logged for issues unchanged since
+                comments_by_number: dict[int, list[dict[str, Any]]] = {}
+                pending_issues = issues
+                if resume:
+                    logged_threads = _load_comments_wal(wal_file)
+                    pending_issues = []
+                    for issue_data in issues:
+                        logged = logged_threads.get(issue_data["number"])
+                        if logged and logged[0] == issue_data.get("updated_at"):
+                            comments_by_number[issue_data["number"]] = logged[1]
+                        else:
+                            pending_issues.append(issue_data)
+                    typer.echo(
+                        f"Resuming: {len(comments_by_number)} comment threads reused "
+                        "from the interrupted ingest"
+                    )
 
-                typer.echo(" ✓")
+                # Fetch comment threads concurrently; each fetch is a network-bound round-trip
+                typer.echo(f"Fetching comments ({config.max_workers} concurrent requests)...")
+                comment_failures: list[tuple[int, GitHubAPIError]] = []
+                with (
+                    open(wal_file, "a", encoding="utf-8") as wal,
+                    ThreadPoolExecutor(max_workers=config.max_workers) as executor,
+                ):
+                    if wal.tell():
+                        # An interrupted run may have stopped mid-line; blank lines are skipped
+                        wal.write("\n")
+                    futures = {
+                        executor.submit(
+                            client.fetch_issue_comments, owner, repo, issue_data["number"]
+                        ): issue_data
+                        for issue_data in pending_issues
+                    }
+                    # A single redrawn status line (at most ~100 redraws) instead of one
+                    # echo per issue; warnings are reported once the bar has finished
+                    with typer.progressbar(
+                        as_completed(futures),
+                        length=len(futures),
+                        label="  Issues",
+                        show_pos=True,
+                        update_min_steps=max(1, len(futures) // 100),
+                    ) as progress:
+                        for future in progress:
+                            issue_data = futures[future]
+                            issue_number = issue_data["number"]
+                            try:
+                                comments_by_number[issue_number] = future.result()
+                            except GitHubAPIError as e:
+                                comment_failures.append((issue_number, e))
+                                comments_by_number[issue_number] = []
+                                continue
+                            # Only the main thread writes, so lines never interleave
+                            entry = {
+                                "number": issue_number,
+                                "updated_at": issue_data.get("updated_at"),
+                                "comments": comments_by_number[issue_number],
+                            }
+                            wal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                            wal.flush()
+                if comment_failures:
+                    # One write for all warnings rather than an echo per failed issue
+                    typer.echo(
+                        "\n".join(
+                            "  ⚠ Warning: Failed to fetch comments for issue "
+                            f"#{issue_number}: {error}"
+                            for issue_number, error in comment_failures
+                        )
+                    )
+                    # Move the next ingest's cursor back so it fetches these threads again
+                    failed_numbers = {issue_number for issue_number, _ in comment_failures}
+                    next_since = min(
+                        [
+                            next_since,
+                            *(
+                                issue_data["updated_at"]
+                                for issue_data in issues
+                                if issue_data["number"] in failed_numbers
+                                and issue_data.get("updated_at")
+                            ),
+                        ]
+                    )
+                    typer.echo(
+                        f"  Comments for {len(failed_numbers)} issues will be fetched again "
+                        "on the next ingest"
+                    )
+                issues_with_comments = [
+                    (issue_data, comments_by_number[issue_data["number"]]) for issue_data in issues
+                ]
+
+            # Normalize in the original issue order so output stays deterministic
+            typer.echo("\nProcessing issues and comments...")
+            normalized_issues = normalize_github_issues_batch(
+                issues_with_comments,
+                max_text_length=config.max_text_length,
+                noise_filter_enabled=config.noise_filter_enabled,
+                support_filter_enabled=config.support_filter_enabled,
+            )
+            noise_count = truncated_count = 0
+            for issue in normalized_issues:
+                noise_count += issue.is_noise
+                truncated_count += issue.truncated
 
             typer.echo(f"\n✓ Processed {len(normalized_issues)} issues")
             typer.echo(f"  - Flagged as noise: {noise_count}")
-            typer.echo(f"  - Truncated: {truncated_count}\n")
+            typer.echo(f"  - Truncated: {truncated_count}")
+            typer.echo(
+                f"  - GitHub responses: {client.cache_hits} unchanged since last run, "
+                f"{client.cache_misses} downloaded\n"
+            )
+
+            # Upsert the updates into the previous ingest's issues
+            saved_issues = normalized_issues
+            if since and output_file.exists():
+                previous_issues = read_json_array(output_file, NormalizedIssue)
+                # A failed comment fetch must not replace a saved thread with an empty one
+                previous_numbers = {issue.number for issue in previous_issues}
+                updates = [
+                    issue
+                    for issue in normalized_issues
+                    if issue.number not in failed_numbers or issue.number not in previous_numbers
+                ]
+                saved_issues = merge_issue_updates(
+                    previous_issues,
+                    updates,
+                    closed_numbers,
+                    limit=config.github_issue_limit,
+                )
+                typer.echo(
+                    f"Merged into previous ingest: {len(previous_issues)} issues before, "
+                    f"{len(closed_numbers)} closed since\n"
+                )
 
             # Save to JSON
-            output_file = config.data_dir / f"{owner}_{repo}_issues.json"
             typer.echo(f"Saving normalized issues to {output_file}...")
 
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(
-                    [issue.model_dump(mode="json") for issue in normalized_issues],
-                    f,
-                    indent=2,
-                    ensure_ascii=False,
-                )
+            write_json_array(saved_issues, output_file)
+
+            # Record the start of this run so the next ingest also catches issues
+            # updated while it was in progress
+            ingest_state[config.github_repo] = next_since
+            with open(state_file, "w", encoding="utf-8") as f:
+                json.dump(ingest_state, f, indent=2)
+            wal_file.unlink(missing_ok=True)
 
-            typer.echo(f"✓ Saved {len(normalized_issues)} issues\n")
+            typer.echo(f"✓ Saved {len(saved_issues)} issues\n")
 
             # Summary
             typer.echo("✅ Ingestion completed successfully!")
@@ -349,13 +727,21 @@ def summarize(
         bool,
         typer.Option("--skip-noise", help="Skip issues already flagged as noise"),
     ] = False,
+    concurrency: Annotated[
+        int | None,
+        typer.Option(
+            "--concurrency",
+            help="Concurrent summarization requests to Ollama (default: 4)",
+            min=1,
+        ),
+    ] = None,
 ) -> None:
     """
     Summarize normalized issues using the LLM summarizer persona.
 
     This command:
     - Loads normalized issues from the data directory
-    - Processes each issue sequentially through the summarizer LLM
+    - Sends each issue to the summarizer LLM, several requests at a time
     - Generates structured summaries with quantitative metrics
     - Caches results to avoid redundant API calls
     - Saves summarized issues to the output directory
@@ -369,13 +755,15 @@ def summarize(
     - Desirability (0.0-1.0): How valuable to users
     - Attention (0.0-1.0): Community engagement level
     """
-    from pathlib import Path
+    from pydantic import ValidationError
 
     from .llm.client import OllamaClient, OllamaError
+    from .models import NormalizedIssue
+    from .output import iter_json_array, write_json_array
     from .pipelines.summarize import SummarizationError, SummarizationPipeline
 
     try:
-        config = load_config(
+        config = _load_cli_config(
             github_repo=github_repo,
             data_dir=data_dir,
             output_dir=output_dir,
@@ -384,25 +772,7 @@ def summarize(
             model_summarizing=model_summarizing,
         )
 
-        # Validate required configuration
-        if not config.github_repo:
-            typer.echo(
-                "Error: GitHub repository not configured.\n"
-                "Provide via --github-repo or set IDEA_GEN_GITHUB_REPO in .env",
-                err=True,
-            )
-            raise typer.Exit(code=1)
-
-        # Parse owner/repo
-        try:
-            owner, repo = config.github_repo.split("/")
-        except ValueError:
-            typer.echo(
-                f"Error: Invalid repository format '{config.github_repo}'. "
-                "Expected format: 'owner/repo'",
-                err=True,
-            )
-            raise typer.Exit(code=1) from None
+        owner, repo = _require_owner_repo(config)
 
         typer.echo(f"Summarizing issues from {config.github_repo}...")
         typer.echo(f"Data directory: {config.data_dir}")
@@ -423,24 +793,44 @@ def summarize(
             )
             raise typer.Exit(code=1)
 
-        typer.echo(f"Loading issues from {issues_file}...")
-        with open(issues_file, encoding="utf-8") as f:
-            issues_data = json.load(f)
+        # Stream issues from disk so the first summary request goes out before the
+        # whole file is parsed; noise is dropped as it streams when requested
+        typer.echo(f"Streaming issues from {issues_file}...")
+        loaded_count = noise_count = 0
 
-        issues = [NormalizedIssue(**issue_data) for issue_data in issues_data]
-        typer.echo(f"✓ Loaded {len(issues)} issues\n")
+        def stream_issues() -> Iterator[NormalizedIssue]:
+            nonlocal loaded_count, noise_count
+            for issue in iter_json_array(issues_file, NormalizedIssue):
+                loaded_count += 1
+                if skip_noise and issue.is_noise:
+                    noise_count += 1
+                    continue
+                yield issue
+
+        issues = stream_issues()
+        try:
+            # Peek so an empty or all-noise file never reaches the Ollama checks
+            first_issue = next(issues, None)
+        except (json.JSONDecodeError, ValidationError) as e:
+            typer.echo(f"Invalid issues file: {e}", err=True)
+            raise typer.Exit(code=1) from e
 
-        if not issues:
+        if first_issue is None:
+            typer.echo(f"✓ Loaded {loaded_count} issues\n")
+            if noise_count:
+                typer.echo(f"Skipping {noise_count} noise issues\n")
             typer.echo("No issues to summarize.")
             return
 
-        # Initialize Ollama client
+        # Initialize Ollama client, pooling one connection per concurrent request
+        concurrency = concurrency or config.llm_concurrency
         typer.echo("Connecting to Ollama server...")
         try:
             llm_client = OllamaClient(
                 base_url=config.ollama_base_url,
                 timeout=config.llm_timeout,
                 max_retries=config.llm_max_retries,
+                max_connections=concurrency,
             )
 
             if not llm_client.check_health():
@@ -460,7 +850,6 @@ def summarize(
             raise typer.Exit(code=1) from e
 
         # Initialize summarization pipeline
-        prompt_path = Path(__file__).parent / "llm" / "prompts" / "summarizer.txt"
         cache_dir = config.output_dir / "summarization_cache"
 
         try:
@@ -481,7 +870,6 @@ def summarize(
             pipeline = SummarizationPipeline(
                 llm_client=llm_client,
                 model=config.model_summarizing,
-                prompt_template_path=prompt_path,
                 max_tokens=config.summarization_max_tokens,
                 cache_dir=cache_dir,
                 cache_max_file_size=config.cache_max_file_size,
@@ -492,18 +880,29 @@ def summarize(
 
         # Summarize issues
         typer.echo("Processing issues through summarizer persona...")
-        typer.echo(f"Configuration: skip_cache={skip_cache}, skip_noise={skip_noise}\n")
+        typer.echo(
+            f"Configuration: skip_cache={skip_cache}, skip_noise={skip_noise}, "
+            f"concurrency={concurrency}\n"
+        )
 
         try:
+            # Noise was already dropped while streaming, so the pipeline need not recheck
             summaries = pipeline.summarize_issues(
-                issues, skip_cache=skip_cache, skip_noise=skip_noise
+                chain([first_issue], issues), skip_cache=skip_cache, concurrency=concurrency
             )
+        except (json.JSONDecodeError, ValidationError) as e:
+            typer.echo(f"\nInvalid issues file: {e}", err=True)
+            raise typer.Exit(code=1) from e
         except Exception as e:
             typer.echo(f"Error during summarization: {e}", err=True)
             raise typer.Exit(code=1) from e
         finally:
             llm_client.close()
 
+        typer.echo(f"\n✓ Loaded {loaded_count} issues")
+        if noise_count:
+            typer.echo(f"Skipped {noise_count} noise issues")
+
         if not summaries:
             typer.echo("No summaries generated.")
             return
@@ -512,21 +911,21 @@ def summarize(
         output_file = config.output_dir / f"{owner}_{repo}_summaries.json"
         typer.echo(f"\nSaving summaries to {output_file}...")
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                [summary.model_dump(mode="json") for summary in summaries],
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
+        write_json_array(summaries, output_file, indent=2)
 
         typer.echo(f"✓ Saved {len(summaries)} summaries\n")
 
-        # Summary statistics
-        avg_novelty = sum(s.novelty for s in summaries) / len(summaries)
-        avg_feasibility = sum(s.feasibility for s in summaries) / len(summaries)
-        avg_desirability = sum(s.desirability for s in summaries) / len(summaries)
-        noise_count = sum(1 for s in summaries if s.noise_flag)
+        # Summary statistics, accumulated in one pass over the summaries
+        total_novelty = total_feasibility = total_desirability = 0.0
+        noise_count = 0
+        for s in summaries:
+            total_novelty += s.novelty
+            total_feasibility += s.feasibility
+            total_desirability += s.desirability
+            noise_count += s.noise_flag
+        avg_novelty = total_novelty / len(summaries)
+        avg_feasibility = total_feasibility / len(summaries)
+        avg_desirability = total_desirability / len(summaries)
 
         typer.echo("✅ Summarization completed successfully!\n")
         typer.echo("Summary Statistics:")
@@ -550,10 +949,6 @@ def summarize(
         # Permission issues
         typer.echo(f"Permission denied: {e}", err=True)
         raise typer.Exit(code=1) from e
-    except json.JSONDecodeError as e:
-        # Invalid JSON in issues file
-        typer.echo(f"Invalid JSON in issues file: {e}", err=True)
-        raise typer.Exit(code=1) from e
     except OllamaError as e:
         # LLM/Ollama specific errors
         typer.echo(f"Ollama error: {e}", err=True)
@@ -604,14 +999,15 @@ def group(
     Batching is used to respect context window limits. Issues are processed
     in chunks defined by --max-batch-size and --max-batch-chars.
     """
-    from pathlib import Path
+    from pydantic import ValidationError
 
     from .llm.client import OllamaClient, OllamaError
     from .models import SummarizedIssue
+    from .output import read_json_array, write_json_array
     from .pipelines.grouping import GroupingError, GroupingPipeline
 
     try:
-        config = load_config(
+        config = _load_cli_config(
             github_repo=github_repo,
             output_dir=output_dir,
             ollama_host=ollama_host,
@@ -625,25 +1021,7 @@ def group(
         if max_batch_chars is not None:
             config.grouping_max_batch_chars = max_batch_chars
 
-        # Validate required configuration
-        if not config.github_repo:
-            typer.echo(
-                "Error: GitHub repository not configured.\n"
-                "Provide via --github-repo or set IDEA_GEN_GITHUB_REPO in .env",
-                err=True,
-            )
-            raise typer.Exit(code=1)
-
-        # Parse owner/repo
-        try:
-            owner, repo = config.github_repo.split("/")
-        except ValueError:
-            typer.echo(
-                f"Error: Invalid repository format '{config.github_repo}'. "
-                "Expected format: 'owner/repo'",
-                err=True,
-            )
-            raise typer.Exit(code=1) from None
+        owner, repo = _require_owner_repo(config)
 
         typer.echo(f"Grouping summaries from {config.github_repo}...")
         typer.echo(f"Output directory: {config.output_dir}")
@@ -668,12 +1046,20 @@ def group(
             raise typer.Exit(code=1)
 
         typer.echo(f"Loading summaries from {summaries_file}...")
-        with open(summaries_file, encoding="utf-8") as f:
-            summaries_data = json.load(f)
-
-        summaries = [SummarizedIssue(**s) for s in summaries_data]
+        try:
+            summaries = read_json_array(summaries_file, SummarizedIssue)
+        except ValidationError as e:
+            typer.echo(f"Invalid summaries file: {e}", err=True)
+            raise typer.Exit(code=1) from e
         typer.echo(f"✓ Loaded {len(summaries)} summaries\n")
 
+        if skip_noise:
+            # Drop noise up front so an all-noise file never reaches the Ollama checks
+            loaded_count = len(summaries)
+            summaries = [summary for summary in summaries if not summary.noise_flag]
+            if len(summaries) < loaded_count:
+                typer.echo(f"Skipping {loaded_count - len(summaries)} noise summaries\n")
+
         if not summaries:
             typer.echo("No summaries to group.")
             return
@@ -704,8 +1090,6 @@ def group(
             raise typer.Exit(code=1) from e
 
         # Initialize grouping pipeline
-        prompt_path = Path(__file__).parent / "llm" / "prompts" / "grouper.txt"
-
         try:
             # Validate model exists
             if not llm_client.model_exists(config.model_grouping):
@@ -724,7 +1108,6 @@ def group(
             pipeline = GroupingPipeline(
                 llm_client=llm_client,
                 model=config.model_grouping,
-                prompt_template_path=prompt_path,
                 max_batch_size=config.grouping_max_batch_size,
                 max_batch_chars=config.grouping_max_batch_chars,
             )
@@ -752,19 +1135,16 @@ def group(
         output_file = config.output_dir / f"{owner}_{repo}_clusters.json"
         typer.echo(f"\nSaving clusters to {output_file}...")
 
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(
-                [cluster.model_dump(mode="json") for cluster in clusters],
-                f,
-                indent=2,
-                ensure_ascii=False,
-            )
+        write_json_array(clusters, output_file, indent=2)
 
         typer.echo(f"✓ Saved {len(clusters)} clusters\n")
 
-        # Summary statistics
-        total_issues = sum(len(c.member_issue_ids) for c in clusters)
-        singleton_count = sum(1 for c in clusters if len(c.member_issue_ids) == 1)
+        # Summary statistics, accumulated in one pass over the clusters
+        total_issues = singleton_count = 0
+        for c in clusters:
+            cluster_size = len(c.member_issue_ids)
+            total_issues += cluster_size
+            singleton_count += cluster_size == 1
         avg_cluster_size = total_issues / len(clusters)
 
         typer.echo("✅ Grouping completed successfully!\n")
@@ -788,10 +1168,6 @@ def group(
         # Permission issues
         typer.echo(f"Permission denied: {e}", err=True)
         raise typer.Exit(code=1) from e
-    except json.JSONDecodeError as e:
-        # Invalid JSON in summaries file
-        typer.echo(f"Invalid JSON in summaries file: {e}", err=True)
-        raise typer.Exit(code=1) from e
     except OllamaError as e:
         # LLM/Ollama specific errors
         typer.echo(f"Ollama error: {e}", err=True)
@@ -832,11 +1208,16 @@ def run(
         int | None,
         typer.Option("--top-ideas", help="Number of top ideas in Markdown report (default: 10)"),
     ] = None,
+    with_setup: Annotated[
+        bool,
+        typer.Option("--setup", help="Run environment setup first, in the same process"),
+    ] = False,
 ) -> None:
     """
     Run the complete idea generation pipeline end-to-end.
 
     This command orchestrates all stages:
+    0. Set up the environment (only with --setup)
     1. Ingest issues from GitHub
     2. Summarize with LLM persona
     3. Group into clusters
@@ -847,9 +1228,10 @@ def run(
     Use --force to regenerate all artifacts from scratch.
     """
     from .pipelines.orchestrator import Orchestrator, OrchestratorError
+    from .setup import SetupError, run_setup
 
     try:
-        config = load_config(
+        config = _load_cli_config(
             github_repo=github_repo,
             github_token=github_token,
             ollama_host=ollama_host,
@@ -864,14 +1246,8 @@ def run(
         if top_ideas is not None:
             config.top_ideas_count = top_ideas
 
-        # Validate required configuration
-        if not config.github_repo:
-            typer.echo(
-                "Error: GitHub repository not configured.\n"
-                "Provide via --github-repo or set IDEA_GEN_GITHUB_REPO in .env",
-                err=True,
-            )
-            raise typer.Exit(code=1)
+        # Validate required configuration; the orchestrator parses owner/repo itself
+        _require_owner_repo(config)
 
         typer.echo("=" * 60)
         typer.echo("🚀 Running Complete Idea Generation Pipeline")
@@ -893,6 +1269,11 @@ def run(
         typer.echo(f"  - Attention: {config.ranking_weight_attention:.2f}")
         typer.echo("\n" + "=" * 60 + "\n")
 
+        # Setup shares this process and config instead of a separate `setup` invocation
+        if with_setup:
+            run_setup(config)
+            typer.echo("")
+
         # Run orchestrator
         orchestrator = Orchestrator(config)
         results = orchestrator.run(
@@ -921,6 +1302,9 @@ def run(
 
         typer.echo("\n" + "=" * 60)
 
+    except SetupError as e:
+        typer.echo(f"Setup failed: {e}", err=True)
+        raise typer.Exit(code=1) from e
     except OrchestratorError as e:
         typer.echo(f"Pipeline error: {e}", err=True)
         raise typer.Exit(code=1) from e
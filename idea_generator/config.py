@@ -27,6 +27,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import os
 from pathlib import Path
 
 from pydantic import Field, field_validator, model_validator
@@ -36,6 +37,29 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 WEIGHT_SUM_TOLERANCE = 0.01
 
 
+# Directories already ensured by this process; repeat calls skip the filesystem
+_ENSURED_DIRECTORIES: set[Path] = set()
+
+
+def ensure_directory(directory: Path) -> None:
+    """
+    Create a directory (and parents) unless it already exists.
+
+    Checking first costs one stat for the common existing-directory case, where
+    mkdir(exist_ok=True) would issue a failing mkdir and swallow the error. Each
+    path is checked at most once per process, so commands and pipelines that
+    ensure the same directory back to back (e.g., under `run`) cost nothing.
+
+    Args:
+        directory: Directory to create
+    """
+    if directory in _ENSURED_DIRECTORIES:
+        return
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRECTORIES.add(directory)
+
+
 class Config(BaseSettings):
     """
     Configuration for the idea-generator CLI.
@@ -128,6 +152,16 @@ class Config(BaseSettings):
         description="Maximum number of issues to ingest per repository (None for no limit)",
         ge=1,
     )
+    github_rate_limit_buffer: int = Field(
+        default=100,
+        description="Remaining GitHub API quota at which requests wait for the rate-limit reset",
+        ge=0,
+    )
+    github_max_requests_per_second: float | None = Field(
+        default=None,
+        description="Maximum GitHub API request rate (None for no cap)",
+        gt=0,
+    )
 
     # Text processing configuration
     max_text_length: int = Field(
@@ -158,6 +192,12 @@ class Config(BaseSettings):
         ge=0,
         le=10,
     )
+    llm_concurrency: int = Field(
+        default=4,
+        description="Concurrent summarization requests (match Ollama's OLLAMA_NUM_PARALLEL)",
+        ge=1,
+        le=32,
+    )
     summarization_max_tokens: int = Field(
         default=4000,
         description="Maximum tokens for issue text in summarization (rough estimate: 4 chars/token)",
@@ -242,8 +282,13 @@ class Config(BaseSettings):
     @field_validator("output_dir", "data_dir", "persona_dir")
     @classmethod
     def resolve_path(cls, v: Path) -> Path:
-        """Resolve paths to absolute paths."""
-        return v.resolve()
+        """
+        Make paths absolute and normalized.
+
+        os.path.abspath is pure string work plus one getcwd; Path.resolve would also
+        stat every component to follow symlinks, which these directories don't need.
+        """
+        return Path(os.path.abspath(v))
 
     @model_validator(mode="after")
     def validate_weights(self) -> "Config":
@@ -266,10 +311,10 @@ class Config(BaseSettings):
         """Get the full Ollama API base URL."""
         return f"{self.ollama_host}:{self.ollama_port}"
 
-    def ensure_directories(self) -> None:
-        """Create all configured directories if they don't exist."""
-        for directory in [self.output_dir, self.data_dir, self.persona_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
+    def ensure_directories(self, *extra: Path) -> None:
+        """Create all configured directories, plus any extra ones, if they don't exist."""
+        for directory in (self.output_dir, self.data_dir, self.persona_dir, *extra):
+            ensure_directory(directory)
 
 
 def load_config(
@@ -286,6 +331,8 @@ def load_config(
     github_per_page: int | None = None,
     github_max_retries: int | None = None,
     github_issue_limit: int | None = None,
+    github_rate_limit_buffer: int | None = None,
+    github_max_requests_per_second: float | None = None,
     max_text_length: int | None = None,
     noise_filter_enabled: bool | None = None,
     support_filter_enabled: bool | None = None,
@@ -298,45 +345,7 @@ def load_config(
 
     CLI arguments override environment variables and config file values.
     """
-    # Build kwargs explicitly to maintain type safety
-    kwargs: dict[str, str | int | Path | bool] = {}
-    if github_repo is not None:
-        kwargs["github_repo"] = github_repo
-    if github_token is not None:
-        kwargs["github_token"] = github_token
-    if ollama_host is not None:
-        kwargs["ollama_host"] = ollama_host
-    if ollama_port is not None:
-        kwargs["ollama_port"] = ollama_port
-    if model_innovator is not None:
-        kwargs["model_innovator"] = model_innovator
-    if model_critic is not None:
-        kwargs["model_critic"] = model_critic
-    if model_grouping is not None:
-        kwargs["model_grouping"] = model_grouping
-    if model_summarizing is not None:
-        kwargs["model_summarizing"] = model_summarizing
-    if batch_size is not None:
-        kwargs["batch_size"] = batch_size
-    if max_workers is not None:
-        kwargs["max_workers"] = max_workers
-    if github_per_page is not None:
-        kwargs["github_per_page"] = github_per_page
-    if github_max_retries is not None:
-        kwargs["github_max_retries"] = github_max_retries
-    if github_issue_limit is not None:
-        kwargs["github_issue_limit"] = github_issue_limit
-    if max_text_length is not None:
-        kwargs["max_text_length"] = max_text_length
-    if noise_filter_enabled is not None:
-        kwargs["noise_filter_enabled"] = noise_filter_enabled
-    if support_filter_enabled is not None:
-        kwargs["support_filter_enabled"] = support_filter_enabled
-    if output_dir is not None:
-        kwargs["output_dir"] = output_dir
-    if data_dir is not None:
-        kwargs["data_dir"] = data_dir
-    if persona_dir is not None:
-        kwargs["persona_dir"] = persona_dir
-
-    return Config(**kwargs)  # type: ignore[arg-type]
+    # Every parameter names a Config field; None means "not given, use env/.env".
+    # locals() holds exactly the parameters here, so collect them in one pass.
+    overrides = {name: value for name, value in locals().items() if value is not None}
+    return Config(**overrides)
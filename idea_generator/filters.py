@@ -92,37 +92,20 @@ def rank_clusters(
     if not clusters:
         return []
 
-    # Compute scores for all clusters
-    scored_clusters = [
-        (
+    def sort_key(cluster: T) -> tuple[float, float, float, str]:
+        # Score inside the key: sorted() calls it exactly once per cluster, so no
+        # (cluster, score) pairs need to be built and unpacked again
+        score = compute_composite_score(
             cluster,
-            compute_composite_score(
-                cluster,
-                weight_novelty=weight_novelty,
-                weight_feasibility=weight_feasibility,
-                weight_desirability=weight_desirability,
-                weight_attention=weight_attention,
-            ),
+            weight_novelty=weight_novelty,
+            weight_feasibility=weight_feasibility,
+            weight_desirability=weight_desirability,
+            weight_attention=weight_attention,
         )
-        for cluster in clusters
-    ]
-
-    # Sort with deterministic tie-breaking
-    # Primary: composite score (descending)
-    # Secondary: desirability (descending)
-    # Tertiary: feasibility (descending)
-    # Quaternary: title (ascending)
-    sorted_clusters = sorted(
-        scored_clusters,
-        key=lambda x: (
-            -x[1],  # Negative for descending composite score
-            -x[0].desirability,  # Negative for descending desirability
-            -x[0].feasibility,  # Negative for descending feasibility
-            x[0].representative_title,  # Ascending for consistent ordering
-        ),
-    )
+        # Composite score and tie-breakers descending, then title ascending
+        return (-score, -cluster.desirability, -cluster.feasibility, cluster.representative_title)
 
-    return [cluster for cluster, _ in sorted_clusters]
+    return sorted(clusters, key=sort_key)
 
 
 def add_composite_scores(
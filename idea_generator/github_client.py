@@ -27,13 +27,18 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import hashlib
 import json
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Any
 
 import httpx
 
+from .config import ensure_directory
+
 
 class GitHubAPIError(Exception):
     """Exception raised when GitHub API requests fail."""
@@ -41,6 +46,231 @@ class GitHubAPIError(Exception):
     pass
 
 
+# Issues plus their first page of comments, newest activity first. Labels beyond the
+# first 100 and reactions are flattened into the REST shapes by _issue_from_graphql.
+_ISSUES_WITH_COMMENTS_QUERY = """
+query($owner: String!, $name: String!, $first: Int!, $after: String,
+      $states: [IssueState!], $since: DateTime) {
+  rateLimit { cost remaining resetAt }
+  repository(owner: $owner, name: $name) {
+    issues(states: $states, filterBy: {since: $since}, first: $first, after: $after,
+           orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id databaseId number title body state url createdAt updatedAt
+        author { login }
+        labels(first: 100) { nodes { name } }
+        reactionGroups { content reactors { totalCount } }
+        comments(first: 100) {
+          pageInfo { hasNextPage endCursor }
+          nodes {
+            databaseId body createdAt
+            author { login }
+            reactionGroups { content reactors { totalCount } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Follow-up page for the rare issue with more than 100 comments
+_ISSUE_COMMENTS_QUERY = """
+query($id: ID!, $after: String) {
+  rateLimit { cost remaining resetAt }
+  node(id: $id) {
+    ... on Issue {
+      comments(first: 100, after: $after) {
+        pageInfo { hasNextPage endCursor }
+        nodes {
+          databaseId body createdAt
+          author { login }
+          reactionGroups { content reactors { totalCount } }
+        }
+      }
+    }
+  }
+}
+"""
+
+# REST issue state filters mapped to GraphQL IssueState lists
+_GRAPHQL_ISSUE_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": ["OPEN", "CLOSED"]}
+
+# GraphQL reaction enum values mapped to REST reaction keys
+_GRAPHQL_REACTION_KEYS = {
+    "THUMBS_UP": "+1",
+    "THUMBS_DOWN": "-1",
+    "LAUGH": "laugh",
+    "HOORAY": "hooray",
+    "CONFUSED": "confused",
+    "HEART": "heart",
+    "ROCKET": "rocket",
+    "EYES": "eyes",
+}
+
+# Issues per GraphQL page; 50 issues x 100 comments stays well within node limits
+GRAPHQL_ISSUES_PAGE_SIZE = 50
+
+
+def _reactions_from_graphql(node: dict[str, Any]) -> dict[str, int]:
+    """Convert GraphQL reaction groups to a REST-style reactions object."""
+    return {
+        _GRAPHQL_REACTION_KEYS[group["content"]]: group["reactors"]["totalCount"]
+        for group in node.get("reactionGroups") or []
+        if group["content"] in _GRAPHQL_REACTION_KEYS
+    }
+
+
+def _user_from_graphql(node: dict[str, Any]) -> dict[str, Any] | None:
+    """Convert a GraphQL author (None for deleted accounts) to a REST-style user."""
+    author = node.get("author")
+    return {"login": author["login"]} if author else None
+
+
+def _comment_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL issue comment node to the REST comment shape."""
+    return {
+        "id": node["databaseId"],
+        "user": _user_from_graphql(node),
+        "body": node.get("body"),
+        "created_at": node["createdAt"],
+        "reactions": _reactions_from_graphql(node),
+    }
+
+
+def _issue_from_graphql(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL issue node to the REST issue shape."""
+    return {
+        "id": node["databaseId"],
+        "number": node["number"],
+        "title": node.get("title", ""),
+        "body": node.get("body"),
+        "state": node["state"].lower(),
+        "html_url": node["url"],
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "labels": [{"name": label["name"]} for label in node["labels"]["nodes"]],
+        "user": _user_from_graphql(node),
+        "reactions": _reactions_from_graphql(node),
+    }
+
+
+def _recency_key(issue: dict[str, Any]) -> tuple[str, int]:
+    """
+    Sort key for newest-first issue ordering (use with reverse=True).
+
+    - updated_at: Most recently updated issues first
+    - issue_number: When timestamps match, higher numbers (newer issues) first
+    - Missing timestamps use epoch date to sort to end
+
+    GitHub issue numbers increment sequentially, so higher numbers = newer issues.
+    """
+    return issue.get("updated_at", "1970-01-01T00:00:00Z"), issue.get("number", 0)
+
+
+def _issues_cache_key(
+    owner: str, repo: str, state: str, limit: int | None, since: str | None
+) -> str:
+    """
+    Build the raw-response cache name for an issue listing.
+
+    Incremental listings share one name without the timestamp, so each run
+    overwrites the previous dump instead of leaving a new file behind.
+    """
+    cache_key = f"{owner}_{repo}_issues_{state}"
+    if limit:
+        cache_key += f"_limit{limit}"
+    if since:
+        cache_key += "_since"
+    return cache_key
+
+
+def _has_next_page(headers: Any) -> bool | None:
+    """Read pagination from the Link header; None when the response carries no Link header."""
+    link = headers.get("Link")
+    if not isinstance(link, str):
+        return None
+    return 'rel="next"' in link
+
+
+def _int_header(headers: Any, name: str) -> int | None:
+    """Parse an integer response header, returning None if absent or malformed."""
+    value = headers.get(name)
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class _Quota:
+    """Last reported state of one GitHub rate-limit resource (e.g. core or graphql)."""
+
+    def __init__(self) -> None:
+        self.remaining: int | None = None
+        self.limit: int | None = None
+        self.reset_at: float | None = None
+
+
+class _RateLimiter:
+    """
+    Client-side request pacing driven by GitHub's X-RateLimit-* response headers.
+
+    Requests run freely while the reported quota stays above the buffer. Once it
+    drops to the buffer, callers wait for the window to reset instead of running
+    into 403 responses. REST and GraphQL draw on separate quotas, so each
+    X-RateLimit-Resource is tracked on its own. An optional requests-per-second
+    cap spaces out request starts across all resources.
+    """
+
+    def __init__(self, buffer: int, max_requests_per_second: float | None) -> None:
+        self.buffer = max(buffer, 0)
+        self.min_interval = 1.0 / max_requests_per_second if max_requests_per_second else 0.0
+        self.quotas: dict[str, _Quota] = {}
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, resource: str = "core") -> None:
+        """Block until the next request against the given resource may start."""
+        with self._lock:
+            quota = self.quotas.setdefault(resource, _Quota())
+            now = time.time()
+            start = max(now, self._next_start)
+            # Small quotas (60/hour unauthenticated) keep at most 10% in reserve
+            buffer = min(self.buffer, quota.limit // 10) if quota.limit else self.buffer
+            if (
+                quota.remaining is not None
+                and quota.reset_at is not None
+                and quota.remaining <= buffer
+                and quota.reset_at > start
+            ):
+                # Quota refills at the reset; the next response reports the new window
+                start = quota.reset_at + 1
+                quota.remaining = None
+            elif quota.remaining is not None:
+                # Count requests in flight until their responses report the real value
+                quota.remaining -= 1
+            self._next_start = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def update(self, headers: Any, resource: str = "core") -> None:
+        """Record the quota reported by a response to a request against the resource."""
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        reset_at = _int_header(headers, "X-RateLimit-Reset")
+        if remaining is None or reset_at is None:
+            return
+        # Trust the resource GitHub reports over the one the request was made for
+        resource = headers.get("X-RateLimit-Resource") or resource
+        with self._lock:
+            quota = self.quotas.setdefault(resource, _Quota())
+            quota.remaining = remaining
+            quota.reset_at = float(reset_at)
+            quota.limit = _int_header(headers, "X-RateLimit-Limit")
+
+
 class GitHubClient:
     """
     GitHub API client with pagination, rate limiting, and caching support.
@@ -52,6 +282,9 @@ class GitHubClient:
         per_page: int = 100,
         max_retries: int = 3,
         cache_dir: Path | None = None,
+        max_connections: int = 20,
+        rate_limit_buffer: int = 100,
+        max_requests_per_second: float | None = None,
     ):
         """
         Initialize GitHub API client.
@@ -61,15 +294,34 @@ class GitHubClient:
             per_page: Number of items per page (1-100)
             max_retries: Maximum number of retries for failed requests
             cache_dir: Directory to cache raw API responses (None to disable caching)
+            max_connections: Size of the keep-alive connection pool; match this to the
+                number of threads sharing the client so no request pays a new handshake
+            rate_limit_buffer: Remaining quota at which requests wait for the rate-limit reset
+            max_requests_per_second: Optional cap on the request rate (None for no cap)
         """
         self.base_url = "https://api.github.com"
         self.token = token
         self.per_page = min(max(per_page, 1), 100)
         self.max_retries = max_retries
         self.cache_dir = cache_dir
+        self.max_connections = max(max_connections, 1)
+        self.rate_limiter = _RateLimiter(rate_limit_buffer, max_requests_per_second)
+        self.graphql_cost = 0
+
+        # ETag validators for conditional GETs; a 304 reply costs no rate-limit quota
+        self.etag_dir = self.cache_dir / "etags" if self.cache_dir else None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache_stats_lock = threading.Lock()
 
         if self.cache_dir:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            ensure_directory(self.cache_dir)
+        # Index stored validators once so cache misses never touch the filesystem
+        self._etag_names: set[str] = set()
+        if self.etag_dir:
+            ensure_directory(self.etag_dir)
+            with os.scandir(self.etag_dir) as entries:
+                self._etag_names = {entry.name for entry in entries if entry.is_file()}
 
         # Setup headers
         self.headers = {
@@ -79,7 +331,14 @@ class GitHubClient:
         if self.token:
             self.headers["Authorization"] = f"Bearer {self.token}"
 
-        self.client = httpx.Client(headers=self.headers, timeout=30.0, follow_redirects=True)
+        # One pooled client for every request; keep all connections alive between calls
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
+        self.client = httpx.Client(
+            headers=self.headers, timeout=30.0, follow_redirects=True, limits=limits
+        )
 
     def __enter__(self) -> "GitHubClient":
         """Context manager entry."""
@@ -98,16 +357,53 @@ class GitHubClient:
         if not self.cache_dir:
             return
 
+        # Compact output lets json use its C encoder (indent forces the pure-Python
+        # one), and a single write avoids json.dump's per-chunk writes
         cache_file = self.cache_dir / f"{cache_key}.json"
         with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write(json.dumps(data, ensure_ascii=False))
+
+    def _etag_path(self, url: str, params: dict[str, Any] | None) -> Path | None:
+        """
+        Return the validator file for a GET request, or None if it is not cached.
+
+        Incremental requests carry a new `since` timestamp every run, so their URLs
+        never repeat; storing them would only leave an orphaned file per run.
+        """
+        if not self.etag_dir or (params and "since" in params):
+            return None
+        request_url = str(httpx.URL(url, params=params))
+        return self.etag_dir / f"{hashlib.sha256(request_url.encode('utf-8')).hexdigest()}.json"
+
+    def _load_etag_entry(self, etag_path: Path | None) -> tuple[str, Any, bool | None] | None:
+        """Load a stored (etag, body, has_next) entry, ignoring missing or unreadable ones."""
+        if etag_path is None or etag_path.name not in self._etag_names:
+            return None
+        try:
+            with open(etag_path, encoding="utf-8") as f:
+                entry = json.load(f)
+            return entry["etag"], entry["body"], entry.get("has_next")
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store_etag_entry(
+        self, etag_path: Path | None, etag: Any, body: Any, has_next: bool | None
+    ) -> None:
+        """Persist a response body with its ETag so the next run can revalidate it."""
+        with self._cache_stats_lock:
+            self.cache_misses += 1
+        if etag_path is None or not isinstance(etag, str):
+            return
+        with open(etag_path, "w", encoding="utf-8") as f:
+            json.dump({"etag": etag, "body": body, "has_next": has_next}, f, ensure_ascii=False)
+        self._etag_names.add(etag_path.name)
 
     def _request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
-        retry_count: int = 0,
+        json_body: dict[str, Any] | None = None,
     ) -> dict[str, Any] | list[Any]:
         """
         Make a request to the GitHub API with retry logic.
@@ -116,7 +412,7 @@ class GitHubClient:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint (e.g., "/repos/owner/repo/issues")
             params: Query parameters
-            retry_count: Current retry attempt number
+            json_body: JSON request body (e.g., a GraphQL query)
 
         Returns:
             JSON response data
@@ -124,69 +420,118 @@ class GitHubClient:
         Raises:
             GitHubAPIError: If request fails after all retries
         """
-        url = f"{self.base_url}{endpoint}"
+        return self._send(method, endpoint, params, json_body)[0]
 
-        try:
-            response = self.client.request(method, url, params=params)
-
-            # Handle rate limiting with exponential backoff
-            if response.status_code == 403:
-                # Check if it's a rate limit error using headers
-                rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
-                is_rate_limited = (
-                    rate_limit_remaining == "0" or "rate limit" in response.text.lower()
-                )
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any] | list[Any], bool | None]:
+        """
+        Make a request to the GitHub API with retry logic and report pagination.
 
-                if is_rate_limited and retry_count < self.max_retries:
-                    # Use Retry-After header if available, otherwise exponential backoff
-                    retry_after_header = response.headers.get("Retry-After")
-                    if retry_after_header:
-                        try:
-                            retry_after = int(retry_after_header)
-                        except ValueError:
-                            retry_after = 60
-                    else:
-                        retry_after = 60
-
-                    wait_time = min(retry_after, 2 ** (retry_count + 1))
-                    time.sleep(wait_time)
-                    return self._request(method, endpoint, params, retry_count + 1)
-                elif is_rate_limited:
-                    raise GitHubAPIError("Rate limit exceeded and max retries reached")
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint (e.g., "/repos/owner/repo/issues")
+            params: Query parameters
+            json_body: JSON request body (e.g., a GraphQL query)
+
+        Returns:
+            Tuple of (JSON response data, whether the Link header announces a next page;
+            None when the response has no Link header)
+
+        Raises:
+            GitHubAPIError: If request fails after all retries
+        """
+        url = f"{self.base_url}{endpoint}"
+        rate_limit_resource = "graphql" if endpoint == "/graphql" else "core"
+
+        # Revalidate previously downloaded GET responses instead of refetching them
+        etag_path = self._etag_path(url, params) if method == "GET" else None
+        etag_entry = self._load_etag_entry(etag_path)
+        headers = {"If-None-Match": etag_entry[0]} if etag_entry else None
 
-            # Handle other errors with exponential backoff
-            if response.status_code >= 500:
+        # Retry in a loop rather than by recursion: one frame however many attempts
+        retry_count = 0
+        while True:
+            try:
+                self.rate_limiter.acquire(rate_limit_resource)
+                response = self.client.request(
+                    method, url, params=params, json=json_body, headers=headers
+                )
+                self.rate_limiter.update(response.headers, rate_limit_resource)
+
+                if response.status_code == 304 and etag_entry is not None:
+                    with self._cache_stats_lock:
+                        self.cache_hits += 1
+                    cached_response: dict[str, Any] | list[Any] = etag_entry[1]
+                    return cached_response, etag_entry[2]
+
+                # Handle rate limiting (403 for primary limits, 403 or 429 for secondary limits)
+                if response.status_code in (403, 429):
+                    # Check if it's a rate limit error using headers
+                    rate_limit_remaining = response.headers.get("X-RateLimit-Remaining")
+                    is_rate_limited = (
+                        response.status_code == 429
+                        or rate_limit_remaining == "0"
+                        or "rate limit" in response.text.lower()
+                    )
+
+                    if is_rate_limited and retry_count < self.max_retries:
+                        # Honour Retry-After when given, otherwise back off exponentially.
+                        # An exhausted primary quota also makes the limiter wait for the reset.
+                        retry_after = _int_header(response.headers, "Retry-After")
+                        wait_time = (
+                            retry_after if retry_after is not None else 2 ** (retry_count + 1)
+                        )
+                        time.sleep(wait_time)
+                        retry_count += 1
+                        continue
+                    elif is_rate_limited:
+                        raise GitHubAPIError("Rate limit exceeded and max retries reached")
+
+                # Handle other errors with exponential backoff
+                if response.status_code >= 500:
+                    if retry_count < self.max_retries:
+                        wait_time = 2 ** (retry_count + 1)
+                        time.sleep(wait_time)
+                        retry_count += 1
+                        continue
+                    raise GitHubAPIError(
+                        f"Server error {response.status_code} after {self.max_retries} retries"
+                    )
+
+                # Handle 410 Gone (deleted content) gracefully
+                if response.status_code == 410:
+                    return {}, False
+
+                # Raise for other client errors
+                if response.status_code >= 400:
+                    try:
+                        error_data = response.json() if response.text else {}
+                        message = error_data.get("message", response.text)
+                    except (json.JSONDecodeError, ValueError):
+                        message = response.text or f"HTTP {response.status_code}"
+                    raise GitHubAPIError(f"GitHub API error {response.status_code}: {message}")
+
+                response.raise_for_status()
+                json_response: dict[str, Any] | list[Any] = response.json()
+                has_next = _has_next_page(response.headers)
+                if etag_path is not None:
+                    self._store_etag_entry(
+                        etag_path, response.headers.get("ETag"), json_response, has_next
+                    )
+                return json_response, has_next
+
+            except httpx.RequestError as e:
                 if retry_count < self.max_retries:
                     wait_time = 2 ** (retry_count + 1)
                     time.sleep(wait_time)
-                    return self._request(method, endpoint, params, retry_count + 1)
-                raise GitHubAPIError(
-                    f"Server error {response.status_code} after {self.max_retries} retries"
-                )
-
-            # Handle 410 Gone (deleted content) gracefully
-            if response.status_code == 410:
-                return {}
-
-            # Raise for other client errors
-            if response.status_code >= 400:
-                try:
-                    error_data = response.json() if response.text else {}
-                    message = error_data.get("message", response.text)
-                except (json.JSONDecodeError, ValueError):
-                    message = response.text or f"HTTP {response.status_code}"
-                raise GitHubAPIError(f"GitHub API error {response.status_code}: {message}")
-
-            response.raise_for_status()
-            json_response: dict[str, Any] | list[Any] = response.json()
-            return json_response
-
-        except httpx.RequestError as e:
-            if retry_count < self.max_retries:
-                wait_time = 2 ** (retry_count + 1)
-                time.sleep(wait_time)
-                return self._request(method, endpoint, params, retry_count + 1)
-            raise GitHubAPIError(f"Request failed after {self.max_retries} retries: {e}") from e
+                    retry_count += 1
+                    continue
+                raise GitHubAPIError(f"Request failed after {self.max_retries} retries: {e}") from e
 
     def _paginate(
         self, endpoint: str, params: dict[str, Any] | None = None, limit: int | None = None
@@ -209,7 +554,7 @@ class GitHubClient:
         all_items: list[dict[str, Any]] = []
 
         while True:
-            response = self._request("GET", endpoint, params)
+            response, has_next = self._send("GET", endpoint, params)
 
             if isinstance(response, list):
                 items = response
@@ -228,8 +573,12 @@ class GitHubClient:
                 all_items = all_items[:limit]
                 break
 
-            # Check if there are more pages
-            if len(items) < self.per_page:
+            # Follow the Link header when GitHub sends one: it omits rel="next" on the
+            # last page, saving a request when that page happens to be full. Without a
+            # Link header, a short page marks the end.
+            if has_next is None:
+                has_next = len(items) >= self.per_page
+            if not has_next:
                 break
 
             params["page"] += 1
@@ -237,7 +586,12 @@ class GitHubClient:
         return all_items
 
     def fetch_issues(
-        self, owner: str, repo: str, state: str = "open", limit: int | None = None
+        self,
+        owner: str,
+        repo: str,
+        state: str = "open",
+        limit: int | None = None,
+        since: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch issues from a repository, sorted by most recently updated.
@@ -247,6 +601,7 @@ class GitHubClient:
             repo: Repository name
             state: Issue state filter (open, closed, all)
             limit: Maximum number of issues to return (None for no limit)
+            since: Only return issues updated at or after this ISO 8601 timestamp
 
         Returns:
             List of issue data dictionaries, sorted by updated_at descending
@@ -254,35 +609,128 @@ class GitHubClient:
         endpoint = f"/repos/{owner}/{repo}/issues"
         # Sort by updated (most recent first) for recency preference
         params = {"state": state, "sort": "updated", "direction": "desc"}
+        if since:
+            # Filtered server-side, so unchanged issues cost no requests
+            params["since"] = since
 
         issues = self._paginate(endpoint, params, limit=limit)
 
         # Cache the raw response
         if self.cache_dir:
-            cache_key = f"{owner}_{repo}_issues_{state}"
-            if limit:
-                cache_key += f"_limit{limit}"
-            self._cache_response(cache_key, issues)
+            self._cache_response(_issues_cache_key(owner, repo, state, limit, since), issues)
 
         # Filter out pull requests (they appear in the issues endpoint)
         filtered_issues = [issue for issue in issues if "pull_request" not in issue]
 
-        # Apply deterministic tiebreaker for identical timestamps
-        # Sort by (updated_at, issue_number) both descending
-        # - updated_at: Most recently updated issues first
-        # - issue_number: When timestamps match, higher numbers (newer issues) first
-        # - Missing timestamps use epoch date to sort to end
-        # Note: GitHub issue numbers increment sequentially, so higher numbers = newer issues
-        filtered_issues.sort(
-            key=lambda x: (
-                x.get("updated_at", "1970-01-01T00:00:00Z"),
-                x.get("number", 0),
-            ),
-            reverse=True,
-        )
+        # Sort by (updated_at, issue_number) both descending; the issue number is a
+        # deterministic tiebreaker for identical timestamps
+        filtered_issues.sort(key=_recency_key, reverse=True)
 
         return filtered_issues
 
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Run a GraphQL query and return its data, accumulating the reported query cost.
+
+        Raises:
+            GitHubAPIError: If the request fails or the response contains errors
+        """
+        response = self._request(
+            "POST", "/graphql", json_body={"query": query, "variables": variables}
+        )
+        if not isinstance(response, dict):
+            raise GitHubAPIError("Unexpected GraphQL response")
+        if response.get("errors"):
+            messages = "; ".join(error.get("message", "") for error in response["errors"])
+            raise GitHubAPIError(f"GitHub GraphQL error: {messages}")
+
+        data: dict[str, Any] = response.get("data") or {}
+        rate_limit = data.get("rateLimit")
+        if rate_limit:
+            self.graphql_cost += rate_limit.get("cost", 0)
+        return data
+
+    def fetch_issues_with_comments(
+        self,
+        owner: str,
+        repo: str,
+        limit: int | None = None,
+        state: str = "open",
+        since: str | None = None,
+    ) -> list[tuple[dict[str, Any], list[dict[str, Any]]]]:
+        """
+        Fetch issues together with their comments via the GraphQL API.
+
+        One query returns a page of issues and the first 100 comments of each, replacing
+        one REST call per issue. Results use the same dictionary shapes as fetch_issues
+        and fetch_issue_comments. GraphQL requires an authentication token.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            limit: Maximum number of issues to return (None for no limit)
+            state: Issue state filter (open, closed, all)
+            since: Only return issues updated at or after this ISO 8601 timestamp
+
+        Returns:
+            List of (issue data, comment data list) tuples, sorted by updated_at descending
+
+        Raises:
+            GitHubAPIError: If the repository is not accessible or a query fails
+        """
+        issues_with_comments: list[tuple[dict[str, Any], list[dict[str, Any]]]] = []
+        cursor: str | None = None
+
+        while True:
+            page_size = GRAPHQL_ISSUES_PAGE_SIZE
+            if limit is not None:
+                page_size = min(page_size, limit - len(issues_with_comments))
+            data = self._graphql(
+                _ISSUES_WITH_COMMENTS_QUERY,
+                {
+                    "owner": owner,
+                    "name": repo,
+                    "first": page_size,
+                    "after": cursor,
+                    "states": _GRAPHQL_ISSUE_STATES[state],
+                    "since": since,
+                },
+            )
+            repository = data.get("repository")
+            if repository is None:
+                raise GitHubAPIError(f"Repository '{owner}/{repo}' not found or not accessible")
+
+            issues = repository["issues"]
+            for node in issues["nodes"]:
+                comments_page = node["comments"]
+                comments = [_comment_from_graphql(c) for c in comments_page["nodes"]]
+                while comments_page["pageInfo"]["hasNextPage"]:
+                    comments_data = self._graphql(
+                        _ISSUE_COMMENTS_QUERY,
+                        {"id": node["id"], "after": comments_page["pageInfo"]["endCursor"]},
+                    )
+                    comments_page = comments_data["node"]["comments"]
+                    comments.extend(_comment_from_graphql(c) for c in comments_page["nodes"])
+                issues_with_comments.append((_issue_from_graphql(node), comments))
+
+            if limit is not None and len(issues_with_comments) >= limit:
+                break
+            if not issues["pageInfo"]["hasNextPage"]:
+                break
+            cursor = issues["pageInfo"]["endCursor"]
+
+        # Cache the converted response
+        if self.cache_dir:
+            self._cache_response(
+                _issues_cache_key(owner, repo, f"{state}_graphql", limit, since),
+                [{**issue, "comments": comments} for issue, comments in issues_with_comments],
+            )
+
+        # Same ordering and tiebreaker as fetch_issues
+        issues_with_comments.sort(key=lambda pair: _recency_key(pair[0]), reverse=True)
+
+        return issues_with_comments
+
     def fetch_issue_comments(
         self, owner: str, repo: str, issue_number: int
     ) -> list[dict[str, Any]]:
@@ -53,6 +53,7 @@ class OllamaClient:
         max_retries: int = 3,
         retry_delay: float = 1.0,
         transport: httpx.HTTPTransport | None = None,
+        max_connections: int = 20,
     ) -> None:
         """
         Initialize Ollama client.
@@ -63,17 +64,25 @@ class OllamaClient:
             max_retries: Maximum number of retry attempts (default: 3)
             retry_delay: Initial delay between retries in seconds (default: 1.0)
             transport: Optional HTTP transport for dependency injection (testing)
+            max_connections: Size of the keep-alive connection pool; match this to the
+                number of concurrent generate calls sharing the client
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_connections = max(max_connections, 1)
 
-        # Create HTTP client with optional transport injection
+        # One pooled client for the client's lifetime, with optional transport injection
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+        )
         self.client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
             transport=transport,
+            limits=limits,
         )
 
     def __enter__(self) -> "OllamaClient":
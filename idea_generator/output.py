@@ -16,19 +16,175 @@ Output generation for idea reports.
 
 This module provides:
 - JSON report generation with complete cluster data
+- Streaming JSON array writing and loading for model collections
 - Markdown report generation for top-ranked ideas
 - Functions to generate human-readable summaries
 """
 
 import json
 import logging
+import os
+import re
+from collections.abc import Iterable, Iterator
+from functools import cache
 from pathlib import Path
+from typing import Any, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
 
 from .filters import add_composite_scores, compute_composite_score
 from .models import IdeaCluster, NormalizedIssue
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Read size used when streaming JSON arrays from disk
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+# Encodes the scored report dicts in one pydantic-core call (same layout as json.dump
+# with indent=2, non-ASCII kept as UTF-8)
+_REPORT_ADAPTER: TypeAdapter[list[dict[str, Any]]] = TypeAdapter(list[dict[str, Any]])
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def write_json_array(
+    items: Iterable[BaseModel], output_path: Path, indent: int | None = None
+) -> int:
+    """
+    Write models to a JSON array file, one serialized item at a time.
+
+    Items are serialized and written one at a time, so neither an intermediate
+    list of dicts nor a whole-document string is held in memory. The array is
+    written to a temporary file beside output_path and moved into place only once
+    complete, so an interrupted write never leaves a truncated artifact behind
+    (pipeline stages treat an existing file as finished work).
+
+    Args:
+        items: Models to serialize (any iterable, including generators)
+        output_path: Path to write the JSON file
+        indent: Indentation for each item (None writes one compact item per line)
+
+    Returns:
+        Number of items written
+    """
+    count = 0
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for item in items:
+                f.write(",\n" if count else "\n")
+                f.write(item.model_dump_json(indent=indent))
+                count += 1
+            f.write("\n]\n")
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def read_json_array(input_path: Path, model: type[ModelT]) -> list[ModelT]:
+    """
+    Load a JSON array file (such as one written by write_json_array) into models.
+
+    The raw bytes are parsed and validated in one pydantic-core pass, without
+    building an intermediate list of dicts.
+
+    Args:
+        input_path: Path of the JSON file to read
+        model: Model class of the array items
+
+    Returns:
+        Validated models in file order
+
+    Raises:
+        pydantic.ValidationError: If the file is not valid JSON or an item is invalid
+    """
+    with open(input_path, "rb") as f:
+        items: list[ModelT] = _list_adapter(model).validate_json(f.read())
+    return items
+
+
+def iter_json_array(
+    input_path: Path, model: type[ModelT], chunk_size: int = JSON_STREAM_CHUNK_SIZE
+) -> Iterator[ModelT]:
+    """
+    Lazily load a JSON array file, yielding one validated model per item.
+
+    The file is read in chunks and each item is decoded and validated as soon
+    as it is complete, so only the current item (up to twice over, or one chunk)
+    is held in memory and consumers can start work before the whole file is parsed.
+
+    Args:
+        input_path: Path of the JSON file to read
+        model: Model class of the array items
+        chunk_size: Number of characters to read from the file at a time
+
+    Yields:
+        Validated models in file order
+
+    Raises:
+        json.JSONDecodeError: If the file is not a well-formed JSON array
+        pydantic.ValidationError: If an item is invalid
+    """
+    with open(input_path, encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        # Next token expected: "[" to open, an item or "]" after it, an item after
+        # a comma, then a comma or "]" after each item
+        state = "open"
+
+        while True:
+            pos = _JSON_WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+            if pos == len(buffer):
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    raise json.JSONDecodeError("Unexpected end of JSON array", buffer, pos)
+                buffer, pos = buffer[pos:] + chunk, 0
+                continue
+
+            char = buffer[pos]
+            if state == "open":
+                if char != "[":
+                    raise json.JSONDecodeError("Expected a JSON array", buffer, pos)
+                state = "first"
+                pos += 1
+            elif state in ("first", "next") and char == "]":
+                pos += 1
+                break
+            elif state == "next":
+                if char != ",":
+                    raise json.JSONDecodeError("Expected ',' or ']'", buffer, pos)
+                state = "item"
+                pos += 1
+            else:
+                try:
+                    item, pos = _JSON_DECODER.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # The item may just be cut off at the chunk boundary. Read at least
+                    # as much again as is already buffered for it, so an item spanning
+                    # many chunks is re-decoded a logarithmic number of times
+                    chunk = f.read(max(chunk_size, len(buffer) - pos))
+                    if not chunk:
+                        raise
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    continue
+                state = "next"
+                yield model.model_validate(item)
+
+        if (buffer[pos:] + f.read()).strip():
+            raise json.JSONDecodeError("Extra data after JSON array", buffer, pos)
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Build the list validator for a model once per process."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
 
 def generate_json_report(
     clusters: list[IdeaCluster],
@@ -98,8 +254,7 @@ def generate_json_report(
     # Write to file with proper error handling
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(clusters_with_scores, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(_REPORT_ADAPTER.dump_json(clusters_with_scores, indent=2))
     except (OSError, PermissionError) as e:
         raise OSError(f"Failed to write JSON report to {output_path}: {e}") from e
 
@@ -24,16 +24,30 @@ This pipeline:
 
 import json
 import logging
+from functools import cache
+from importlib.resources import files
 from pathlib import Path
 from typing import Any
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from ..llm.client import OllamaClient, OllamaError
 from ..models import IdeaCluster, SummarizedIssue
 
 logger = logging.getLogger(__name__)
 
+# Serialize a whole prompt batch and validate a whole cluster list in one
+# pydantic-core call each
+_SUMMARIES_ADAPTER = TypeAdapter(list[SummarizedIssue])
+_CLUSTERS_ADAPTER = TypeAdapter(list[IdeaCluster])
+
+
+@cache
+def _bundled_system_prompt() -> str:
+    """Read the packaged grouper prompt (cached for the life of the process)."""
+    prompt_file = files("idea_generator.llm.prompts").joinpath("grouper.txt")
+    return prompt_file.read_text(encoding="utf-8")
+
 
 class GroupingError(Exception):
     """Base exception for grouping pipeline errors."""
@@ -53,7 +67,7 @@ class GroupingPipeline:
         self,
         llm_client: OllamaClient,
         model: str,
-        prompt_template_path: Path,
+        prompt_template_path: Path | None = None,
         max_batch_size: int = 20,
         max_batch_chars: int = 50000,
     ) -> None:
@@ -63,7 +77,8 @@ class GroupingPipeline:
         Args:
             llm_client: Configured Ollama client instance
             model: Name of the model to use for grouping
-            prompt_template_path: Path to the system prompt template file
+            prompt_template_path: Path to the system prompt template file (default:
+                the bundled grouper.txt prompt)
             max_batch_size: Maximum number of summaries per batch (default: 20)
             max_batch_chars: Maximum character count per batch (default: 50000)
         """
@@ -72,12 +87,15 @@ class GroupingPipeline:
         self.max_batch_size = max_batch_size
         self.max_batch_chars = max_batch_chars
 
-        # Load system prompt
-        if not prompt_template_path.exists():
-            raise GroupingError(f"Prompt template not found: {prompt_template_path}")
+        # Load system prompt; the bundled one is read once per process
+        if prompt_template_path is None:
+            self.system_prompt = _bundled_system_prompt()
+        else:
+            if not prompt_template_path.exists():
+                raise GroupingError(f"Prompt template not found: {prompt_template_path}")
 
-        with open(prompt_template_path, encoding="utf-8") as f:
-            self.system_prompt = f.read()
+            with open(prompt_template_path, encoding="utf-8") as f:
+                self.system_prompt = f.read()
 
     def _create_batches(self, summaries: list[SummarizedIssue]) -> list[list[SummarizedIssue]]:
         """
@@ -131,15 +149,15 @@ class GroupingPipeline:
         Returns:
             Formatted prompt string
         """
-        # Convert summaries to simplified format for LLM
-        summaries_data = [summary.model_dump(mode="json") for summary in summaries]
+        # Convert summaries to indented JSON for the LLM
+        summaries_json = _SUMMARIES_ADAPTER.dump_json(summaries, indent=2).decode()
 
         prompt = (
             "Analyze the following batch of summarized GitHub issues and group them "
             "into actionable idea clusters. Merge duplicates, split multi-topic issues "
             "as needed, and preserve unique issues as singletons.\n\n"
             f"Input batch ({len(summaries)} issues):\n"
-            f"{json.dumps(summaries_data, indent=2, ensure_ascii=False)}\n\n"
+            f"{summaries_json}\n\n"
             "Respond with ONLY valid JSON following the specified cluster schema."
         )
 
@@ -231,14 +249,11 @@ class GroupingPipeline:
             if not isinstance(clusters_data, list):
                 raise GroupingError("'clusters' field must be a list")
 
-            # Parse each cluster
-            clusters: list[IdeaCluster] = []
-            for cluster_data in clusters_data:
-                try:
-                    cluster = IdeaCluster(**cluster_data)
-                    clusters.append(cluster)
-                except ValidationError as e:
-                    raise GroupingError(f"Invalid cluster data: {e}") from e
+            # Parse all clusters in one pydantic-core call
+            try:
+                clusters = _CLUSTERS_ADAPTER.validate_python(clusters_data)
+            except ValidationError as e:
+                raise GroupingError(f"Invalid cluster data: {e}") from e
 
             # Validate clusters against input
             is_valid, errors = self._validate_clusters(clusters, input_summaries)
@@ -363,11 +378,20 @@ class GroupingPipeline:
                 "attention": 0.0,
             }
 
+        # One pass over the summaries instead of one per metric
+        novelty = feasibility = desirability = attention = 0.0
+        for s in summaries:
+            novelty += s.novelty
+            feasibility += s.feasibility
+            desirability += s.desirability
+            attention += s.attention
+
+        count = len(summaries)
         return {
-            "novelty": round(sum(s.novelty for s in summaries) / len(summaries), 2),
-            "feasibility": round(sum(s.feasibility for s in summaries) / len(summaries), 2),
-            "desirability": round(sum(s.desirability for s in summaries) / len(summaries), 2),
-            "attention": round(sum(s.attention for s in summaries) / len(summaries), 2),
+            "novelty": round(novelty / count, 2),
+            "feasibility": round(feasibility / count, 2),
+            "desirability": round(desirability / count, 2),
+            "attention": round(attention / count, 2),
         }
 
     def group_batch(
@@ -26,15 +26,24 @@ Artifacts are cached to enable resumption after failures.
 
 import json
 import logging
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
 
 from ..cleaning import normalize_github_issue
-from ..config import Config
+from ..config import Config, ensure_directory
 from ..filters import rank_clusters
 from ..github_client import GitHubAPIError, GitHubClient
 from ..llm.client import OllamaClient, OllamaError
 from ..models import IdeaCluster, NormalizedIssue, SummarizedIssue
-from ..output import generate_json_report, generate_markdown_report
+from ..output import (
+    generate_json_report,
+    generate_markdown_report,
+    read_json_array,
+    write_json_array,
+)
 from .grouping import GroupingPipeline
 from .summarize import SummarizationPipeline
 
@@ -99,17 +108,23 @@ class Orchestrator:
                 f"Invalid repository format: {self.config.github_repo}"
             ) from None
 
-        # Stage 1: Ingest issues
-        logger.info("Stage 1: Ingesting issues from GitHub...")
         issues_file = self.config.data_dir / f"{owner}_{repo}_issues.json"
+        summaries_file = self.config.output_dir / f"{owner}_{repo}_summaries.json"
+        summaries: list[SummarizedIssue] | None = None
+
+        # Stage 1: Ingest issues
         if force or not issues_file.exists():
-            issues = self._ingest_issues(owner, repo)
+            issues: list[NormalizedIssue] = []
+            if force or not summaries_file.exists():
+                summaries = self._ingest_and_summarize_issues(owner, repo, issues)
+            else:
+                logger.info("Stage 1: Ingesting issues from GitHub...")
+                issues = self._ingest_issues(owner, repo)
             results["issues_count"] = len(issues)
         else:
+            logger.info("Stage 1: Ingesting issues from GitHub...")
             logger.info(f"Using cached issues from {issues_file}")
-            with open(issues_file, encoding="utf-8") as f:
-                issues_data = json.load(f)
-            issues = [NormalizedIssue(**data) for data in issues_data]
+            issues = read_json_array(issues_file, NormalizedIssue)
             results["issues_count"] = len(issues)
 
         if not issues:
@@ -118,17 +133,14 @@ class Orchestrator:
             return results
 
         # Stage 2: Summarize issues
-        logger.info("Stage 2: Summarizing issues with LLM...")
-        summaries_file = self.config.output_dir / f"{owner}_{repo}_summaries.json"
-        if force or not summaries_file.exists():
-            summaries = self._summarize_issues(issues)
-            results["summaries_count"] = len(summaries)
-        else:
-            logger.info(f"Using cached summaries from {summaries_file}")
-            with open(summaries_file, encoding="utf-8") as f:
-                summaries_data = json.load(f)
-            summaries = [SummarizedIssue(**data) for data in summaries_data]
-            results["summaries_count"] = len(summaries)
+        if summaries is None:
+            logger.info("Stage 2: Summarizing issues with LLM...")
+            if force or not summaries_file.exists():
+                summaries = self._summarize_issues(issues)
+            else:
+                logger.info(f"Using cached summaries from {summaries_file}")
+                summaries = read_json_array(summaries_file, SummarizedIssue)
+        results["summaries_count"] = len(summaries)
 
         if not summaries:
             logger.warning("No summaries generated. Generating empty reports.")
@@ -143,9 +155,7 @@ class Orchestrator:
             results["clusters_count"] = len(clusters)
         else:
             logger.info(f"Using cached clusters from {clusters_file}")
-            with open(clusters_file, encoding="utf-8") as f:
-                clusters_data = json.load(f)
-            clusters = [IdeaCluster(**data) for data in clusters_data]
+            clusters = read_json_array(clusters_file, IdeaCluster)
             results["clusters_count"] = len(clusters)
 
         if not clusters:
@@ -167,7 +177,7 @@ class Orchestrator:
         # Stage 5: Generate reports
         logger.info("Stage 5: Generating reports...")
         reports_dir = self.config.output_dir / "reports"
-        reports_dir.mkdir(exist_ok=True)
+        ensure_directory(reports_dir)
 
         # Generate JSON report
         if not skip_json:
@@ -203,6 +213,50 @@ class Orchestrator:
         logger.info("Pipeline completed successfully!")
         return results
 
+    def _ingest_and_summarize_issues(
+        self, owner: str, repo: str, ingested: list[NormalizedIssue]
+    ) -> list[SummarizedIssue] | None:
+        """
+        Run stages 1 and 2 overlapped, sending each issue to the LLM as soon as it is
+        normalized while comment threads for later issues are still being fetched.
+
+        Ollama is checked before ingest starts. If it is unusable, the issues are
+        ingested and saved on their own first, so a rerun can reuse them. If
+        summarization fails midway, the rest of the ingest is finished and saved
+        before the error is raised.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ingested: List that collects the normalized issues in order
+
+        Returns:
+            Summarized issues, or None if the repository has no issues and Ollama
+            was not needed
+
+        Raises:
+            OrchestratorError: If ingestion or summarization fails
+        """
+        try:
+            summarizer = self._connect_summarizer()
+        except OrchestratorError as e:
+            logger.warning(f"{e}; ingesting issues without summarizing")
+            ingested.extend(self._ingest_issues(owner, repo))
+            if not ingested:
+                return None
+            raise
+
+        logger.info("Stages 1-2: Ingesting issues and summarizing them as they arrive...")
+        stream = self._iter_ingested_issues(owner, repo, ingested)
+        try:
+            return self._summarize_issues(stream, summarizer)
+        except OrchestratorError:
+            # A finished ingest saves its issues file; an ingest that itself failed
+            # is already closed, so this loop does nothing
+            for _ in stream:
+                pass
+            raise
+
     def _ingest_issues(self, owner: str, repo: str) -> list[NormalizedIssue]:
         """
         Ingest issues from GitHub and save to cache.
@@ -214,11 +268,36 @@ class Orchestrator:
         Returns:
             List of normalized issues
 
+        Raises:
+            OrchestratorError: If ingestion fails
+        """
+        ingested: list[NormalizedIssue] = []
+        for _ in self._iter_ingested_issues(owner, repo, ingested):
+            pass
+        return ingested
+
+    def _iter_ingested_issues(
+        self, owner: str, repo: str, ingested: list[NormalizedIssue]
+    ) -> Iterator[NormalizedIssue]:
+        """
+        Ingest issues from GitHub, yielding each one as soon as it is normalized.
+
+        Every yielded issue is also appended to ingested; once the last one has been
+        yielded, the full list is saved to the cache.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            ingested: List that collects the normalized issues in order
+
+        Yields:
+            Normalized issues in GitHub order
+
         Raises:
             OrchestratorError: If ingestion fails
         """
         cache_dir = self.config.data_dir / "cache"
-        cache_dir.mkdir(exist_ok=True)
+        ensure_directory(cache_dir)
 
         try:
             with GitHubClient(
@@ -226,6 +305,9 @@ class Orchestrator:
                 per_page=self.config.github_per_page,
                 max_retries=self.config.github_max_retries,
                 cache_dir=cache_dir,
+                max_connections=self.config.max_workers,
+                rate_limit_buffer=self.config.github_rate_limit_buffer,
+                max_requests_per_second=self.config.github_max_requests_per_second,
             ) as client:
                 # Check repository access
                 if not client.check_repository_access(owner, repo):
@@ -237,32 +319,29 @@ class Orchestrator:
                 )
                 if not issues_data:
                     logger.warning("No open issues found")
-                    return []
-
-                # Normalize issues
-                normalized_issues: list[NormalizedIssue] = []
-                for issue_data in issues_data:
-                    comments = client.fetch_issue_comments(owner, repo, issue_data["number"])
-                    normalized = normalize_github_issue(
-                        issue_data,
-                        comments,
-                        max_text_length=self.config.max_text_length,
-                        noise_filter_enabled=self.config.noise_filter_enabled,
-                        support_filter_enabled=self.config.support_filter_enabled,
+                    return
+
+                # Fetch comment threads concurrently; map yields them in issue order, so
+                # each issue is normalized (and handed on) while later fetches are in flight
+                with ThreadPoolExecutor(max_workers=self.config.max_workers) as executor:
+                    comment_threads = executor.map(
+                        partial(client.fetch_issue_comments, owner, repo),
+                        [issue_data["number"] for issue_data in issues_data],
                     )
-                    normalized_issues.append(normalized)
+                    for issue_data, comments in zip(issues_data, comment_threads, strict=True):
+                        normalized = normalize_github_issue(
+                            issue_data,
+                            comments,
+                            max_text_length=self.config.max_text_length,
+                            noise_filter_enabled=self.config.noise_filter_enabled,
+                            support_filter_enabled=self.config.support_filter_enabled,
+                        )
+                        ingested.append(normalized)
+                        yield normalized
 
                 # Save to cache
                 issues_file = self.config.data_dir / f"{owner}_{repo}_issues.json"
-                with open(issues_file, "w", encoding="utf-8") as f:
-                    json.dump(
-                        [issue.model_dump(mode="json") for issue in normalized_issues],
-                        f,
-                        indent=2,
-                        ensure_ascii=False,
-                    )
-
-                return normalized_issues
+                write_json_array(ingested, issues_file)
 
         except GitHubAPIError as e:
             raise OrchestratorError(f"Failed to ingest issues from GitHub: {e}") from e
@@ -270,12 +349,79 @@ class Orchestrator:
             logger.exception("Unexpected error during issue ingestion")
             raise OrchestratorError(f"Failed to ingest issues: {e.__class__.__name__}: {e}") from e
 
-    def _summarize_issues(self, issues: list[NormalizedIssue]) -> list[SummarizedIssue]:
+    def _connect_summarizer(self) -> tuple[OllamaClient, SummarizationPipeline]:
+        """
+        Connect to Ollama and build the summarization pipeline.
+
+        Returns:
+            The open Ollama client (the caller closes it) and the pipeline using it
+
+        Raises:
+            OrchestratorError: If Ollama is unreachable or the model is missing
+        """
+        llm_client = OllamaClient(
+            base_url=self.config.ollama_base_url,
+            timeout=self.config.llm_timeout,
+            max_retries=self.config.llm_max_retries,
+            max_connections=self.config.llm_concurrency,
+        )
+
+        try:
+            if not llm_client.check_health():
+                raise OrchestratorError(
+                    f"Ollama server not reachable at {self.config.ollama_base_url}"
+                )
+
+            # Validate that the summarization model exists
+            model_name = self.config.model_summarizing
+            if not llm_client.model_exists(model_name):
+                raise OrchestratorError(
+                    f"Summarization model '{model_name}' not found on Ollama server. "
+                    f"Available models: {', '.join(llm_client.list_models()) or 'none'}. "
+                    f"Build the model with: "
+                    f"ollama create {model_name} -f idea_generator/llm/modelfiles/summarizer.Modelfile"
+                )
+
+            pipeline = SummarizationPipeline(
+                llm_client=llm_client,
+                model=model_name,
+                max_tokens=self.config.summarization_max_tokens,
+                cache_dir=self.config.output_dir / "summarization_cache",
+                cache_max_file_size=self.config.cache_max_file_size,
+            )
+        except OrchestratorError:
+            llm_client.close()
+            raise
+        except OllamaError as e:
+            llm_client.close()
+            logger.exception("Ollama error during summarization")
+            raise OrchestratorError(
+                f"Failed to summarize issues due to LLM error: {e.__class__.__name__}: {e}"
+            ) from e
+        except Exception as e:
+            llm_client.close()
+            logger.exception("Unexpected error during summarization")
+            raise OrchestratorError(
+                f"Failed to summarize issues: {e.__class__.__name__}: {e}"
+            ) from e
+
+        return llm_client, pipeline
+
+    def _summarize_issues(
+        self,
+        issues: Iterable[NormalizedIssue],
+        summarizer: tuple[OllamaClient, SummarizationPipeline] | None = None,
+    ) -> list[SummarizedIssue]:
         """
         Summarize issues using LLM and save to cache.
 
+        When issues is a lazy stream (e.g. from _iter_ingested_issues), each issue is
+        sent to the LLM as soon as it is produced.
+
         Args:
-            issues: List of normalized issues
+            issues: Normalized issues, as a list or a lazy stream
+            summarizer: Client and pipeline from _connect_summarizer (connected here
+                when omitted); the client is closed before returning
 
         Returns:
             List of summarized issues
@@ -283,58 +429,31 @@ class Orchestrator:
         Raises:
             OrchestratorError: If summarization fails
         """
-        prompt_path = Path(__file__).parent.parent / "llm" / "prompts" / "summarizer.txt"
-        cache_dir = self.config.output_dir / "summarization_cache"
+        llm_client, pipeline = summarizer or self._connect_summarizer()
 
         try:
-            llm_client = OllamaClient(
-                base_url=self.config.ollama_base_url,
-                timeout=self.config.llm_timeout,
-                max_retries=self.config.llm_max_retries,
+            # An empty stream has nothing to summarize or save
+            issues_iter = iter(issues)
+            first_issue = next(issues_iter, None)
+            if first_issue is None:
+                return []
+
+            summaries = pipeline.summarize_issues(
+                chain([first_issue], issues_iter),
+                skip_cache=False,
+                skip_noise=False,
+                concurrency=self.config.llm_concurrency,
             )
 
-            try:
-                if not llm_client.check_health():
-                    raise OrchestratorError(
-                        f"Ollama server not reachable at {self.config.ollama_base_url}"
-                    )
-
-                # Validate that the summarization model exists
-                model_name = self.config.model_summarizing
-                if not llm_client.model_exists(model_name):
-                    raise OrchestratorError(
-                        f"Summarization model '{model_name}' not found on Ollama server. "
-                        f"Available models: {', '.join(llm_client.list_models()) or 'none'}. "
-                        f"Build the model with: "
-                        f"ollama create {model_name} -f idea_generator/llm/modelfiles/summarizer.Modelfile"
-                    )
-
-                pipeline = SummarizationPipeline(
-                    llm_client=llm_client,
-                    model=model_name,
-                    prompt_template_path=prompt_path,
-                    max_tokens=self.config.summarization_max_tokens,
-                    cache_dir=cache_dir,
-                    cache_max_file_size=self.config.cache_max_file_size,
-                )
-
-                summaries = pipeline.summarize_issues(issues, skip_cache=False, skip_noise=False)
-
-                # Save to cache
-                owner, repo = self.config.github_repo.split("/")
-                summaries_file = self.config.output_dir / f"{owner}_{repo}_summaries.json"
-                with open(summaries_file, "w", encoding="utf-8") as f:
-                    json.dump(
-                        [s.model_dump(mode="json") for s in summaries],
-                        f,
-                        indent=2,
-                        ensure_ascii=False,
-                    )
+            # Save to cache
+            owner, repo = self.config.github_repo.split("/")
+            summaries_file = self.config.output_dir / f"{owner}_{repo}_summaries.json"
+            write_json_array(summaries, summaries_file, indent=2)
 
-                return summaries
-            finally:
-                llm_client.close()
+            return summaries
 
+        except OrchestratorError:
+            raise
         except OllamaError as e:
             logger.exception("Ollama error during summarization")
             raise OrchestratorError(
@@ -345,6 +464,8 @@ class Orchestrator:
             raise OrchestratorError(
                 f"Failed to summarize issues: {e.__class__.__name__}: {e}"
             ) from e
+        finally:
+            llm_client.close()
 
     def _group_summaries(self, summaries: list[SummarizedIssue]) -> list[IdeaCluster]:
         """
@@ -359,8 +480,6 @@ class Orchestrator:
         Raises:
             OrchestratorError: If grouping fails
         """
-        prompt_path = Path(__file__).parent.parent / "llm" / "prompts" / "grouper.txt"
-
         try:
             llm_client = OllamaClient(
                 base_url=self.config.ollama_base_url,
@@ -387,7 +506,6 @@ class Orchestrator:
                 pipeline = GroupingPipeline(
                     llm_client=llm_client,
                     model=model_name,
-                    prompt_template_path=prompt_path,
                     max_batch_size=self.config.grouping_max_batch_size,
                     max_batch_chars=self.config.grouping_max_batch_chars,
                 )
@@ -397,13 +515,7 @@ class Orchestrator:
                 # Save to cache
                 owner, repo = self.config.github_repo.split("/")
                 clusters_file = self.config.output_dir / f"{owner}_{repo}_clusters.json"
-                with open(clusters_file, "w", encoding="utf-8") as f:
-                    json.dump(
-                        [c.model_dump(mode="json") for c in clusters],
-                        f,
-                        indent=2,
-                        ensure_ascii=False,
-                    )
+                write_json_array(clusters, clusters_file, indent=2)
 
                 return clusters
             finally:
@@ -429,7 +541,7 @@ class Orchestrator:
             skip_markdown: If True, skip Markdown report
         """
         reports_dir = self.config.output_dir / "reports"
-        reports_dir.mkdir(exist_ok=True)
+        ensure_directory(reports_dir)
 
         if not skip_json:
             json_path = reports_dir / "ideas.json"
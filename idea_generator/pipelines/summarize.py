@@ -15,26 +15,40 @@
 Summarization pipeline for processing normalized issues through the LLM summarizer persona.
 
 This pipeline:
-1. Loads cleaned issues one at a time (no batching to avoid context ballooning)
+1. Loads cleaned issues one per request (no batching to avoid context ballooning)
 2. Truncates text to fit within configured token limits
 3. Calls the LLM with retry logic
 4. Validates and parses JSON responses
 5. Caches successful summaries by issue ID
 """
 
-import json
 import logging
+import os
+from collections import deque
+from collections.abc import Iterable, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from importlib.resources import files
+from itertools import count
 from pathlib import Path
 from typing import Any
 
 from pydantic import ValidationError
 
+from ..config import ensure_directory
 from ..llm.client import OllamaClient, OllamaError
 from ..models import NormalizedIssue, SummarizedIssue
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _bundled_system_prompt() -> str:
+    """Read the packaged summarizer prompt (cached for the life of the process)."""
+    prompt_file = files("idea_generator.llm.prompts").joinpath("summarizer.txt")
+    return prompt_file.read_text(encoding="utf-8")
+
+
 class SummarizationError(Exception):
     """Base exception for summarization pipeline errors."""
 
@@ -45,15 +59,15 @@ class SummarizationPipeline:
     """
     Pipeline for summarizing normalized issues using the LLM summarizer persona.
 
-    This pipeline processes issues sequentially (one at a time) to avoid context
-    ballooning. Each issue is independently summarized and cached.
+    Each issue is independently summarized and cached in its own LLM request to
+    avoid context ballooning; several requests may be in flight at once.
     """
 
     def __init__(
         self,
         llm_client: OllamaClient,
         model: str,
-        prompt_template_path: Path,
+        prompt_template_path: Path | None = None,
         max_tokens: int = 4000,
         cache_dir: Path | None = None,
         cache_max_file_size: int = 1_000_000,
@@ -64,7 +78,8 @@ class SummarizationPipeline:
         Args:
             llm_client: Configured Ollama client instance
             model: Name of the model to use for summarization
-            prompt_template_path: Path to the system prompt template file
+            prompt_template_path: Path to the system prompt template file (default:
+                the bundled summarizer.txt prompt)
             max_tokens: Maximum tokens for issue text (rough estimate: ~4 chars/token)
             cache_dir: Directory for caching successful summaries (optional)
             cache_max_file_size: Maximum cache file size in bytes (default: 1MB)
@@ -75,16 +90,22 @@ class SummarizationPipeline:
         self.cache_dir = cache_dir
         self.cache_max_file_size = cache_max_file_size
 
-        # Load system prompt
-        if not prompt_template_path.exists():
-            raise SummarizationError(f"Prompt template not found: {prompt_template_path}")
+        # Load system prompt; the bundled one is read once per process
+        if prompt_template_path is None:
+            self.system_prompt = _bundled_system_prompt()
+        else:
+            if not prompt_template_path.exists():
+                raise SummarizationError(f"Prompt template not found: {prompt_template_path}")
 
-        with open(prompt_template_path, encoding="utf-8") as f:
-            self.system_prompt = f.read()
+            with open(prompt_template_path, encoding="utf-8") as f:
+                self.system_prompt = f.read()
 
-        # Ensure cache directory exists
+        # Ensure cache directory exists and index it once, so cache misses need no stat
+        self._cached_names: set[str] = set()
         if self.cache_dir:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            ensure_directory(self.cache_dir)
+            with os.scandir(self.cache_dir) as entries:
+                self._cached_names = {entry.name for entry in entries if entry.is_file()}
 
     def _get_cache_path(self, issue_id: int) -> Path | None:
         """
@@ -123,7 +144,7 @@ class SummarizationPipeline:
             Cached SummarizedIssue or None if not cached
         """
         cache_path = self._get_cache_path(issue_id)
-        if not cache_path or not cache_path.exists():
+        if not cache_path or cache_path.name not in self._cached_names:
             return None
 
         try:
@@ -136,30 +157,11 @@ class SummarizationPipeline:
                 )
                 return None
 
-            with open(cache_path, encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Validate the data structure before creating model
-            if not isinstance(data, dict):
-                logger.warning(f"Invalid cache data type for issue {issue_id}: expected dict")
-                return None
-
-            # Validate required fields exist
-            required_fields = ["issue_id", "source_number", "title", "summary", "raw_issue_url"]
-            missing_fields = [f for f in required_fields if f not in data]
-            if missing_fields:
-                logger.warning(
-                    f"Cache missing required fields for issue {issue_id}: {missing_fields}"
-                )
-                return None
-
-            # Create and return validated model
-            return SummarizedIssue(**data)
+            # Validate straight from the raw bytes; pydantic rejects corrupt JSON,
+            # non-object payloads and missing fields in the same single pass
+            return SummarizedIssue.model_validate_json(cache_path.read_bytes())
 
-        except json.JSONDecodeError as e:
-            logger.warning(f"Corrupted cache JSON for issue {issue_id}: {e}")
-            return None
-        except ValueError as e:
+        except ValidationError as e:
             logger.warning(f"Invalid cache data for issue {issue_id}: {e}")
             return None
         except Exception as e:
@@ -179,7 +181,8 @@ class SummarizationPipeline:
 
         try:
             with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(summary.model_dump(mode="json"), f, indent=2, ensure_ascii=False)
+                f.write(summary.model_dump_json(indent=2))
+            self._cached_names.add(cache_path.name)
         except Exception as e:
             logger.warning(f"Failed to save cache for issue {summary.issue_id}: {e}")
 
@@ -383,40 +386,65 @@ class SummarizationPipeline:
 
     def summarize_issues(
         self,
-        issues: list[NormalizedIssue],
+        issues: Iterable[NormalizedIssue],
         skip_cache: bool = False,
         skip_noise: bool = False,
+        concurrency: int = 1,
     ) -> list[SummarizedIssue]:
         """
-        Summarize multiple issues sequentially.
+        Summarize multiple issues, optionally with several LLM requests in flight.
+
+        Each issue is still summarized in its own request; concurrency only sets
+        how many of those requests Ollama serves at once. Summaries keep the input
+        order regardless of completion order. Issues may come from a lazy iterator,
+        in which case each one is dispatched as soon as it is produced.
 
         Args:
-            issues: List of NormalizedIssues to summarize
+            issues: NormalizedIssues to summarize (a list or any iterable)
             skip_cache: If True, bypass cache and regenerate all summaries
             skip_noise: If True, skip issues already flagged as noise
+            concurrency: Maximum number of concurrent summarization requests
 
         Returns:
             List of SummarizedIssues (may be shorter if some fail)
         """
-        summaries = []
-        failed_count = 0
+        total = f"/{len(issues)}" if isinstance(issues, Sized) else ""
+        failed: list[int] = []
 
-        for i, issue in enumerate(issues, 1):
+        def summarize_one(position: int, issue: NormalizedIssue) -> SummarizedIssue | None:
             # Skip noise if requested
             if skip_noise and issue.is_noise:
-                logger.info(f"[{i}/{len(issues)}] Skipping noise issue #{issue.number}")
-                continue
+                logger.info(f"[{position}{total}] Skipping noise issue #{issue.number}")
+                return None
 
-            logger.info(f"[{i}/{len(issues)}] Processing issue #{issue.number}...")
+            logger.info(f"[{position}{total}] Processing issue #{issue.number}...")
 
             try:
-                summary = self.summarize_issue(issue, skip_cache=skip_cache)
-                summaries.append(summary)
+                return self.summarize_issue(issue, skip_cache=skip_cache)
             except SummarizationError as e:
                 logger.error(f"Failed to summarize issue #{issue.number}: {e}")
-                failed_count += 1
-                continue
+                failed.append(issue.number)
+                return None
 
-        logger.info(f"Summarization complete: {len(summaries)} succeeded, {failed_count} failed")
+        results: list[SummarizedIssue | None] = []
+        if concurrency <= 1 or (isinstance(issues, Sized) and len(issues) <= 1):
+            results.extend(map(summarize_one, count(1), issues))
+        else:
+            # Executor.map would drain the whole iterable up front, so issues are
+            # submitted through a bounded window instead; results are collected in
+            # submission order, so output stays deterministic
+            max_pending = concurrency * 2
+            pending: deque[Future[SummarizedIssue | None]] = deque()
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                for position, issue in enumerate(issues, start=1):
+                    pending.append(executor.submit(summarize_one, position, issue))
+                    if len(pending) >= max_pending:
+                        results.append(pending.popleft().result())
+                while pending:
+                    results.append(pending.popleft().result())
+
+        summaries = [summary for summary in results if summary is not None]
+
+        logger.info(f"Summarization complete: {len(summaries)} succeeded, {len(failed)} failed")
 
         return summaries
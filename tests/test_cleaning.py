@@ -28,19 +28,24 @@ limitations under the License.
 """
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
 from idea_generator.cleaning import (
+    DEDUP_FINGERPRINT_MIN_COMMENTS,
+    PARALLEL_NORMALIZE_MIN_ISSUES,
     clean_markdown,
     deduplicate_comments,
     is_low_signal_issue,
     is_noise_issue,
     is_support_ticket,
+    merge_issue_updates,
     normalize_github_issue,
+    normalize_github_issues_batch,
     truncate_text,
 )
-from idea_generator.models import NormalizedComment
+from idea_generator.models import NormalizedComment, NormalizedIssue
 
 
 class TestCleanMarkdown:
@@ -99,6 +104,32 @@ class TestCleanMarkdown:
         assert "Item 1" in result
         assert "Item 2" in result
 
+    def test_clean_nested_line_markers(self) -> None:
+        """Test stripping stacked list and blockquote markers on one line."""
+        text = "- 1. > Nested item\n---\n## 2. Numbered heading"
+        result = clean_markdown(text)
+        assert result == "Nested item\nNumbered heading"
+
+    def test_clean_long_backtick_fence(self) -> None:
+        """Test four-backtick fences leave the same residue as three-backtick ones."""
+        text = "````python\ncode here\n````\nMore text"
+        result = clean_markdown(text)
+        assert "python" not in result
+        assert result == "code here\nMore text"
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            # An empty numbered item must not swallow the next line's indent
+            ("Steps:\n1.  \n - install", "Steps:\ninstall"),
+            # A language fence inside a longer backtick run leaves no stray fence
+            ("``````py\ncode", "code"),
+        ],
+    )
+    def test_clean_markers_across_lines(self, text: str, expected: str) -> None:
+        """Test fence and list passes strip markers exactly as sequential passes do."""
+        assert clean_markdown(text) == expected
+
     def test_clean_blockquotes(self) -> None:
         """Test removing blockquote markers."""
         text = "> This is a quote\n> Another line"
@@ -114,6 +145,25 @@ class TestCleanMarkdown:
         assert "comment" not in result
         assert result == "Text  more text"
 
+    def test_clean_reuses_cached_result(self) -> None:
+        """Test repeated bodies are served from the cache."""
+        clean_markdown.cache_clear()
+        text = "Thanks for the **report**!"
+        first = clean_markdown(text)
+        second = clean_markdown(text)
+        assert first == second == "Thanks for the report!"
+        assert clean_markdown.cache_info().hits == 1
+
+    def test_clean_plain_prose_only_strips(self) -> None:
+        """Test text without markdown syntax is returned stripped."""
+        text = "  Version 2 crashes on startup.\nPlease advise.  "
+        assert clean_markdown(text) == "Version 2 crashes on startup.\nPlease advise."
+
+    def test_clean_numbered_list_without_other_markers(self) -> None:
+        """Test numbered lists are cleaned when no other markdown is present."""
+        text = "Steps:\n1. Open the app\n2. Click save"
+        assert clean_markdown(text) == "Steps:\nOpen the app\nClick save"
+
     def test_clean_multiple_blank_lines(self) -> None:
         """Test collapsing multiple blank lines."""
         text = "Line 1\n\n\n\nLine 2"
@@ -161,6 +211,23 @@ class TestDeduplicateComments:
         result = deduplicate_comments(comments)
         assert len(result) == 1
 
+    def test_deduplicate_single_empty_comment(self) -> None:
+        """Test a lone whitespace-only comment is dropped."""
+        comments = [NormalizedComment(id=1, author="user1", body="  ", created_at=datetime.now())]
+        assert deduplicate_comments(comments) == []
+
+    def test_deduplicate_long_thread_uses_fingerprints(self) -> None:
+        """Test threads above the fingerprint threshold still drop duplicates."""
+        count = DEDUP_FINGERPRINT_MIN_COMMENTS + 2
+        comments = [
+            NormalizedComment(
+                id=i, author="user", body=f"Comment {i % 3}", created_at=datetime.now()
+            )
+            for i in range(count)
+        ]
+        result = deduplicate_comments(comments)
+        assert [c.id for c in result] == [0, 1, 2]
+
 
 class TestTruncateText:
     """Test suite for truncate_text function."""
@@ -175,6 +242,8 @@ class TestTruncateText:
         assert body == "Short body"
         assert len(truncated_comments) == 1
         assert original_length == len("Short body") + len("Short comment")
+        assert body is issue_body
+        assert truncated_comments is comments
 
     def test_truncate_issue_body_priority(self) -> None:
         """Test that issue body gets priority."""
@@ -414,6 +483,16 @@ class TestIsSupportTicket:
         )
         assert is_support is False
 
+    def test_reason_follows_pattern_order(self) -> None:
+        """Test the reported keyword follows pattern order, not position in the text."""
+        is_support, reason = is_support_ticket(
+            title="Need help with plugins",
+            body="How do I register a plugin from the config file?",
+            labels=[],
+        )
+        assert is_support is True
+        assert reason == "Support ticket indicator: question keyword (how do I/can I/to)"
+
 
 class TestIsLowSignalIssue:
     """Test suite for is_low_signal_issue function."""
@@ -760,3 +839,100 @@ class TestNormalizeGitHubIssue:
         result = normalize_github_issue(issue_data, comments_data, 10000, False)
         assert result.comments[0].id == 1
         assert result.comments[1].id == 2
+
+
+class TestNormalizeGitHubIssuesBatch:
+    """Test suite for normalize_github_issues_batch function."""
+
+    @staticmethod
+    def _make_issue(number: int) -> tuple[dict, list[dict]]:
+        issue_data = {
+            "id": 1000 + number,
+            "number": number,
+            "title": f"Issue number {number}",
+            "body": f"**Body** for issue {number} with enough text",
+            "state": "open",
+            "html_url": f"https://github.com/owner/repo/issues/{number}",
+            "created_at": "2025-01-01T12:00:00Z",
+            "updated_at": "2025-01-02T12:00:00Z",
+            "labels": [],
+            "reactions": {},
+            "user": {"login": "testuser"},
+        }
+        comments_data = [
+            {
+                "id": number * 10,
+                "user": {"login": "commenter"},
+                "body": f"`comment` on {number}",
+                "created_at": "2025-01-01T13:00:00Z",
+                "reactions": {"heart": 1},
+            }
+        ]
+        return issue_data, comments_data
+
+    def test_batch_empty(self) -> None:
+        """Test normalizing an empty batch."""
+        assert normalize_github_issues_batch([], 10000) == []
+
+    def test_batch_serial_matches_single(self) -> None:
+        """Test small batches match per-issue normalization."""
+        pairs = [self._make_issue(n) for n in range(1, 4)]
+        result = normalize_github_issues_batch(pairs, 10000)
+        expected = [normalize_github_issue(i, c, 10000) for i, c in pairs]
+        assert result == expected
+
+    def test_batch_parallel_preserves_order(self) -> None:
+        """Test process-pool normalization keeps input order and results."""
+        pairs = [self._make_issue(n) for n in range(1, PARALLEL_NORMALIZE_MIN_ISSUES + 5)]
+        with patch("idea_generator.cleaning.os.cpu_count", return_value=2):
+            result = normalize_github_issues_batch(pairs, 10000, max_workers=2)
+        assert [issue.number for issue in result] == [i["number"] for i, _ in pairs]
+        assert result[0] == normalize_github_issue(*pairs[0], 10000)
+        assert result[0].comments[0].body == "comment on 1"
+
+    def test_batch_single_cpu_stays_serial(self) -> None:
+        """Test max_workers is capped at the CPU count, so one CPU never starts a pool."""
+        pairs = [self._make_issue(n) for n in range(1, PARALLEL_NORMALIZE_MIN_ISSUES + 5)]
+        with (
+            patch("idea_generator.cleaning.os.cpu_count", return_value=1),
+            patch("idea_generator.cleaning.ProcessPoolExecutor") as mock_pool,
+        ):
+            result = normalize_github_issues_batch(pairs, 10000, max_workers=10)
+        mock_pool.assert_not_called()
+        assert len(result) == len(pairs)
+
+
+class TestMergeIssueUpdates:
+    """Test suite for merge_issue_updates function."""
+
+    @staticmethod
+    def _issue(number: int, day: int, title: str = "Feature request") -> NormalizedIssue:
+        return NormalizedIssue(
+            id=1000 + number,
+            number=number,
+            title=title,
+            body="Body",
+            labels=[],
+            state="open",
+            reactions={},
+            comments=[],
+            url=f"https://github.com/owner/repo/issues/{number}",
+            created_at=datetime(2025, 1, 1),
+            updated_at=datetime(2025, 1, day),
+        )
+
+    def test_updates_replace_and_reorder(self) -> None:
+        """Test updated issues replace their previous version and move to the front."""
+        existing = [self._issue(3, 5), self._issue(2, 4), self._issue(1, 3)]
+        updated = self._issue(1, 9, title="Edited title")
+        merged = merge_issue_updates(existing, [updated, self._issue(4, 8)])
+
+        assert [issue.number for issue in merged] == [1, 4, 3, 2]
+        assert merged[0].title == "Edited title"
+
+    def test_removed_numbers_and_limit(self) -> None:
+        """Test closed issues are dropped and the limit keeps the most recent issues."""
+        existing = [self._issue(3, 5), self._issue(2, 4), self._issue(1, 3)]
+        merged = merge_issue_updates(existing, [self._issue(4, 8)], {3}, limit=2)
+
+        assert [issue.number for issue in merged] == [4, 2]
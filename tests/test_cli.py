@@ -27,13 +27,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import json
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
 from typer.testing import CliRunner
 
-from idea_generator.cli import app
+from idea_generator.cli import CONFIG_CACHE_ENV_VAR, _load_cli_config, _load_config_cached, app
 from idea_generator.setup import SetupError
 
 runner = CliRunner()
@@ -49,6 +53,26 @@ class TestCLIBasics:
         assert "idea-generator" in result.stdout
         assert "Generate ideas from GitHub repositories" in result.stdout
 
+    def test_cli_help_is_plain_text(self) -> None:
+        """Test help is rendered by Click rather than Rich panels."""
+        result = runner.invoke(app, ["--help"])
+        assert result.exit_code == 0
+        assert "Commands:" in result.stdout
+        assert "╭" not in result.stdout
+
+    def test_cli_import_defers_package_modules(self) -> None:
+        """Test importing the CLI loads no pipeline, client or pydantic modules."""
+        code = (
+            "import sys, idea_generator.cli; "
+            "print(' '.join(m for m in ('pydantic', 'httpx', 'idea_generator.config', "
+            "'idea_generator.llm.client', 'idea_generator.github_client', "
+            "'idea_generator.pipelines') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == ""
+
     def test_cli_commands_available(self) -> None:
         """Test CLI shows available commands."""
         result = runner.invoke(app, ["--help"])
@@ -60,6 +84,29 @@ class TestCLIBasics:
         assert "run" in result.stdout
 
 
+class TestLoadCliConfig:
+    """Test suite for CLI configuration loading."""
+
+    def test_cache_disabled_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test configuration is reloaded on every call without the opt-in variable."""
+        monkeypatch.delenv(CONFIG_CACHE_ENV_VAR, raising=False)
+        _load_config_cached.cache_clear()
+        _load_cli_config(github_repo="owner/repo")
+        assert _load_config_cached.cache_info().currsize == 0
+
+    def test_cache_returns_independent_copies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test cached configuration is reused without leaking command overrides."""
+        monkeypatch.setenv(CONFIG_CACHE_ENV_VAR, "1")
+        _load_config_cached.cache_clear()
+        first = _load_cli_config(github_repo="owner/repo")
+        first.top_ideas_count = 99
+        second = _load_cli_config(github_repo="owner/repo")
+        assert _load_config_cached.cache_info().hits == 1
+        assert second.github_repo == "owner/repo"
+        assert second.top_ideas_count != 99
+        _load_config_cached.cache_clear()
+
+
 class TestSetupCommand:
     """Test suite for setup command."""
 
@@ -74,14 +121,14 @@ class TestSetupCommand:
 
     def test_setup_success(self) -> None:
         """Test successful setup command."""
-        with patch("idea_generator.cli.run_setup") as mock_setup:
+        with patch("idea_generator.setup.run_setup") as mock_setup:
             result = runner.invoke(app, ["setup", "--skip-pull"])
             assert result.exit_code == 0
             mock_setup.assert_called_once()
 
     def test_setup_with_custom_models(self) -> None:
         """Test setup with custom model names."""
-        with patch("idea_generator.cli.run_setup") as mock_setup:
+        with patch("idea_generator.setup.run_setup") as mock_setup:
             result = runner.invoke(
                 app,
                 [
@@ -98,7 +145,7 @@ class TestSetupCommand:
 
     def test_setup_offline_mode(self) -> None:
         """Test setup in offline mode."""
-        with patch("idea_generator.cli.run_setup") as mock_setup:
+        with patch("idea_generator.setup.run_setup") as mock_setup:
             result = runner.invoke(app, ["setup", "--offline"])
             assert result.exit_code == 0
             mock_setup.assert_called_once()
@@ -108,14 +155,14 @@ class TestSetupCommand:
 
     def test_setup_error_handling(self) -> None:
         """Test setup command error handling."""
-        with patch("idea_generator.cli.run_setup", side_effect=SetupError("Test error")):
+        with patch("idea_generator.setup.run_setup", side_effect=SetupError("Test error")):
             result = runner.invoke(app, ["setup"])
             assert result.exit_code == 1
             assert "Setup failed" in result.stdout
 
     def test_setup_unexpected_error(self) -> None:
         """Test setup command handles unexpected errors."""
-        with patch("idea_generator.cli.run_setup", side_effect=RuntimeError("Unexpected")):
+        with patch("idea_generator.setup.run_setup", side_effect=RuntimeError("Unexpected")):
             result = runner.invoke(app, ["setup"])
             assert result.exit_code == 1
             assert "Unexpected error" in result.stdout
@@ -140,7 +187,7 @@ class TestIngestCommand:
         """Test ingest with GitHub repo argument."""
         from unittest.mock import MagicMock, patch
 
-        with patch("idea_generator.cli.GitHubClient") as mock_client_class:
+        with patch("idea_generator.github_client.GitHubClient") as mock_client_class:
             mock_client = MagicMock()
             mock_client.__enter__ = MagicMock(return_value=mock_client)
             mock_client.__exit__ = MagicMock(return_value=False)
@@ -157,7 +204,7 @@ class TestIngestCommand:
         """Test ingest with issue limit argument."""
         from unittest.mock import MagicMock, patch
 
-        with patch("idea_generator.cli.GitHubClient") as mock_client_class:
+        with patch("idea_generator.github_client.GitHubClient") as mock_client_class:
             mock_client = MagicMock()
             mock_client.__enter__ = MagicMock(return_value=mock_client)
             mock_client.__exit__ = MagicMock(return_value=False)
@@ -175,6 +222,531 @@ class TestIngestCommand:
             call_args = mock_client.fetch_issues.call_args
             assert call_args[1]["limit"] == 50
 
+    def test_ingest_graphql_requires_token(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the GraphQL API option refuses to run without a token."""
+        monkeypatch.delenv("IDEA_GEN_GITHUB_TOKEN", raising=False)
+        result = runner.invoke(
+            app, ["ingest", "--github-repo", "owner/repo", "--api", "graphql", "-t", ""]
+        )
+        assert result.exit_code == 1
+        assert "GraphQL API requires authentication" in result.stdout
+
+    def test_ingest_fetches_comments_per_issue_in_order(self) -> None:
+        """Test concurrent comment fetching keeps issues in fetch order."""
+        import json
+        import time
+        from unittest.mock import MagicMock, patch
+
+        issues = [
+            {
+                "id": number,
+                "number": number,
+                "title": f"Feature request {number}",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": f"https://github.com/owner/repo/issues/{number}",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": "2025-01-02T12:00:00Z",
+                "labels": [],
+                "user": {"login": "user"},
+            }
+            for number in (3, 2, 1)
+        ]
+
+        def fetch_comments(owner: str, repo: str, issue_number: int) -> list[dict]:
+            # Finish the first issue last to exercise out-of-order completion
+            if issue_number == 3:
+                time.sleep(0.05)
+            return []
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues = MagicMock(return_value=issues)
+            mock_client.fetch_issue_comments = MagicMock(side_effect=fetch_comments)
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app, ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            )
+            assert result.exit_code == 0
+            assert mock_client.fetch_issue_comments.call_count == 3
+
+            with open(Path(tmpdir) / "owner_repo_issues.json", encoding="utf-8") as f:
+                saved = json.load(f)
+            assert [issue["number"] for issue in saved] == [3, 2, 1]
+
+    def test_ingest_reports_comment_failures_after_progress(self) -> None:
+        """Test comment fetch failures are reported without per-issue progress lines."""
+        from unittest.mock import MagicMock, patch
+
+        from idea_generator.github_client import GitHubAPIError
+
+        issues = [
+            {
+                "id": number,
+                "number": number,
+                "title": f"Feature request {number}",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": f"https://github.com/owner/repo/issues/{number}",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": "2025-01-02T12:00:00Z",
+                "labels": [],
+                "user": {"login": "user"},
+            }
+            for number in (2, 1)
+        ]
+
+        def fetch_comments(owner: str, repo: str, issue_number: int) -> list[dict]:
+            if issue_number == 2:
+                raise GitHubAPIError("boom")
+            return []
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues = MagicMock(return_value=issues)
+            mock_client.fetch_issue_comments = MagicMock(side_effect=fetch_comments)
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app, ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            )
+            assert result.exit_code == 0
+            assert "Failed to fetch comments for issue #2: boom" in result.stdout
+            assert "Issue #1 ✓" not in result.stdout
+
+    def test_ingest_resume_reuses_logged_comment_threads(self) -> None:
+        """Test --resume skips fetching threads logged for unchanged issues."""
+        from unittest.mock import MagicMock, patch
+
+        issues = [
+            {
+                "id": number,
+                "number": number,
+                "title": f"Feature request {number}",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": f"https://github.com/owner/repo/issues/{number}",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": "2025-01-02T12:00:00Z",
+                "labels": [],
+                "user": {"login": "user"},
+            }
+            for number in (3, 2, 1)
+        ]
+        logged_comment = {
+            "id": 20,
+            "body": "Logged before the crash",
+            "user": {"login": "commenter"},
+            "created_at": "2025-01-02T00:00:00Z",
+        }
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            wal_file = Path(tmpdir) / "owner_repo_comments.jsonl"
+            wal_file.write_text(
+                json.dumps(
+                    {
+                        "number": 2,
+                        "updated_at": "2025-01-02T12:00:00Z",
+                        "comments": [logged_comment],
+                    }
+                )
+                + "\n"
+                # Issue 1 has changed since it was logged, so it is fetched again
+                + json.dumps({"number": 1, "updated_at": "2024-12-31T00:00:00Z", "comments": []})
+                + "\n"
+                + '{"number": 3, "updated_at"'
+            )
+
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues = MagicMock(return_value=issues)
+            mock_client.fetch_issue_comments = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app,
+                ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir, "--resume"],
+            )
+            assert result.exit_code == 0
+            assert "Resuming: 1 comment threads reused" in result.stdout
+            fetched = sorted(
+                call.args[2] for call in mock_client.fetch_issue_comments.call_args_list
+            )
+            assert fetched == [1, 3]
+
+            with open(Path(tmpdir) / "owner_repo_issues.json", encoding="utf-8") as f:
+                saved = {issue["number"]: issue for issue in json.load(f)}
+            assert [c["body"] for c in saved[2]["comments"]] == ["Logged before the crash"]
+            assert not wal_file.exists()
+
+    def test_ingest_keeps_comment_log_when_interrupted(self) -> None:
+        """Test fetched threads stay logged when ingest fails before saving."""
+        from unittest.mock import MagicMock, patch
+
+        issues = [
+            {
+                "id": number,
+                "number": number,
+                "title": f"Feature request {number}",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": f"https://github.com/owner/repo/issues/{number}",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": "2025-01-02T12:00:00Z",
+                "labels": [],
+                "user": {"login": "user"},
+            }
+            for number in (2, 1)
+        ]
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+            patch(
+                "idea_generator.cleaning.normalize_github_issues_batch",
+                side_effect=RuntimeError("interrupted"),
+            ),
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues = MagicMock(return_value=issues)
+            mock_client.fetch_issue_comments = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app, ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            )
+            assert result.exit_code == 1
+
+            lines = (Path(tmpdir) / "owner_repo_comments.jsonl").read_text().splitlines()
+            assert sorted(json.loads(line)["number"] for line in lines) == [1, 2]
+
+    def test_ingest_rerun_without_resume_keeps_interrupted_log(self) -> None:
+        """Test a plain rerun points to --resume and does not truncate the leftover log."""
+        from unittest.mock import MagicMock, patch
+
+        issues = [
+            {
+                "id": 1,
+                "number": 1,
+                "title": "Feature request",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": "https://github.com/owner/repo/issues/1",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": "2025-01-02T12:00:00Z",
+                "labels": [],
+                "user": {"login": "user"},
+            }
+        ]
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+            patch(
+                "idea_generator.cleaning.normalize_github_issues_batch",
+                side_effect=RuntimeError("interrupted"),
+            ),
+        ):
+            wal_file = Path(tmpdir) / "owner_repo_comments.jsonl"
+            wal_file.write_text('{"number": 2, "updated_at": "2025-01-02T12:00:00Z", "comm')
+
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues = MagicMock(return_value=issues)
+            mock_client.fetch_issue_comments = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app, ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            )
+            assert result.exit_code == 1
+            assert "rerun with --resume to reuse them" in result.stdout
+
+            content = wal_file.read_text()
+            assert content.startswith('{"number": 2')
+            # The new thread starts on its own line after the partial one
+            assert [json.loads(line)["number"] for line in content.splitlines()[1:] if line] == [1]
+
+    def test_ingest_resume_with_graphql_warns(self) -> None:
+        """Test --resume with --api graphql says it only applies to the REST API."""
+        from unittest.mock import MagicMock, patch
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues_with_comments = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app,
+                [
+                    "ingest",
+                    "--github-repo",
+                    "owner/repo",
+                    "--data-dir",
+                    tmpdir,
+                    "--api",
+                    "graphql",
+                    "-t",
+                    "token",
+                    "--resume",
+                ],
+            )
+            assert result.exit_code == 0
+            assert "--resume only reuses comment threads fetched via the REST API" in (
+                result.output
+            )
+
+    def test_ingest_graphql_failure_falls_back_to_rest(self) -> None:
+        """Test a failed GraphQL fetch is retried through the REST API."""
+        from unittest.mock import MagicMock, patch
+
+        from idea_generator.github_client import GitHubAPIError
+
+        issues = [
+            {
+                "id": 1,
+                "number": 1,
+                "title": "Feature request",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": "https://github.com/owner/repo/issues/1",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": "2025-01-02T12:00:00Z",
+                "labels": [],
+                "user": {"login": "user"},
+            }
+        ]
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issues_with_comments = MagicMock(
+                side_effect=GitHubAPIError("GitHub GraphQL error: Resource not accessible")
+            )
+            mock_client.fetch_issues = MagicMock(return_value=issues)
+            mock_client.fetch_issue_comments = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app,
+                [
+                    "ingest",
+                    "--github-repo",
+                    "owner/repo",
+                    "--data-dir",
+                    tmpdir,
+                    "--api",
+                    "graphql",
+                    "-t",
+                    "token",
+                ],
+            )
+            assert result.exit_code == 0
+            assert "Falling back to the REST API" in result.stdout
+            mock_client.fetch_issues.assert_called_once()
+            mock_client.fetch_issue_comments.assert_called_once_with("owner", "repo", 1)
+            assert (Path(tmpdir) / "owner_repo_issues.json").exists()
+
+    def test_ingest_inaccessible_repo_discards_prefetched_issues(self) -> None:
+        """Test a failed access check stops ingest even though issues were fetched early."""
+        from unittest.mock import MagicMock, patch
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=False)
+            mock_client.fetch_issues = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+
+            result = runner.invoke(
+                app, ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            )
+            assert result.exit_code == 1
+            assert "not found or not accessible" in result.output
+            mock_client.fetch_issue_comments.assert_not_called()
+            assert not (Path(tmpdir) / "owner_repo_issues.json").exists()
+
+    def test_ingest_incremental_merges_updates(self) -> None:
+        """Test a second ingest fetches only updated issues and merges them."""
+        import json
+        from unittest.mock import MagicMock, patch
+
+        def make_issue(number: int, updated_at: str, state: str = "open") -> dict:
+            return {
+                "id": number,
+                "number": number,
+                "title": f"Feature request {number}",
+                "body": f"Please add feature {number}",
+                "state": state,
+                "html_url": f"https://github.com/owner/repo/issues/{number}",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": updated_at,
+                "labels": [],
+                "user": {"login": "user"},
+            }
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client.fetch_issue_comments = MagicMock(return_value=[])
+            mock_client_class.return_value = mock_client
+            args = ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            args += ["--issue-limit", "10"]
+
+            # First run: full ingest of three open issues
+            mock_client.fetch_issues = MagicMock(
+                return_value=[
+                    make_issue(3, "2025-01-04T12:00:00Z"),
+                    make_issue(2, "2025-01-03T12:00:00Z"),
+                    make_issue(1, "2025-01-02T12:00:00Z"),
+                ]
+            )
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert mock_client.fetch_issues.call_args.kwargs["since"] is None
+            assert mock_client.fetch_issues.call_args.kwargs["limit"] == 10
+            with open(Path(tmpdir) / ".ingest_state.json", encoding="utf-8") as f:
+                last_ingest = json.load(f)["owner/repo"]
+
+            # Second run: issue 1 was edited and issue 3 was closed
+            mock_client.fetch_issues = MagicMock(
+                return_value=[
+                    make_issue(1, "2025-02-01T12:00:00Z"),
+                    make_issue(3, "2025-01-31T12:00:00Z", state="closed"),
+                ]
+            )
+            mock_client.fetch_issue_comments.reset_mock()
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            call_kwargs = mock_client.fetch_issues.call_args.kwargs
+            assert call_kwargs["since"] == last_ingest
+            assert call_kwargs["state"] == "all"
+            # Closed issues must not use up the limit; the merge applies it instead
+            assert call_kwargs["limit"] is None
+            mock_client.fetch_issue_comments.assert_called_once_with("owner", "repo", 1)
+
+            with open(Path(tmpdir) / "owner_repo_issues.json", encoding="utf-8") as f:
+                saved = json.load(f)
+            assert [issue["number"] for issue in saved] == [1, 2]
+
+            # --full ignores the previous ingest
+            result = runner.invoke(app, [*args, "--full"])
+            assert result.exit_code == 0
+            assert mock_client.fetch_issues.call_args.kwargs["since"] is None
+
+    def test_ingest_incremental_retries_failed_comment_fetch(self) -> None:
+        """Test a failed comment fetch keeps the saved thread and is retried next run."""
+        from unittest.mock import MagicMock, patch
+
+        from idea_generator.github_client import GitHubAPIError
+
+        def make_issue(updated_at: str) -> dict:
+            return {
+                "id": 1,
+                "number": 1,
+                "title": "Feature request",
+                "body": "Please add this feature",
+                "state": "open",
+                "html_url": "https://github.com/owner/repo/issues/1",
+                "created_at": "2025-01-01T12:00:00Z",
+                "updated_at": updated_at,
+                "labels": [],
+                "user": {"login": "user"},
+            }
+
+        comment = {
+            "id": 10,
+            "body": "Saved comment",
+            "user": {"login": "commenter"},
+            "created_at": "2025-01-02T00:00:00Z",
+        }
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.github_client.GitHubClient") as mock_client_class,
+        ):
+            mock_client = MagicMock()
+            mock_client.__enter__ = MagicMock(return_value=mock_client)
+            mock_client.__exit__ = MagicMock(return_value=False)
+            mock_client.check_repository_access = MagicMock(return_value=True)
+            mock_client_class.return_value = mock_client
+            args = ["ingest", "--github-repo", "owner/repo", "--data-dir", tmpdir]
+            output_file = Path(tmpdir) / "owner_repo_issues.json"
+
+            # First run saves the issue with its comment
+            mock_client.fetch_issues = MagicMock(return_value=[make_issue("2025-01-02T12:00:00Z")])
+            mock_client.fetch_issue_comments = MagicMock(return_value=[comment])
+            assert runner.invoke(app, args).exit_code == 0
+
+            # Second run: the issue was updated but its comments cannot be fetched
+            mock_client.fetch_issues = MagicMock(return_value=[make_issue("2025-02-01T12:00:00Z")])
+            mock_client.fetch_issue_comments = MagicMock(side_effect=GitHubAPIError("boom"))
+            result = runner.invoke(app, args)
+            assert result.exit_code == 0
+            assert "will be fetched again on the next ingest" in result.stdout
+            with open(output_file, encoding="utf-8") as f:
+                assert [c["body"] for c in json.load(f)[0]["comments"]] == ["Saved comment"]
+
+            # Third run asks again for everything since the failed issue's update
+            mock_client.fetch_issue_comments = MagicMock(return_value=[comment])
+            assert runner.invoke(app, args).exit_code == 0
+            assert mock_client.fetch_issues.call_args.kwargs["since"] == "2025-02-01T12:00:00Z"
+            mock_client.fetch_issue_comments.assert_called_once_with("owner", "repo", 1)
+            with open(output_file, encoding="utf-8") as f:
+                saved = json.load(f)
+            assert saved[0]["updated_at"].startswith("2025-02-01")
+
+    def test_ingest_rejects_invalid_since(self) -> None:
+        """Test --since must be an ISO 8601 timestamp."""
+        result = runner.invoke(
+            app, ["ingest", "--github-repo", "owner/repo", "--since", "last tuesday"]
+        )
+        assert result.exit_code == 1
+        assert "Invalid --since timestamp" in result.output
+
 
 class TestSummarizeCommand:
     """Test suite for summarize command."""
@@ -213,6 +785,73 @@ class TestSummarizeCommand:
             assert result.exit_code == 1
             assert "Normalized issues file not found" in result.stdout
 
+    def test_summarize_skip_noise_filters_before_connecting(self) -> None:
+        """Test that an all-noise issues file exits cleanly without contacting Ollama."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            noise_issue = {
+                "id": 1,
+                "number": 1,
+                "title": "+1",
+                "body": "",
+                "state": "open",
+                "url": "https://github.com/owner/repo/issues/1",
+                "created_at": "2025-01-01T00:00:00Z",
+                "updated_at": "2025-01-01T00:00:00Z",
+                "is_noise": True,
+                "original_length": 0,
+            }
+            (Path(tmpdir) / "owner_repo_issues.json").write_text(json.dumps([noise_issue]))
+
+            with patch("idea_generator.llm.client.OllamaClient") as mock_client:
+                result = runner.invoke(
+                    app,
+                    [
+                        "summarize",
+                        "--github-repo",
+                        "owner/repo",
+                        "--data-dir",
+                        tmpdir,
+                        "--output-dir",
+                        tmpdir,
+                        "--skip-noise",
+                    ],
+                )
+
+            assert result.exit_code == 0
+            assert "Skipping 1 noise issues" in result.stdout
+            assert "No issues to summarize." in result.stdout
+            mock_client.assert_not_called()
+
+    def test_summarize_invalid_issues_file(self) -> None:
+        """Test that a malformed issues file is reported before contacting Ollama."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "owner_repo_issues.json").write_text('[{"id": 1}]')
+
+            with patch("idea_generator.llm.client.OllamaClient") as mock_client:
+                result = runner.invoke(
+                    app,
+                    [
+                        "summarize",
+                        "--github-repo",
+                        "owner/repo",
+                        "--data-dir",
+                        tmpdir,
+                        "--output-dir",
+                        tmpdir,
+                    ],
+                )
+
+            assert result.exit_code == 1
+            assert "Invalid issues file" in result.output
+            mock_client.assert_not_called()
+
+    def test_summarize_rejects_zero_concurrency(self) -> None:
+        """Test that --concurrency must be at least 1."""
+        result = runner.invoke(
+            app, ["summarize", "--github-repo", "owner/repo", "--concurrency", "0"]
+        )
+        assert result.exit_code == 2
+
 
 class TestRunCommand:
     """Test suite for run command."""
@@ -247,3 +886,36 @@ class TestRunCommand:
         # But it should at least parse arguments correctly
         assert result.exit_code == 1  # Will fail at runtime
         assert "owner/repo" in result.stdout or "Pipeline error" in result.stdout
+
+    def test_run_with_setup_shares_config(self) -> None:
+        """Test --setup runs setup in-process with the pipeline's config."""
+        from unittest.mock import patch
+
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            patch("idea_generator.setup.run_setup") as mock_setup,
+            patch("idea_generator.pipelines.orchestrator.Orchestrator") as mock_orchestrator,
+        ):
+            mock_orchestrator.return_value.run.return_value = {}
+            result = runner.invoke(
+                app,
+                ["run", "--setup", "--github-repo", "owner/repo", "--data-dir", tmpdir],
+            )
+            assert result.exit_code == 0
+            mock_setup.assert_called_once()
+            assert mock_setup.call_args[0][0] is mock_orchestrator.call_args[0][0]
+
+    def test_run_setup_failure(self) -> None:
+        """Test a setup failure stops the pipeline before orchestration."""
+        from unittest.mock import patch
+
+        from idea_generator.setup import SetupError
+
+        with (
+            patch("idea_generator.setup.run_setup", side_effect=SetupError("no ollama")),
+            patch("idea_generator.pipelines.orchestrator.Orchestrator") as mock_orchestrator,
+        ):
+            result = runner.invoke(app, ["run", "--setup", "--github-repo", "owner/repo"])
+            assert result.exit_code == 1
+            assert "Setup failed: no ollama" in result.output
+            mock_orchestrator.assert_not_called()
@@ -27,6 +27,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import inspect
 import os
 import tempfile
 from pathlib import Path
@@ -34,7 +35,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from idea_generator.config import Config, load_config
+from idea_generator.config import Config, ensure_directory, load_config
 
 
 class TestConfig:
@@ -128,6 +129,39 @@ class TestConfig:
             assert data_dir.exists()
             assert persona_dir.exists()
 
+    def test_ensure_directory_skips_existing(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test existing directories are not re-created while missing ones are."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            nested_dir = Path(tmpdir) / "a" / "b"
+            ensure_directory(nested_dir)
+            assert nested_dir.is_dir()
+
+            def fail_mkdir(*args: object, **kwargs: object) -> None:
+                raise AssertionError("mkdir called for an existing directory")
+
+            monkeypatch.setattr(Path, "mkdir", fail_mkdir)
+            ensure_directory(nested_dir)
+
+    def test_ensure_directories_extra_checked_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test extra directories are created and later calls skip the filesystem."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            base = Path(tmpdir)
+            config = Config(
+                output_dir=base / "output",
+                data_dir=base / "data",
+                persona_dir=base / "personas",
+            )
+            cache_dir = base / "data" / "cache"
+            config.ensure_directories(cache_dir)
+            assert cache_dir.is_dir()
+
+            def fail_is_dir(*args: object, **kwargs: object) -> bool:
+                raise AssertionError("directory checked again")
+
+            monkeypatch.setattr(Path, "is_dir", fail_is_dir)
+            config.ensure_directories(cache_dir)
+            ensure_directory(cache_dir)
+
     def test_config_from_env_variables(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test loading config from environment variables."""
         monkeypatch.setenv("IDEA_GEN_GITHUB_REPO", "test/repo")
@@ -171,6 +205,11 @@ class TestConfig:
         # Should use defaults
         assert config.ollama_port == 11434
 
+    def test_load_config_parameters_are_config_fields(self) -> None:
+        """Test every load_config parameter forwards to the Config field of that name."""
+        parameters = inspect.signature(load_config).parameters
+        assert set(parameters) <= set(Config.model_fields)
+
     def test_config_path_resolution(self) -> None:
         """Test that paths are resolved to absolute paths."""
         config = Config(
@@ -181,6 +220,17 @@ class TestConfig:
         assert config.output_dir.is_absolute()
         assert config.data_dir.is_absolute()
 
+    def test_config_path_normalized_without_following_symlinks(self) -> None:
+        """Test paths are normalized lexically, keeping symlinked directories as given."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / "target"
+            target.mkdir()
+            link = Path(tmpdir) / "link"
+            link.symlink_to(target)
+
+            config = Config(output_dir=link / "sub" / ".." / "out")
+            assert config.output_dir == link / "out"
+
     def test_config_issue_limit_validation(self) -> None:
         """Test issue limit validation."""
         # Valid issue limits
@@ -209,6 +259,16 @@ class TestConfig:
         config = load_config(github_issue_limit=None)
         assert config.github_issue_limit is None
 
+    def test_load_config_with_rate_limit_settings(self) -> None:
+        """Test load_config passes GitHub rate-limit pacing settings."""
+        config = load_config(github_rate_limit_buffer=50, github_max_requests_per_second=2.5)
+        assert config.github_rate_limit_buffer == 50
+        assert config.github_max_requests_per_second == 2.5
+
+        config = load_config()
+        assert config.github_rate_limit_buffer == 100
+        assert config.github_max_requests_per_second is None
+
     def test_config_issue_limit_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test loading issue limit from environment variable."""
         monkeypatch.setenv("IDEA_GEN_GITHUB_ISSUE_LIMIT", "250")
@@ -220,6 +280,17 @@ class TestConfig:
         config = Config()
         assert config.github_issue_limit is None
 
+    def test_config_llm_concurrency(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test LLM concurrency default, environment override and bounds."""
+        monkeypatch.delenv("IDEA_GEN_LLM_CONCURRENCY", raising=False)
+        assert Config().llm_concurrency == 4
+
+        monkeypatch.setenv("IDEA_GEN_LLM_CONCURRENCY", "8")
+        assert Config().llm_concurrency == 8
+
+        with pytest.raises(ValidationError):
+            Config(llm_concurrency=0)
+
 
 class TestConfigEnvFile:
     """Test suite for .env file loading."""
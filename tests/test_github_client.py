@@ -81,6 +81,16 @@ class TestGitHubClient:
         assert client.per_page == 100
         client.close()
 
+    def test_max_connections_bounds(self) -> None:
+        """Test connection pool size is stored and kept positive."""
+        client = GitHubClient(max_connections=8)
+        assert client.max_connections == 8
+        client.close()
+
+        client = GitHubClient(max_connections=0)
+        assert client.max_connections == 1
+        client.close()
+
     def test_cache_response(self) -> None:
         """Test caching API responses."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -118,6 +128,92 @@ class TestGitHubClient:
         assert result == {"key": "value"}
         client.close()
 
+    @patch("httpx.Client.request")
+    def test_request_revalidates_with_etag(self, mock_request: MagicMock) -> None:
+        """Test a cached ETag is sent and a 304 reply is served from disk."""
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"abc123"'}
+        first_response.json.return_value = [{"id": 1}]
+
+        not_modified_response = MagicMock()
+        not_modified_response.status_code = 304
+        not_modified_response.headers = {}
+
+        mock_request.side_effect = [first_response, not_modified_response]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = GitHubClient(cache_dir=Path(tmpdir))
+            assert client._request("GET", "/test", {"page": 1}) == [{"id": 1}]
+            assert mock_request.call_args_list[0].kwargs["headers"] is None
+
+            assert client._request("GET", "/test", {"page": 1}) == [{"id": 1}]
+            second_headers = mock_request.call_args_list[1].kwargs["headers"]
+            assert second_headers == {"If-None-Match": '"abc123"'}
+            assert client.cache_hits == 1
+            assert client.cache_misses == 1
+            client.close()
+
+    @patch("httpx.Client.request")
+    def test_etag_index_loaded_from_cache_dir(self, mock_request: MagicMock) -> None:
+        """Test validators stored by an earlier client are found via the directory index."""
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"abc123"'}
+        first_response.json.return_value = {"key": "value"}
+
+        not_modified_response = MagicMock()
+        not_modified_response.status_code = 304
+        not_modified_response.headers = {}
+
+        mock_request.side_effect = [first_response, not_modified_response, first_response]
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with GitHubClient(cache_dir=Path(tmpdir)) as client:
+                client._request("GET", "/test")
+
+            with GitHubClient(cache_dir=Path(tmpdir)) as client:
+                assert len(client._etag_names) == 1
+                assert client._request("GET", "/test") == {"key": "value"}
+                assert client.cache_hits == 1
+                # Unknown URLs are misses without a conditional header
+                client._request("GET", "/other")
+                assert mock_request.call_args_list[2].kwargs["headers"] is None
+
+    @patch("httpx.Client.request")
+    def test_incremental_request_skips_etag(self, mock_request: MagicMock) -> None:
+        """Test requests with a since timestamp are neither revalidated nor stored."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"abc123"'}
+        mock_response.json.return_value = [{"id": 1}]
+        mock_request.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with GitHubClient(cache_dir=Path(tmpdir)) as client:
+                params = {"page": 1, "since": "2025-01-01T00:00:00Z"}
+                client._request("GET", "/test", params)
+                client._request("GET", "/test", params)
+                assert all(call.kwargs["headers"] is None for call in mock_request.call_args_list)
+                assert client.cache_misses == 0
+            assert not any((Path(tmpdir) / "etags").iterdir())
+
+    @patch("httpx.Client.request")
+    def test_request_without_cache_dir_skips_etag(self, mock_request: MagicMock) -> None:
+        """Test conditional requests are not used when caching is disabled."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {"ETag": '"abc123"'}
+        mock_response.json.return_value = {"key": "value"}
+        mock_request.return_value = mock_response
+
+        client = GitHubClient()
+        client._request("GET", "/test")
+        client._request("GET", "/test")
+        assert all(call.kwargs["headers"] is None for call in mock_request.call_args_list)
+        assert client.cache_misses == 0
+        client.close()
+
     @patch("httpx.Client.request")
     def test_request_rate_limit_retry(self, mock_request: MagicMock) -> None:
         """Test retry on rate limit."""
@@ -156,6 +252,103 @@ class TestGitHubClient:
                 client._request("GET", "/test")
         client.close()
 
+    @patch("httpx.Client.request")
+    def test_request_secondary_rate_limit_honours_retry_after(
+        self, mock_request: MagicMock
+    ) -> None:
+        """Test a 429 response waits for the full Retry-After period."""
+        rate_limit_response = MagicMock()
+        rate_limit_response.status_code = 429
+        rate_limit_response.text = "You have exceeded a secondary rate limit"
+        rate_limit_response.headers = {"Retry-After": "7"}
+
+        success_response = MagicMock()
+        success_response.status_code = 200
+        success_response.json.return_value = {"key": "value"}
+
+        mock_request.side_effect = [rate_limit_response, success_response]
+
+        client = GitHubClient(max_retries=3)
+        with patch("time.sleep") as mock_sleep:
+            result = client._request("GET", "/test")
+        assert result == {"key": "value"}
+        mock_sleep.assert_called_once_with(7)
+        client.close()
+
+    @patch("httpx.Client.request")
+    def test_request_waits_for_reset_when_quota_low(self, mock_request: MagicMock) -> None:
+        """Test requests pause until the reset once remaining quota reaches the buffer."""
+        low_quota_response = MagicMock()
+        low_quota_response.status_code = 200
+        low_quota_response.headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": "1000",
+        }
+        low_quota_response.json.return_value = {"key": "value"}
+        mock_request.return_value = low_quota_response
+
+        client = GitHubClient(rate_limit_buffer=10)
+        with patch("time.time", return_value=900.0), patch("time.sleep") as mock_sleep:
+            client._request("GET", "/test")
+            mock_sleep.assert_not_called()
+            client._request("GET", "/test")
+        mock_sleep.assert_called_once_with(101.0)
+        client.close()
+
+    @patch("httpx.Client.request")
+    def test_graphql_quota_does_not_pause_rest_requests(self, mock_request: MagicMock) -> None:
+        """Test REST and GraphQL rate-limit headers are tracked as separate quotas."""
+        graphql_response = MagicMock()
+        graphql_response.status_code = 200
+        graphql_response.headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "10",
+            "X-RateLimit-Reset": "1000",
+            "X-RateLimit-Resource": "graphql",
+        }
+        graphql_response.json.return_value = {"data": {}}
+
+        rest_response = MagicMock()
+        rest_response.status_code = 200
+        rest_response.headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4000",
+            "X-RateLimit-Reset": "1000",
+            "X-RateLimit-Resource": "core",
+        }
+        rest_response.json.return_value = {"key": "value"}
+
+        mock_request.side_effect = [graphql_response, rest_response, rest_response]
+
+        client = GitHubClient(rate_limit_buffer=10)
+        with patch("time.time", return_value=900.0), patch("time.sleep") as mock_sleep:
+            client._request("POST", "/graphql", json_body={"query": "{}"})
+            client._request("GET", "/test")
+            client._request("GET", "/test")
+            mock_sleep.assert_not_called()
+            # The exhausted GraphQL quota still pauses the next GraphQL request
+            mock_request.side_effect = [graphql_response]
+            client._request("POST", "/graphql", json_body={"query": "{}"})
+        mock_sleep.assert_called_once_with(101.0)
+        client.close()
+
+    @patch("httpx.Client.request")
+    def test_request_rate_cap_spaces_requests(self, mock_request: MagicMock) -> None:
+        """Test max_requests_per_second spaces out consecutive requests."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {"key": "value"}
+        mock_request.return_value = mock_response
+
+        client = GitHubClient(max_requests_per_second=2)
+        with patch("time.time", return_value=500.0), patch("time.sleep") as mock_sleep:
+            client._request("GET", "/test")
+            client._request("GET", "/test")
+        mock_sleep.assert_called_once_with(0.5)
+        client.close()
+
     @patch("httpx.Client.request")
     def test_request_410_gone(self, mock_request: MagicMock) -> None:
         """Test handling of 410 Gone status (deleted content)."""
@@ -216,6 +409,19 @@ class TestGitHubClient:
         assert result == {"key": "value"}
         client.close()
 
+    @patch("httpx.Client.request")
+    def test_request_network_error_retries_exhausted(self, mock_request: MagicMock) -> None:
+        """Test persistent network errors stop after max_retries with exponential backoff."""
+        mock_request.side_effect = httpx.RequestError("Network error")
+
+        client = GitHubClient(max_retries=3)
+        with patch("time.sleep") as mock_sleep:
+            with pytest.raises(GitHubAPIError, match="after 3 retries"):
+                client._request("GET", "/test")
+        assert mock_request.call_count == 4
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2, 4, 8]
+        client.close()
+
     @patch("httpx.Client.request")
     def test_paginate_single_page(self, mock_request: MagicMock) -> None:
         """Test pagination with single page."""
@@ -250,6 +456,33 @@ class TestGitHubClient:
         assert len(result) == 150
         client.close()
 
+    @patch("httpx.Client.request")
+    def test_paginate_follows_link_header(self, mock_request: MagicMock) -> None:
+        """Test pagination stops on a full last page when Link has no rel="next"."""
+        page1_response = MagicMock()
+        page1_response.status_code = 200
+        page1_response.headers = {
+            "Link": '<https://api.github.com/test?page=2>; rel="next", '
+            '<https://api.github.com/test?page=2>; rel="last"'
+        }
+        page1_response.json.return_value = [{"id": i} for i in range(100)]
+
+        page2_response = MagicMock()
+        page2_response.status_code = 200
+        page2_response.headers = {
+            "Link": '<https://api.github.com/test?page=1>; rel="prev", '
+            '<https://api.github.com/test?page=1>; rel="first"'
+        }
+        page2_response.json.return_value = [{"id": i} for i in range(100, 200)]
+
+        mock_request.side_effect = [page1_response, page2_response]
+
+        client = GitHubClient(per_page=100)
+        result = client._paginate("/test")
+        assert len(result) == 200
+        assert mock_request.call_count == 2
+        client.close()
+
     @patch("httpx.Client.request")
     def test_fetch_issues(self, mock_request: MagicMock) -> None:
         """Test fetching issues."""
@@ -268,6 +501,29 @@ class TestGitHubClient:
             assert issues[0]["id"] == 1
             client.close()
 
+    @patch("httpx.Client.request")
+    def test_fetch_issues_since(self, mock_request: MagicMock) -> None:
+        """Test the since filter is passed to GitHub and its dumps share one cache file."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = [{"id": 1, "number": 1, "state": "closed"}]
+        mock_request.return_value = mock_response
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = GitHubClient(cache_dir=Path(tmpdir))
+            issues = client.fetch_issues("owner", "repo", state="all", since="2025-01-02T03:04:05Z")
+            assert issues[0]["state"] == "closed"
+
+            params = mock_request.call_args.kwargs["params"]
+            assert params["since"] == "2025-01-02T03:04:05Z"
+            assert params["state"] == "all"
+            # Later incremental runs overwrite the same dump
+            client.fetch_issues("owner", "repo", state="all", since="2025-02-01T00:00:00Z")
+            assert [path.name for path in Path(tmpdir).glob("*.json")] == [
+                "owner_repo_issues_all_since.json"
+            ]
+            client.close()
+
     @patch("httpx.Client.request")
     def test_fetch_issues_with_limit(self, mock_request: MagicMock) -> None:
         """Test fetching issues with a limit."""
@@ -425,6 +681,113 @@ class TestGitHubClient:
             assert comments[0]["id"] == 101
             client.close()
 
+    @staticmethod
+    def _graphql_response(data: dict) -> MagicMock:
+        """Build a mocked GraphQL HTTP response."""
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {}
+        response.json.return_value = {"data": data}
+        return response
+
+    @staticmethod
+    def _graphql_comment(database_id: int, body: str) -> dict:
+        """Build a GraphQL issue comment node."""
+        return {
+            "databaseId": database_id,
+            "body": body,
+            "createdAt": "2025-01-01T13:00:00Z",
+            "author": {"login": "commenter"},
+            "reactionGroups": [{"content": "HEART", "reactors": {"totalCount": 2}}],
+        }
+
+    @patch("httpx.Client.request")
+    def test_fetch_issues_with_comments(self, mock_request: MagicMock) -> None:
+        """Test GraphQL issues and comment pages are converted to REST shapes."""
+        issue_node = {
+            "id": "I_abc",
+            "databaseId": 101,
+            "number": 1,
+            "title": "Issue 1",
+            "body": "Body",
+            "state": "OPEN",
+            "url": "https://github.com/owner/repo/issues/1",
+            "createdAt": "2025-01-01T12:00:00Z",
+            "updatedAt": "2025-01-02T12:00:00Z",
+            "author": None,
+            "labels": {"nodes": [{"name": "bug"}]},
+            "reactionGroups": [
+                {"content": "THUMBS_UP", "reactors": {"totalCount": 3}},
+                {"content": "EYES", "reactors": {"totalCount": 0}},
+            ],
+            "comments": {
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+                "nodes": [self._graphql_comment(201, "First")],
+            },
+        }
+        mock_request.side_effect = [
+            self._graphql_response(
+                {
+                    "rateLimit": {"cost": 1, "remaining": 4999, "resetAt": ""},
+                    "repository": {
+                        "issues": {
+                            "pageInfo": {"hasNextPage": False, "endCursor": "i1"},
+                            "nodes": [issue_node],
+                        }
+                    },
+                }
+            ),
+            self._graphql_response(
+                {
+                    "rateLimit": {"cost": 1, "remaining": 4998, "resetAt": ""},
+                    "node": {
+                        "comments": {
+                            "pageInfo": {"hasNextPage": False, "endCursor": "c2"},
+                            "nodes": [self._graphql_comment(202, "Second")],
+                        }
+                    },
+                }
+            ),
+        ]
+
+        client = GitHubClient(token="test_token")
+        result = client.fetch_issues_with_comments("owner", "repo")
+        assert mock_request.call_count == 2
+        assert mock_request.call_args_list[0].args[0] == "POST"
+        variables = mock_request.call_args_list[0].kwargs["json"]["variables"]
+        assert variables["states"] == ["OPEN"]
+        assert variables["since"] is None
+
+        issue, comments = result[0]
+        assert issue["id"] == 101
+        assert issue["state"] == "open"
+        assert issue["html_url"] == "https://github.com/owner/repo/issues/1"
+        assert issue["labels"] == [{"name": "bug"}]
+        assert issue["user"] is None
+        assert issue["reactions"] == {"+1": 3, "eyes": 0}
+        assert [c["id"] for c in comments] == [201, 202]
+        assert comments[0]["user"] == {"login": "commenter"}
+        assert comments[0]["reactions"] == {"heart": 2}
+        assert client.graphql_cost == 2
+        client.close()
+
+    @patch("httpx.Client.request")
+    def test_fetch_issues_with_comments_graphql_error(self, mock_request: MagicMock) -> None:
+        """Test GraphQL errors are raised as GitHubAPIError."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.json.return_value = {
+            "data": {"repository": None},
+            "errors": [{"message": "Could not resolve to a Repository"}],
+        }
+        mock_request.return_value = mock_response
+
+        client = GitHubClient(token="test_token")
+        with pytest.raises(GitHubAPIError, match="Could not resolve"):
+            client.fetch_issues_with_comments("owner", "missing")
+        client.close()
+
     @patch("httpx.Client.request")
     def test_check_repository_access_success(self, mock_request: MagicMock) -> None:
         """Test successful repository access check."""
@@ -138,6 +138,15 @@ class TestGroupingPipelineInit:
                 prompt_template_path=Path("/nonexistent/grouper.txt"),
             )
 
+    def test_pipeline_default_prompt_is_bundled(self, mock_llm_client: Mock) -> None:
+        """Test the packaged grouper prompt is used, sharing one read per process."""
+        first = GroupingPipeline(llm_client=mock_llm_client, model="llama3.2:latest")
+        second = GroupingPipeline(llm_client=mock_llm_client, model="llama3.2:latest")
+
+        bundled = files("idea_generator.llm.prompts").joinpath("grouper.txt")
+        assert first.system_prompt == bundled.read_text(encoding="utf-8")
+        assert second.system_prompt is first.system_prompt
+
     def test_prompt_contains_schema_reminders(self, mock_llm_client: Mock) -> None:
         """Test that prompt template contains explicit schema field requirements."""
         try:
@@ -257,6 +266,30 @@ class TestCreateBatches:
         assert len(batches) > 1  # Should split due to character limit
 
 
+class TestFormatBatchPrompt:
+    """Tests for batch prompt formatting."""
+
+    def test_prompt_embeds_indented_summaries(
+        self,
+        mock_llm_client: Mock,
+        temp_prompt_file: Path,
+        sample_summaries: list[SummarizedIssue],
+    ) -> None:
+        """Test the prompt carries the batch as indented JSON matching json.dumps."""
+        pipeline = GroupingPipeline(
+            llm_client=mock_llm_client,
+            model="llama3.2:latest",
+            prompt_template_path=temp_prompt_file,
+        )
+
+        prompt = pipeline._format_batch_prompt(sample_summaries)
+
+        expected = json.dumps(
+            [s.model_dump(mode="json") for s in sample_summaries], indent=2, ensure_ascii=False
+        )
+        assert f"Input batch ({len(sample_summaries)} issues):\n{expected}\n\n" in prompt
+
+
 class TestValidateClusters:
     """Tests for cluster validation logic."""
 
@@ -631,6 +664,25 @@ class TestGroupBatch:
         assert len(clusters) == 2
         assert mock_llm_client.generate.call_count == 2  # Retried once
 
+    @pytest.mark.parametrize("bad_cluster", ["not-a-cluster", {"cluster_id": "ui-ux-001"}])
+    def test_parse_llm_response_rejects_invalid_clusters(
+        self,
+        mock_llm_client: Mock,
+        temp_prompt_file: Path,
+        sample_summaries: list[SummarizedIssue],
+        bad_cluster: object,
+    ) -> None:
+        """Test malformed or incomplete cluster entries raise GroupingError."""
+        pipeline = GroupingPipeline(
+            llm_client=mock_llm_client,
+            model="llama3.2:latest",
+            prompt_template_path=temp_prompt_file,
+        )
+        mock_llm_client.parse_json_response.return_value = {"clusters": [bad_cluster]}
+
+        with pytest.raises(GroupingError, match="Invalid cluster data"):
+            pipeline._parse_llm_response({"response": "", "done": True}, sample_summaries)
+
     def test_group_batch_llm_error(
         self,
         mock_llm_client: Mock,
@@ -90,7 +90,7 @@ class TestIngestIntegration:
         with tempfile.TemporaryDirectory() as tmpdir:
             data_dir = Path(tmpdir) / "data"
 
-            with patch("idea_generator.cli.GitHubClient") as mock_client_class:
+            with patch("idea_generator.github_client.GitHubClient") as mock_client_class:
                 mock_client = MagicMock()
                 mock_client.__enter__ = MagicMock(return_value=mock_client)
                 mock_client.__exit__ = MagicMock(return_value=False)
@@ -167,7 +167,7 @@ class TestIngestIntegration:
         with tempfile.TemporaryDirectory() as tmpdir:
             data_dir = Path(tmpdir) / "data"
 
-            with patch("idea_generator.cli.GitHubClient") as mock_client_class:
+            with patch("idea_generator.github_client.GitHubClient") as mock_client_class:
                 mock_client = MagicMock()
                 mock_client.__enter__ = MagicMock(return_value=mock_client)
                 mock_client.__exit__ = MagicMock(return_value=False)
@@ -214,7 +214,7 @@ class TestIngestIntegration:
         with tempfile.TemporaryDirectory() as tmpdir:
             data_dir = Path(tmpdir) / "data"
 
-            with patch("idea_generator.cli.GitHubClient") as mock_client_class:
+            with patch("idea_generator.github_client.GitHubClient") as mock_client_class:
                 from idea_generator.github_client import GitHubAPIError
 
                 mock_client = MagicMock()
@@ -99,6 +99,16 @@ class TestOllamaClient:
         assert client.base_url == "http://localhost:11434"
         client.close()
 
+    def test_max_connections_bounds(self) -> None:
+        """Test connection pool size is stored and kept positive."""
+        client = OllamaClient(max_connections=8)
+        assert client.max_connections == 8
+        client.close()
+
+        client = OllamaClient(max_connections=0)
+        assert client.max_connections == 1
+        client.close()
+
 
 class TestOllamaGenerate:
     """Tests for the generate() method."""
@@ -16,6 +16,7 @@ Tests for orchestration pipeline.
 """
 
 import json
+from collections.abc import Iterable
 from datetime import UTC, datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -25,6 +26,7 @@ import pytest
 
 from idea_generator.config import Config
 from idea_generator.models import IdeaCluster, NormalizedIssue, SummarizedIssue
+from idea_generator.output import read_json_array
 from idea_generator.pipelines.orchestrator import Orchestrator, OrchestratorError
 
 
@@ -138,8 +140,10 @@ class TestOrchestratorRun:
                 )
 
     @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    @patch("idea_generator.pipelines.orchestrator.OllamaClient")
     def test_handles_no_issues(
         self,
+        mock_ollama_client: Mock,
         mock_github_client: Mock,
         temp_config: Config,
     ) -> None:
@@ -369,6 +373,198 @@ class TestOrchestratorRun:
         assert "json_report" in results
 
 
+class TestOrchestratorIngest:
+    """Tests for orchestrator issue ingestion."""
+
+    @staticmethod
+    def _mock_client(numbers: list[int]) -> Mock:
+        mock_client = Mock()
+        mock_client.__enter__ = Mock(return_value=mock_client)
+        mock_client.__exit__ = Mock(return_value=False)
+        mock_client.check_repository_access = Mock(return_value=True)
+        mock_client.fetch_issues = Mock(
+            return_value=[
+                {
+                    "id": 100 + number,
+                    "number": number,
+                    "title": f"Feature request {number}",
+                    "body": "Please add this feature",
+                    "labels": [],
+                    "state": "open",
+                    "html_url": f"https://github.com/owner/repo/issues/{number}",
+                    "created_at": "2025-01-01T00:00:00Z",
+                    "updated_at": "2025-01-02T00:00:00Z",
+                }
+                for number in numbers
+            ]
+        )
+        return mock_client
+
+    @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    def test_prefetched_comments_stay_with_their_issue(
+        self, mock_github_client: Mock, temp_config: Config
+    ) -> None:
+        """Test concurrently fetched comments are attached to the right issue in order."""
+        import time
+
+        def fetch_comments(owner: str, repo: str, number: int) -> list[dict]:
+            # Finish the first issue last to exercise out-of-order completion
+            if number == 3:
+                time.sleep(0.05)
+            return [
+                {
+                    "id": number,
+                    "body": f"Comment on issue {number}",
+                    "user": {"login": "user"},
+                    "created_at": "2025-01-01T00:00:00Z",
+                }
+            ]
+
+        mock_client = self._mock_client([3, 2, 1])
+        mock_client.fetch_issue_comments = Mock(side_effect=fetch_comments)
+        mock_github_client.return_value = mock_client
+
+        issues = Orchestrator(temp_config)._ingest_issues("owner", "repo")
+
+        assert [issue.number for issue in issues] == [3, 2, 1]
+        assert [issue.comments[0].body for issue in issues] == [
+            "Comment on issue 3",
+            "Comment on issue 2",
+            "Comment on issue 1",
+        ]
+        assert mock_client.fetch_issue_comments.call_count == 3
+
+    @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    def test_comment_fetch_error_is_wrapped(
+        self, mock_github_client: Mock, temp_config: Config
+    ) -> None:
+        """Test a failing comment fetch surfaces as an OrchestratorError."""
+        from idea_generator.github_client import GitHubAPIError
+
+        mock_client = self._mock_client([2, 1])
+        mock_client.fetch_issue_comments = Mock(side_effect=GitHubAPIError("boom"))
+        mock_github_client.return_value = mock_client
+
+        with pytest.raises(OrchestratorError, match="Failed to ingest issues from GitHub"):
+            Orchestrator(temp_config)._ingest_issues("owner", "repo")
+
+    @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    @patch("idea_generator.pipelines.orchestrator.OllamaClient")
+    @patch("idea_generator.pipelines.orchestrator.SummarizationPipeline")
+    def test_run_summarizes_issues_while_ingesting(
+        self,
+        mock_summarization_pipeline: Mock,
+        mock_ollama_client: Mock,
+        mock_github_client: Mock,
+        temp_config: Config,
+    ) -> None:
+        """Test a fresh run hands each issue to summarization before ingest finishes."""
+        mock_github_client.return_value = self._mock_client([3, 2, 1])
+        mock_github_client.return_value.fetch_issue_comments = Mock(return_value=[])
+        mock_ollama_client.return_value = Mock(check_health=Mock(return_value=True))
+        issues_file = temp_config.data_dir / "owner_repo_issues.json"
+
+        issues_file_written: list[bool] = []
+
+        def summarize_issues(issues: Iterable[NormalizedIssue], **kwargs: object) -> list:
+            assert not isinstance(issues, list)
+            received = []
+            for issue in issues:
+                issues_file_written.append(issues_file.exists())
+                received.append(issue.number)
+            assert received == [3, 2, 1]
+            return []
+
+        mock_summarization_pipeline.return_value.summarize_issues = Mock(
+            side_effect=summarize_issues
+        )
+
+        results = Orchestrator(temp_config).run()
+
+        # Issues arrived while ingest was still running; its output is saved at the end
+        assert issues_file_written == [False, False, False]
+        assert results["issues_count"] == 3
+        assert results["summaries_count"] == 0
+        assert [issue.number for issue in read_json_array(issues_file, NormalizedIssue)] == [
+            3,
+            2,
+            1,
+        ]
+
+    @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    @patch("idea_generator.pipelines.orchestrator.OllamaClient")
+    def test_run_ingest_error_while_streaming_is_not_an_llm_error(
+        self,
+        mock_ollama_client: Mock,
+        mock_github_client: Mock,
+        temp_config: Config,
+    ) -> None:
+        """Test an ingest failure during the overlapped stages is reported as ingestion."""
+        from idea_generator.github_client import GitHubAPIError
+
+        mock_client = self._mock_client([2, 1])
+        mock_client.fetch_issue_comments = Mock(side_effect=GitHubAPIError("boom"))
+        mock_github_client.return_value = mock_client
+
+        with pytest.raises(OrchestratorError, match="Failed to ingest issues from GitHub"):
+            Orchestrator(temp_config).run()
+
+    @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    @patch("idea_generator.pipelines.orchestrator.OllamaClient")
+    def test_run_saves_issues_when_ollama_unreachable(
+        self,
+        mock_ollama_client: Mock,
+        mock_github_client: Mock,
+        temp_config: Config,
+    ) -> None:
+        """Test Ollama is checked before ingest and the ingest is still saved when it is down."""
+        mock_github_client.return_value = self._mock_client([2, 1])
+        mock_github_client.return_value.fetch_issue_comments = Mock(return_value=[])
+        mock_ollama_client.return_value = Mock(check_health=Mock(return_value=False))
+
+        with pytest.raises(OrchestratorError, match="Ollama server not reachable"):
+            Orchestrator(temp_config).run()
+
+        mock_ollama_client.return_value.close.assert_called_once()
+        issues_file = temp_config.data_dir / "owner_repo_issues.json"
+        assert [issue.number for issue in read_json_array(issues_file, NormalizedIssue)] == [2, 1]
+
+    @patch("idea_generator.pipelines.orchestrator.GitHubClient")
+    @patch("idea_generator.pipelines.orchestrator.OllamaClient")
+    @patch("idea_generator.pipelines.orchestrator.SummarizationPipeline")
+    def test_run_saves_issues_when_summarization_fails_midway(
+        self,
+        mock_summarization_pipeline: Mock,
+        mock_ollama_client: Mock,
+        mock_github_client: Mock,
+        temp_config: Config,
+    ) -> None:
+        """Test a summarization failure mid-stream still finishes and saves the ingest."""
+        from idea_generator.llm.client import OllamaError
+
+        mock_github_client.return_value = self._mock_client([3, 2, 1])
+        mock_github_client.return_value.fetch_issue_comments = Mock(return_value=[])
+        mock_ollama_client.return_value = Mock(check_health=Mock(return_value=True))
+
+        def summarize_issues(issues: Iterable[NormalizedIssue], **kwargs: object) -> list:
+            next(iter(issues))
+            raise OllamaError("model crashed")
+
+        mock_summarization_pipeline.return_value.summarize_issues = Mock(
+            side_effect=summarize_issues
+        )
+
+        with pytest.raises(OrchestratorError, match="LLM error"):
+            Orchestrator(temp_config).run()
+
+        issues_file = temp_config.data_dir / "owner_repo_issues.json"
+        assert [issue.number for issue in read_json_array(issues_file, NormalizedIssue)] == [
+            3,
+            2,
+            1,
+        ]
+
+
 class TestOrchestratorCaching:
     """Tests for orchestrator caching behavior."""
 
@@ -16,17 +16,23 @@ Tests for output generation.
 """
 
 import json
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
 
 import pytest
+from pydantic import ValidationError
 
 from idea_generator.models import IdeaCluster, NormalizedIssue
 from idea_generator.output import (
     _get_priority_tag,
     generate_json_report,
     generate_markdown_report,
+    iter_json_array,
+    read_json_array,
+    write_json_array,
 )
 
 
@@ -120,6 +126,149 @@ def sample_clusters() -> list[IdeaCluster]:
     ]
 
 
+class TestWriteJsonArray:
+    """Test suite for streaming JSON array writing."""
+
+    def test_round_trip(self, sample_issues: list[NormalizedIssue]) -> None:
+        """Test written issues load back as an equivalent JSON array."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            count = write_json_array(iter(sample_issues), output_path)
+
+            assert count == 3
+            with open(output_path, encoding="utf-8") as f:
+                data = json.load(f)
+            assert [NormalizedIssue(**item) for item in data] == sample_issues
+
+    def test_indented_items(self, sample_clusters: list[IdeaCluster]) -> None:
+        """Test indented output stays a valid array of the same clusters."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "clusters.json"
+            write_json_array(sample_clusters, output_path, indent=2)
+
+            content = output_path.read_text(encoding="utf-8")
+            assert '\n  "cluster_id": "cluster-1"' in content
+            assert [IdeaCluster(**item) for item in json.loads(content)] == sample_clusters
+
+    def test_empty_items(self) -> None:
+        """Test an empty iterable produces an empty JSON array."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "empty.json"
+            assert write_json_array([], output_path) == 0
+            with open(output_path, encoding="utf-8") as f:
+                assert json.load(f) == []
+
+    def test_interrupted_write_keeps_previous_file(
+        self, sample_issues: list[NormalizedIssue]
+    ) -> None:
+        """Test a write that fails midway leaves the previous file and no temp file."""
+
+        def failing_items() -> Iterator[NormalizedIssue]:
+            yield sample_issues[0]
+            raise KeyboardInterrupt
+
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            write_json_array(sample_issues, output_path)
+
+            with pytest.raises(KeyboardInterrupt):
+                write_json_array(failing_items(), output_path)
+
+            assert read_json_array(output_path, NormalizedIssue) == sample_issues
+            assert [p.name for p in Path(tmpdir).iterdir()] == ["issues.json"]
+
+
+class TestReadJsonArray:
+    """Test suite for single-pass JSON array loading."""
+
+    def test_round_trip(self, sample_issues: list[NormalizedIssue]) -> None:
+        """Test issues written by write_json_array load back unchanged."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            write_json_array(sample_issues, output_path)
+            assert read_json_array(output_path, NormalizedIssue) == sample_issues
+
+    def test_invalid_content_raises(self) -> None:
+        """Test malformed JSON and invalid items raise ValidationError."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            output_path.write_text("[{", encoding="utf-8")
+            with pytest.raises(ValidationError):
+                read_json_array(output_path, NormalizedIssue)
+
+            output_path.write_text('[{"id": 1}]', encoding="utf-8")
+            with pytest.raises(ValidationError):
+                read_json_array(output_path, NormalizedIssue)
+
+
+class TestIterJsonArray:
+    """Test suite for chunked, lazy JSON array loading."""
+
+    def test_round_trip_across_chunks(self, sample_issues: list[NormalizedIssue]) -> None:
+        """Test items split across many small chunks load back unchanged."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            write_json_array(sample_issues, output_path, indent=2)
+            loaded = list(iter_json_array(output_path, NormalizedIssue, chunk_size=7))
+            assert loaded == sample_issues
+
+    def test_empty_array(self) -> None:
+        """Test an empty array yields nothing."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            output_path.write_text(" [\n]\n", encoding="utf-8")
+            assert list(iter_json_array(output_path, NormalizedIssue, chunk_size=1)) == []
+
+    def test_yields_before_reading_whole_file(self, sample_issues: list[NormalizedIssue]) -> None:
+        """Test the first item is yielded before later items are parsed."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            write_json_array(sample_issues, output_path)
+            # Corrupt the tail: the first item must still come through
+            content = output_path.read_text(encoding="utf-8")
+            output_path.write_text(content[: content.rindex("}") + 1] + ",]", encoding="utf-8")
+
+            items = iter_json_array(output_path, NormalizedIssue, chunk_size=16)
+            assert next(items) == sample_issues[0]
+            with pytest.raises(json.JSONDecodeError):
+                list(items)
+
+    def test_large_item_is_not_redecoded_per_chunk(
+        self, sample_issues: list[NormalizedIssue]
+    ) -> None:
+        """Test an item spanning many chunks is decoded a logarithmic number of times."""
+        large_issue = sample_issues[0].model_copy(update={"body": "x" * 20_000})
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            write_json_array([large_issue], output_path)
+            decoder = Mock(wraps=json.JSONDecoder())
+            with patch("idea_generator.output._JSON_DECODER", decoder):
+                loaded = list(iter_json_array(output_path, NormalizedIssue, chunk_size=16))
+            assert loaded == [large_issue]
+            # Re-decoding after every 16-character chunk would take over a thousand tries
+            assert decoder.raw_decode.call_count < 20
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "[", "[,]", "[}", '{"id": 1}', "[] extra"],
+    )
+    def test_malformed_json_raises(self, content: str) -> None:
+        """Test malformed arrays raise JSONDecodeError."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            output_path.write_text(content, encoding="utf-8")
+            with pytest.raises(json.JSONDecodeError):
+                list(iter_json_array(output_path, NormalizedIssue, chunk_size=4))
+
+    def test_invalid_item_raises(self) -> None:
+        """Test items failing model validation raise ValidationError."""
+        with TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "issues.json"
+            output_path.write_text('[{"id": 1}]', encoding="utf-8")
+            with pytest.raises(ValidationError):
+                list(iter_json_array(output_path, NormalizedIssue))
+
+
 class TestGenerateJsonReport:
     """Tests for generate_json_report function."""
 
@@ -16,6 +16,8 @@ Tests for the summarization pipeline.
 """
 
 import json
+import time
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from importlib.resources import files
 from pathlib import Path
@@ -138,6 +140,15 @@ class TestSummarizationPipelineInit:
                 prompt_template_path=Path("/nonexistent/prompt.txt"),
             )
 
+    def test_pipeline_default_prompt_is_bundled(self, mock_llm_client: Mock) -> None:
+        """Test the packaged summarizer prompt is used, sharing one read per process."""
+        first = SummarizationPipeline(llm_client=mock_llm_client, model="llama3.2:latest")
+        second = SummarizationPipeline(llm_client=mock_llm_client, model="llama3.2:latest")
+
+        bundled = files("idea_generator.llm.prompts").joinpath("summarizer.txt")
+        assert first.system_prompt == bundled.read_text(encoding="utf-8")
+        assert second.system_prompt is first.system_prompt
+
     def test_pipeline_without_cache_dir(
         self, mock_llm_client: Mock, temp_prompt_file: Path
     ) -> None:
@@ -505,6 +516,65 @@ class TestSummarizeIssue:
             # LLM should not be called
             mock_llm_client.generate.assert_not_called()
 
+    @pytest.mark.parametrize(
+        "content",
+        ["{not json", "[]", json.dumps({"issue_id": 123456, "title": "Partial"})],
+    )
+    def test_load_from_cache_rejects_invalid_entries(
+        self,
+        mock_llm_client: Mock,
+        temp_prompt_file: Path,
+        sample_issue: NormalizedIssue,
+        content: str,
+    ) -> None:
+        """Test that corrupt, non-object and incomplete cache files are treated as misses."""
+        with TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir) / "cache"
+            cache_dir.mkdir()
+            (cache_dir / f"summary_{sample_issue.id}.json").write_text(content)
+
+            pipeline = SummarizationPipeline(
+                llm_client=mock_llm_client,
+                model="llama3.2:latest",
+                prompt_template_path=temp_prompt_file,
+                cache_dir=cache_dir,
+            )
+
+            assert pipeline._load_from_cache(sample_issue.id) is None
+
+    def test_saved_summary_is_indexed_for_reuse(
+        self,
+        mock_llm_client: Mock,
+        temp_prompt_file: Path,
+        sample_issue: NormalizedIssue,
+    ) -> None:
+        """Test that a summary saved after start-up is served from the cache index."""
+        with TemporaryDirectory() as tmpdir:
+            pipeline = SummarizationPipeline(
+                llm_client=mock_llm_client,
+                model="llama3.2:latest",
+                prompt_template_path=temp_prompt_file,
+                cache_dir=Path(tmpdir) / "cache",
+            )
+            assert pipeline._load_from_cache(sample_issue.id) is None
+
+            summary = SummarizedIssue(
+                issue_id=sample_issue.id,
+                source_number=sample_issue.number,
+                title="Saved title",
+                summary="Saved summary",
+                topic_area="test",
+                novelty=0.5,
+                feasibility=0.5,
+                desirability=0.5,
+                attention=0.5,
+                noise_flag=False,
+                raw_issue_url=sample_issue.url,
+            )
+            pipeline._save_to_cache(summary)
+
+            assert pipeline._load_from_cache(sample_issue.id) == summary
+
     def test_summarize_issue_skip_cache(
         self,
         mock_llm_client: Mock,
@@ -725,3 +795,100 @@ class TestSummarizeIssues:
         # Only first issue should succeed
         assert len(results) == 1
         assert results[0].issue_id == sample_issue.id
+
+    def test_summarize_issues_concurrently_keeps_input_order(
+        self,
+        mock_llm_client: Mock,
+        temp_prompt_file: Path,
+        sample_issue: NormalizedIssue,
+    ) -> None:
+        """Test that concurrent summarization returns summaries in input order."""
+        issues = [
+            sample_issue.model_copy(update={"id": 100 + n, "number": n, "title": f"Issue {n}"})
+            for n in range(1, 6)
+        ]
+
+        pipeline = SummarizationPipeline(
+            llm_client=mock_llm_client,
+            model="llama3.2:latest",
+            prompt_template_path=temp_prompt_file,
+        )
+
+        # Earlier issues finish last so completion order is the reverse of input order
+        def mock_generate(**kwargs: str) -> dict:
+            number = int(kwargs["prompt"].split("Title: Issue ", 1)[1].split("\n", 1)[0])
+            time.sleep(0.01 * (6 - number))
+            if number == 3:
+                raise OllamaError("Failed")
+            return {
+                "response": json.dumps(
+                    {
+                        "title": f"Summary {number}",
+                        "summary": "Test",
+                        "topic_area": "test",
+                        "novelty": 0.5,
+                        "feasibility": 0.5,
+                        "desirability": 0.5,
+                        "attention": 0.5,
+                        "noise_flag": False,
+                    }
+                ),
+                "done": True,
+            }
+
+        mock_llm_client.generate.side_effect = mock_generate
+        mock_llm_client.parse_json_response.side_effect = lambda r: json.loads(r["response"])
+
+        results = pipeline.summarize_issues(issues, concurrency=4)
+
+        assert [r.source_number for r in results] == [1, 2, 4, 5]
+        assert mock_llm_client.generate.call_count == 5
+
+    def test_summarize_issues_concurrently_bounds_in_flight_issues(
+        self,
+        mock_llm_client: Mock,
+        temp_prompt_file: Path,
+        sample_issue: NormalizedIssue,
+    ) -> None:
+        """Test that concurrent summarization pulls issues through a bounded window."""
+        pipeline = SummarizationPipeline(
+            llm_client=mock_llm_client,
+            model="llama3.2:latest",
+            prompt_template_path=temp_prompt_file,
+        )
+
+        completed: list[int] = []
+        lead: list[int] = []
+
+        def issue_stream() -> Iterator[NormalizedIssue]:
+            for n in range(1, 21):
+                lead.append(n - len(completed))
+                yield sample_issue.model_copy(update={"id": 100 + n, "number": n})
+
+        def mock_generate(**kwargs: str) -> dict:
+            time.sleep(0.005)
+            completed.append(1)
+            return {
+                "response": json.dumps(
+                    {
+                        "title": "Summary",
+                        "summary": "Test",
+                        "topic_area": "test",
+                        "novelty": 0.5,
+                        "feasibility": 0.5,
+                        "desirability": 0.5,
+                        "attention": 0.5,
+                        "noise_flag": False,
+                    }
+                ),
+                "done": True,
+            }
+
+        mock_llm_client.generate.side_effect = mock_generate
+        mock_llm_client.parse_json_response.side_effect = lambda r: json.loads(r["response"])
+
+        results = pipeline.summarize_issues(issue_stream(), concurrency=2)
+
+        assert [r.source_number for r in results] == list(range(1, 21))
+        # Never more than concurrency * 2 issues pulled ahead of finished summaries
+        assert max(lead) <= 4